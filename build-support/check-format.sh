@@ -19,6 +19,8 @@
 ##############################################################
 # This script will run the clang-format to check but without
 # updating cpp files.
+# Pass --since <rev> to only check the lines changed since
+# the merge-base of <rev> and HEAD.
 ##############################################################
 
 set -eo pipefail
@@ -29,9 +31,11 @@ ROOT=`cd "$ROOT"; pwd`
 export STARROCKS_HOME=`cd "${ROOT}/.."; pwd`
 
 CLANG_FORMAT=${CLANG_FORMAT_BINARY:=$(which clang-format)}
+# the files found clean are skipped by the next checks, set CLANG_FORMAT_CACHE= to check all files
+CLANG_FORMAT_CACHE=${CLANG_FORMAT_CACHE-${XDG_CACHE_HOME:-${HOME}/.cache}/starrocks/clang_format_cache.db}
 
 python3 ${STARROCKS_HOME}/build-support/run_clang_format.py --clang_format_binary="${CLANG_FORMAT}" \
 	--source_dirs="${STARROCKS_HOME}/be/src","${STARROCKS_HOME}/be/test" \
-        --exclude_globs="${STARROCKS_HOME}/build-support/excludes" --quiet
+        --exclude_globs="${STARROCKS_HOME}/build-support/excludes" --cache_file="${CLANG_FORMAT_CACHE}" --quiet "$@"
 
 
@@ -19,6 +19,8 @@
 ##############################################################
 # This script run the clang-format to check and fix
 # cplusplus source files.
+# Pass --since <rev> to only fix the lines changed since
+# the merge-base of <rev> and HEAD.
 ##############################################################
 
 set -eo pipefail
@@ -32,6 +34,6 @@ CLANG_FORMAT=${CLANG_FORMAT_BINARY:=$(which clang-format)}
 
 python3 ${STARROCKS_HOME}/build-support/run_clang_format.py --clang_format_binary="${CLANG_FORMAT}" --fix \
 	--source_dirs="${STARROCKS_HOME}/be/src","${STARROCKS_HOME}/be/test" \
-        --exclude_globs="${STARROCKS_HOME}/build-support/excludes"
+        --exclude_globs="${STARROCKS_HOME}/build-support/excludes" "$@"
 
 
@@ -15,14 +15,21 @@
 
 import argparse
 import hashlib
+import json
 import os
 import platform
 import re
+import shutil
+import socket
 import subprocess
+import sys
+import tempfile
+import time
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 OS_RELEASE_PATH = "/etc/os-release"
+PROBE_CACHE_NAME = ".build_env_probe.json"
 
 def get_version():
     version = os.getenv("STARROCKS_VERSION")
@@ -42,9 +49,17 @@ def get_build_type():
         build_type = "UNKNOWN"
     return build_type.upper()
 
-def get_current_time():
+def get_current_time(reproducible):
+    if reproducible:
+        # https://reproducible-builds.org/specs/source-date-epoch/
+        source_date_epoch = int(os.getenv("SOURCE_DATE_EPOCH"))
+        return datetime.fromtimestamp(source_date_epoch, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+def get_pinned_time(build_time, reproducible):
+    """ the build time is left out of the fingerprints unless it's pinned by SOURCE_DATE_EPOCH in reproducible mode """
+    return [build_time] if reproducible else []
+
 def get_user():
     user = os.getenv("USER")
     if not user:
@@ -84,14 +99,71 @@ def get_build_arch():
     return platform.uname().machine
 
 def get_java_version():
-    java_home = os.getenv("JAVA_HOME")
-    java_res = subprocess.Popen([java_home + "/bin/java", "-fullversion"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    java_res = subprocess.Popen([get_java_binary(), "-fullversion"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     out, err = java_res.communicate()
 
     if java_res.returncode == 0:
         return out.decode('utf-8').replace("\"", "\\\"").strip()
     return "unknown jdk"
 
+def get_java_binary():
+    java_home = os.getenv("JAVA_HOME")
+    return (java_home or "") + "/bin/java"
+
+def get_probe_key():
+    """ the key of the probe results, it changes when the java binary, the hostname or the distro changes """
+    java_binary = get_java_binary()
+    try:
+        stat = os.stat(java_binary)
+        java_key = [os.path.realpath(java_binary), stat.st_ino, stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        java_key = [java_binary, None]
+    os_release = None
+    if os.path.exists(OS_RELEASE_PATH):
+        with open(OS_RELEASE_PATH, 'rb') as fp_handle:
+            os_release = hashlib.md5(fp_handle.read()).hexdigest()
+    return [java_key, socket.gethostname(), os.path.exists('/.dockerenv'), os_release]
+
+def probe_build_env(need_hostname):
+    """ the results of the probes which fork a process or parse a file, the hostname is None if not needed """
+    return {"hostname": get_hostname() if need_hostname else None, "distro_info": get_build_distro_info(),
+            "java_version": get_java_version()}
+
+def load_build_env(cache_path, refresh, need_hostname=True):
+    """
+    returns the probe results, from the cache in cache_path if the probe key is unchanged, so a steady state build
+    spawns no process. refresh probes again and rewrites the cache. the hostname isn't probed unless need_hostname,
+    a cache without it is only used by the runs which don't need it.
+    """
+    start = time.time()
+    key = get_probe_key()
+    if not refresh and os.path.exists(cache_path):
+        try:
+            with open(cache_path) as fh:
+                cache = json.load(fh)
+            if cache.get("key") == key and (not need_hostname or cache["env"]["hostname"] is not None):
+                print('gen_build_version.py: build environment probes from cache in {:.1f} ms, saved {:.1f} ms'.format(
+                    (time.time() - start) * 1000, cache["probe_ms"]))
+                return cache["env"]
+        except (ValueError, KeyError, AttributeError, TypeError):
+            pass
+
+    env = probe_build_env(need_hostname)
+    probe_ms = (time.time() - start) * 1000
+    print('gen_build_version.py: probed the build environment in {:.1f} ms'.format(probe_ms))
+    try:
+        d = os.path.dirname(cache_path)
+        if not os.path.exists(d):
+            os.makedirs(d)
+        fd, tmp_path = tempfile.mkstemp(dir=d, prefix=".tmp_", suffix=PROBE_CACHE_NAME)
+        with os.fdopen(fd, 'w') as fh:
+            json.dump({"key": key, "probe_ms": probe_ms, "env": env}, fh)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # the cache is only an optimization
+        pass
+    return env
+
 def get_fingerprint(items):
     if not isinstance(items, list):
         items = [items]
@@ -109,7 +181,7 @@ def skip_write_if_fingerprint_unchanged(file_name, file_content, fingerprint):
     with open(file_name, 'w') as fh:
         fh.write(file_content)
 
-def generate_java_file(java_path, version, commit_hash, build_type, build_time, user, host, java_version, build_distro_id, build_arch):
+def generate_java_file(java_path, version, commit_hash, build_type, build_time, user, host, java_version, build_distro_id, build_arch, pinned_time=False):
     file_format = '''
 // Copyright 2021-present StarRocks, Inc. All rights reserved.
 //
@@ -143,7 +215,7 @@ public class Version {{
     public static final String STARROCKS_JAVA_COMPILE_VERSION = "{JAVA_VERSION}";
 }}
 '''
-    fingerprint = get_fingerprint([version, commit_hash, build_type, user, host, java_version, build_distro_id, build_arch])
+    fingerprint = get_fingerprint([version, commit_hash, build_type, user, host, java_version, build_distro_id, build_arch] + get_pinned_time(build_time, pinned_time))
     file_content = file_format.format(VERSION=version, COMMIT_HASH=commit_hash,
                                       BUILD_TYPE=build_type, BUILD_TIME=build_time,
                                       BUILD_USER=user, BUILD_HOST=host, BUILD_DISTRO_ID=build_distro_id, BUILD_ARCH=build_arch,
@@ -155,7 +227,7 @@ public class Version {{
         os.makedirs(d)
     skip_write_if_fingerprint_unchanged(file_name, file_content, fingerprint)
 
-def generate_cpp_file(cpp_path, version, commit_hash, build_type, build_time, user, host, build_distro_id, build_arch):
+def generate_cpp_file(cpp_path, version, commit_hash, build_type, build_time, user, host, build_distro_id, build_arch, pinned_time=False):
     file_format = '''
 // Copyright 2021-present StarRocks, Inc. All rights reserved.
 //
@@ -186,7 +258,7 @@ const char* STARROCKS_BUILD_ARCH = "{BUILD_ARCH}";
 }}
 
 '''
-    fingerprint = get_fingerprint([version, commit_hash, build_type, user, host, build_distro_id, build_arch])
+    fingerprint = get_fingerprint([version, commit_hash, build_type, user, host, build_distro_id, build_arch] + get_pinned_time(build_time, pinned_time))
     file_content = file_format.format(VERSION=version, COMMIT_HASH=commit_hash,
                                       BUILD_TYPE=build_type, BUILD_TIME=build_time,
                                       BUILD_USER=user, BUILD_HOST=host, BUILD_DISTRO_ID=build_distro_id, BUILD_ARCH=build_arch, FINGERPRINT=fingerprint)
@@ -197,28 +269,311 @@ const char* STARROCKS_BUILD_ARCH = "{BUILD_ARCH}";
         os.makedirs(d)
     skip_write_if_fingerprint_unchanged(file_name, file_content, fingerprint)
 
+STAMP_PROPERTIES_NAME = "build_stamp.properties"
+STAMP_CPP_NAME = "version_stamp.cpp"
+
+def escape_property(value):
+    """ escape a value of a java properties file, which is read as ISO-8859-1 """
+    value = value.replace('\\', '\\\\').replace('\n', '\\n').replace('\r', '\\r')
+    return "".join([c if ord(c) < 0x80 else '\\u%04x' % ord(c) for c in value])
+
+def write_if_changed(file_name, file_content):
+    d = os.path.dirname(file_name)
+    if not os.path.exists(d):
+        os.makedirs(d)
+    if os.path.exists(file_name):
+        with open(file_name) as fh:
+            if fh.read() == file_content:
+                return
+    with open(file_name, 'w') as fh:
+        fh.write(file_content)
+
+def remove_stamp_files(cpp_path, java_resources_path):
+    """
+    the stamp files of a previous --stamp or --cpp_stamp build, version_stamp.cpp would define the variables twice.
+    a side passed as None keeps its stamp file.
+    """
+    file_names = []
+    if cpp_path:
+        file_names.append(cpp_path + "/" + STAMP_CPP_NAME)
+    if java_resources_path:
+        file_names.append(java_resources_path + "/com/starrocks/common/" + STAMP_PROPERTIES_NAME)
+    for file_name in file_names:
+        if os.path.exists(file_name):
+            os.remove(file_name)
+
+def generate_java_stamp_files(java_path, java_resources_path, version, commit_hash, build_type, build_time, user, host, java_version, build_distro_id, build_arch):
+    """
+    Version.java only has the fields which are the same on every build of a source tree, the others are read
+    from build_stamp.properties at runtime. So Version.java and everything compiled against it stay identical
+    across builds and machines, only the stamp resource changes.
+    """
+    file_format = '''
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// This is a generated file, DO NOT EDIT IT.
+// FINGERPRINT: {FINGERPRINT}
+
+package com.starrocks.common;
+
+import java.io.IOException;
+import java.io.InputStream;
+import java.util.Properties;
+
+public class Version {{
+    public static final String STARROCKS_VERSION = "{VERSION}";
+    public static final String STARROCKS_BUILD_TYPE = "{BUILD_TYPE}";
+
+    // the fields which change from build to build are in the {STAMP} resource
+    private static final Properties STAMP = loadStamp();
+
+    public static final String STARROCKS_COMMIT_HASH = STAMP.getProperty("commit_hash", "UNKNOWN");
+    public static final String STARROCKS_BUILD_TIME = STAMP.getProperty("build_time", "UNKNOWN");
+    public static final String STARROCKS_BUILD_USER = STAMP.getProperty("build_user", "UNKNOWN");
+    public static final String STARROCKS_BUILD_HOST = STAMP.getProperty("build_host", "UNKNOWN");
+    public static final String STARROCKS_BUILD_DISTRO_ID = STAMP.getProperty("build_distro_id", "unknown");
+    public static final String STARROCKS_BUILD_ARCH = STAMP.getProperty("build_arch", "UNKNOWN");
+    public static final String STARROCKS_JAVA_COMPILE_VERSION = STAMP.getProperty("java_compile_version", "unknown jdk");
+
+    private static Properties loadStamp() {{
+        Properties properties = new Properties();
+        try (InputStream in = Version.class.getResourceAsStream("{STAMP}")) {{
+            if (in != null) {{
+                properties.load(in);
+            }}
+        }} catch (IOException e) {{
+            // the fields take the defaults
+        }}
+        return properties;
+    }}
+}}
+'''
+    fingerprint = get_fingerprint([version, build_type, "stamp"])
+    file_content = file_format.format(VERSION=version, BUILD_TYPE=build_type, STAMP=STAMP_PROPERTIES_NAME,
+                                      FINGERPRINT=fingerprint)
+
+    file_name = java_path + "/com/starrocks/common/Version.java"
+    d = os.path.dirname(file_name)
+    if not os.path.exists(d):
+        os.makedirs(d)
+    skip_write_if_fingerprint_unchanged(file_name, file_content, fingerprint)
+
+    stamp = [("commit_hash", commit_hash), ("build_time", build_time), ("build_user", user), ("build_host", host),
+             ("build_distro_id", build_distro_id), ("build_arch", build_arch),
+             # java_version is escaped as a java string literal
+             ("java_compile_version", java_version.replace('\\"', '"'))]
+    stamp_content = "# This is a generated file, DO NOT EDIT IT.\n" + \
+        "".join(["%s=%s\n" % (key, escape_property(value)) for key, value in stamp])
+    write_if_changed(java_resources_path + "/com/starrocks/common/" + STAMP_PROPERTIES_NAME, stamp_content)
+
+def generate_cpp_stamp_files(cpp_path, version, commit_hash, build_type, build_time, user, host, build_distro_id, build_arch):
+    """
+    version.cpp only defines STARROCKS_VERSION, the variables which change from build to build are defined by
+    version_stamp.cpp. It's the only translation unit recompiled when they change and it doesn't change the
+    object of version.cpp, so the compiler cache still hits.
+    """
+    file_format = '''
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// NOTE: This is a generated file, DO NOT EDIT IT
+// FINGERPRINT: {FINGERPRINT}
+
+namespace starrocks {{
+
+const char* STARROCKS_VERSION = "{VERSION}";
+// the other variables are defined in {STAMP}
+}}
+
+'''
+    fingerprint = get_fingerprint([version, "stamp"])
+    file_content = file_format.format(VERSION=version, STAMP=STAMP_CPP_NAME, FINGERPRINT=fingerprint)
+
+    file_name = cpp_path + "/version.cpp"
+    d = os.path.dirname(file_name)
+    if not os.path.exists(d):
+        os.makedirs(d)
+    skip_write_if_fingerprint_unchanged(file_name, file_content, fingerprint)
+
+    stamp_format = '''
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// NOTE: This is a generated file, DO NOT EDIT IT
+
+namespace starrocks {{
+
+const char* STARROCKS_COMMIT_HASH = "{COMMIT_HASH}";
+const char* STARROCKS_BUILD_TIME = "{BUILD_TIME}";
+const char* STARROCKS_BUILD_USER = "{BUILD_USER}";
+const char* STARROCKS_BUILD_HOST = "{BUILD_HOST}";
+const char* STARROCKS_BUILD_DISTRO_ID = "{BUILD_DISTRO_ID}";
+const char* STARROCKS_BUILD_ARCH = "{BUILD_ARCH}";
+}}
+
+'''
+    stamp_content = stamp_format.format(COMMIT_HASH=commit_hash, BUILD_TIME=build_time, BUILD_USER=user,
+                                        BUILD_HOST=host, BUILD_DISTRO_ID=build_distro_id, BUILD_ARCH=build_arch)
+    write_if_changed(cpp_path + "/" + STAMP_CPP_NAME, stamp_content)
+
+def get_build_info(args):
+    # the host which runs a reproducible build doesn't show up in the generated files
+    build_env = load_build_env(args.probe_cache_path or os.path.join(args.cpp_path, PROBE_CACHE_NAME), args.refresh,
+                               not args.reproducible)
+    distro_info = build_env["distro_info"]
+    info = dict()
+    info["version"] = get_version()
+    info["commit_hash"] = get_commit_hash()
+    info["build_type"] = get_build_type()
+    info["build_time"] = get_current_time(args.reproducible)
+    info["reproducible"] = args.reproducible
+    info["build_distro_id"] = distro_info.get("ID", "unknown")
+    info["build_arch"] = get_build_arch()
+    info["java_version"] = build_env["java_version"]
+    if args.reproducible:
+        # the builder identity is explicit instead of the user and host which run the build
+        info["user"] = os.getenv("STARROCKS_BUILD_USER") or "StarRocks"
+        info["hostname"] = os.getenv("STARROCKS_BUILD_HOST") or "reproducible"
+    else:
+        info["user"] = get_user()
+        # append build distro pretty name into hostname
+        info["hostname"] = '%s (%s)' % (build_env["hostname"], distro_info.get("PRETTY_NAME", info["build_distro_id"]))
+    return info
+
+def generate_files(cpp_path, java_path, java_resources_path, stamp, cpp_stamp, info):
+    version, commit_hash, build_type, build_time = info["version"], info["commit_hash"], info["build_type"], info["build_time"]
+    user, hostname, java_version = info["user"], info["hostname"], info["java_version"]
+    build_distro_id, build_arch = info["build_distro_id"], info["build_arch"]
+    if cpp_stamp:
+        generate_cpp_stamp_files(cpp_path, version, commit_hash, build_type, build_time, user, hostname, build_distro_id, build_arch)
+    else:
+        remove_stamp_files(cpp_path, None)
+        generate_cpp_file(cpp_path, version, commit_hash, build_type, build_time, user, hostname, build_distro_id, build_arch,
+                          info["reproducible"])
+    if stamp:
+        generate_java_stamp_files(java_path, java_resources_path, version, commit_hash, build_type, build_time, user, hostname, java_version, build_distro_id, build_arch)
+    else:
+        remove_stamp_files(None, java_resources_path)
+        generate_java_file(java_path, version, commit_hash, build_type, build_time, user, hostname, java_version, build_distro_id, build_arch,
+                           info["reproducible"])
+
+def get_files_hashes(path):
+    """ the sha256 of every file under path by its relative path """
+    hashes = dict()
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            file_name = os.path.join(root, name)
+            with open(file_name, 'rb') as fh:
+                hashes[os.path.relpath(file_name, path)] = hashlib.sha256(fh.read()).hexdigest()
+    return hashes
+
+def get_perturbed_env():
+    """ the environment of the second generation, everything a generation mustn't depend on is changed """
+    env = dict(os.environ)
+    env["TZ"] = "Etc/GMT+12" if env.get("TZ") == "Etc/GMT-14" else "Etc/GMT-14"
+    env["HOSTNAME"] = "gen-build-version-check"
+    env["USER"] = "gen_build_version_check"
+    env["LC_ALL"] = "C"
+    return env
+
+def check_reproducible(args, info):
+    """
+    generate the files in this process, then again in another process which probes the build environment again
+    with a different time zone, working directory, user and host name, they must be byte-identical
+    """
+    tmp_path = tempfile.mkdtemp(prefix="gen_build_version_")
+    try:
+        first, second = tmp_path + "/first", tmp_path + "/second"
+        generate_files(first + "/cpp", first + "/java", first + "/resources", args.stamp, args.cpp_stamp, info)
+        cmd = [sys.executable, os.path.abspath(__file__), "--cpp", second + "/cpp", "--java", second + "/java",
+               "--java_resources", second + "/resources", "--probe_cache", tmp_path + "/" + PROBE_CACHE_NAME,
+               "--refresh", "--reproducible", "--no_check"]
+        cmd += (["--stamp"] if args.stamp else []) + (["--cpp_stamp"] if args.cpp_stamp else [])
+        os.makedirs(tmp_path + "/cwd")
+        res = subprocess.run(cmd, cwd=tmp_path + "/cwd", env=get_perturbed_env(),
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if res.returncode != 0:
+            sys.stdout.write(res.stdout.decode('utf-8', 'replace'))
+            print('gen_build_version.py: the second generation of the reproducibility check failed')
+            sys.exit(1)
+        hashes = [get_files_hashes(first), get_files_hashes(second)]
+    finally:
+        shutil.rmtree(tmp_path)
+    if hashes[0] != hashes[1]:
+        changed = [name for name in sorted(set(hashes[0]) | set(hashes[1])) if hashes[0].get(name) != hashes[1].get(name)]
+        print('gen_build_version.py: the generated files are not reproducible, changed files: {}'.format(", ".join(changed)))
+        sys.exit(1)
+    sha256 = hashlib.sha256("".join(["%s %s\n" % item for item in sorted(hashes[0].items())]).encode()).hexdigest()
+    print('gen_build_version.py: reproducible, sha256 of the generated files = {}'.format(sha256))
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--cpp", dest='cpp_path', default="./version.cpp", help="Path of generated cpp file", type=str)
     parser.add_argument("--java", dest='java_path', default="./Version.java", help="Path of generated java file", type=str)
+    parser.add_argument("--probe_cache", dest='probe_cache_path', default=None, type=str,
+                        help="Path of the cache of the build environment probes, in the cpp directory by default")
+    parser.add_argument("--refresh", dest='refresh', action="store_true",
+                        help="Probe the build environment again instead of using the cache")
+    parser.add_argument("--java_resources", dest='java_resources_path', default=None, type=str,
+                        help="Path of generated java resources, the build stamp is written there")
+    parser.add_argument("--stamp", dest='stamp', action="store_true",
+                        help="Write the fields which change from build to build to " + STAMP_PROPERTIES_NAME +
+                             ", so Version.java stays identical across builds")
+    parser.add_argument("--cpp_stamp", dest='cpp_stamp', action="store_true",
+                        help="Write the fields which change from build to build to " + STAMP_CPP_NAME +
+                             ", so version.cpp stays identical across builds. Only for a BE build which compiles " +
+                             STAMP_CPP_NAME + " next to version.cpp, the others don't link")
+    parser.add_argument("--reproducible", dest='reproducible', action="store_true",
+                        help="Take the build time from SOURCE_DATE_EPOCH and the builder identity from "
+                             "STARROCKS_BUILD_USER and STARROCKS_BUILD_HOST, and check that two generations are identical")
+    # the second generation of the reproducibility check
+    parser.add_argument("--no_check", dest='no_check', action="store_true", help=argparse.SUPPRESS)
     args = parser.parse_args()
+    if args.stamp and not args.java_resources_path:
+        parser.error("--stamp needs --java_resources")
+
+    if args.reproducible and not os.getenv("SOURCE_DATE_EPOCH", "").isdigit():
+        parser.error("--reproducible needs SOURCE_DATE_EPOCH set to the seconds since the epoch, "
+                     "e.g. SOURCE_DATE_EPOCH=$(git log -1 --format=%ct)")
 
-    version = get_version()
-    commit_hash = get_commit_hash()
-    build_type = get_build_type()
-    build_time = get_current_time()
-    distro_info = get_build_distro_info()
-    build_distro_id = distro_info.get("ID", "unknown")
-    build_pretty_name = distro_info.get("PRETTY_NAME", build_distro_id)
-    build_arch = get_build_arch()
-    user = get_user()
-    # append build distro pretty name into hostname
-    hostname = '%s (%s)' % (get_hostname(), build_pretty_name)
-
-    java_version = get_java_version()
-
-    generate_cpp_file(args.cpp_path, version, commit_hash, build_type, build_time, user, hostname, build_distro_id, build_arch)
-    generate_java_file(args.java_path, version, commit_hash, build_type, build_time, user, hostname, java_version, build_distro_id, build_arch)
+    info = get_build_info(args)
+    if args.reproducible and not args.no_check:
+        check_reproducible(args, info)
+    generate_files(args.cpp_path, args.java_path, args.java_resources_path, args.stamp, args.cpp_stamp, info)
 
 if __name__ == '__main__':
     main()
@@ -19,8 +19,10 @@
 
 import multiprocessing as mp
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from fnmatch import fnmatch
-from subprocess import Popen
+from subprocess import Popen, check_output
 
 
 def chunk(seq, n):
@@ -48,23 +50,62 @@ def dechunk(chunks):
     return seq
 
 
-def run_parallel(cmds, **kwargs):
+def run_parallel_as_completed(cmds, costs=None, jobs=None, **kwargs):
+    """
+    Run each of cmds (with shared **kwargs) using subprocess.Popen,
+    keeping `jobs` processes in flight (multiprocessing.cpu_count() * 2 by default,
+    the batch size run_parallel always used)
+    and starting the next command as soon as any finishes.
+    If costs are given, the commands with the highest cost start first,
+    so a slow command doesn't run alone at the end.
+    yields a tuple of the index of the command in cmds and its
+    returncode, stdout, stderr as each process completes
+    """
+    order = list(range(len(cmds)))
+    if costs is not None:
+        order.sort(key=lambda i: -costs[i])
+
+    def run(i):
+        proc = Popen(cmds[i], **kwargs)
+        # a thread per process drains its pipes, so a process with a
+        # lot of output never blocks the others
+        stdout, stderr = proc.communicate()
+        return i, (proc.returncode, stdout, stderr)
+
+    executor = ThreadPoolExecutor(max_workers=jobs or mp.cpu_count() * 2)
+    # the executor starts the commands in the order they are submitted
+    futures = [executor.submit(run, i) for i in order]
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # the caller stopped early, don't start the remaining commands
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def run_parallel(cmds, costs=None, jobs=None, **kwargs):
     """
     Run each of cmds (with shared **kwargs) using subprocess.Popen
-    then wait for all of them to complete.
-    Runs batches of multiprocessing.cpu_count() * 2 from cmds
+    then wait for all of them to complete, see run_parallel_as_completed.
     returns a list of tuples containing each process'
-    returncode, stdout, stderr
+    returncode, stdout, stderr in the order of cmds
     """
-    complete = []
-    for cmds_batch in chunk(cmds, mp.cpu_count() * 2):
-        procs_batch = [Popen(cmd, **kwargs) for cmd in cmds_batch]
-        for proc in procs_batch:
-            stdout, stderr = proc.communicate()
-            complete.append((proc.returncode, stdout, stderr))
+    complete = [None] * len(cmds)
+    for i, result in run_parallel_as_completed(cmds, costs, jobs, **kwargs):
+        complete[i] = result
     return complete
 
 
+def get_file_size(path):
+    "the cost estimate of running a tool on a file"
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
 _source_extensions = '''
 .h
 .cc
@@ -75,23 +116,72 @@ _source_extensions = '''
 '''.split()
 
 
+def is_source(path, exclude_globs=[]):
+    # filter out non-source files
+    if os.path.splitext(path)[1] not in _source_extensions:
+        return False
+
+    # filter out files that match the globs in the globs file
+    return not any([fnmatch(os.path.abspath(path), glob) for glob in exclude_globs])
+
+
 def get_sources(source_dir, exclude_globs=[]):
     sources = []
     for directory, subdirs, basenames in os.walk(source_dir):
         for path in [os.path.join(directory, basename)
                      for basename in basenames]:
-            # filter out non-source files
-            if os.path.splitext(path)[1] not in _source_extensions:
-                continue
+            if is_source(path, exclude_globs):
+                sources.append(os.path.abspath(path))
+    return sources
 
-            path = os.path.abspath(path)
 
-            # filter out files that match the globs in the globs file
-            if any([fnmatch(path, glob) for glob in exclude_globs]):
-               continue
+_hunk_pattern = re.compile(br'^@@ -\S+ \+(\d+)(?:,(\d+))? @@')
 
-            sources.append(path)
-    return sources
+
+def get_changed_lines(source_dir, since, exclude_globs=[]):
+    """
+    find the sources under source_dir which changed since the merge-base
+    of the `since` revision and HEAD, the uncommitted and untracked changes
+    included. returns a dict of the absolute path of each changed source to
+    the list of (first, last) ranges of its added or changed lines, 1-based,
+    the list of an untracked source is empty as the whole file is new
+    """
+    source_dir = os.path.abspath(source_dir)
+    top = check_output(["git", "rev-parse", "--show-toplevel"],
+                       cwd=source_dir).decode('utf-8').strip()
+    base = check_output(["git", "merge-base", since, "HEAD"],
+                        cwd=source_dir).decode('utf-8').strip()
+    # the paths are only read from -z output, which is never quoted, and
+    # passed back to git as literal pathspecs
+    git = ["git", "--literal-pathspecs"]
+    diff = git + ["diff", "--no-color", "--no-ext-diff", "--diff-filter=ACMR", base]
+    status = check_output(diff + ["--name-status", "-z", "--", source_dir],
+                          cwd=top).split(b'\0')
+    changed = {}
+    i = 0
+    while i + 1 < len(status):
+        # a rename or a copy is followed by the old and the new path
+        n = 2 if status[i][:1] in (b'R', b'C') else 1
+        names = [os.fsdecode(name) for name in status[i + 1:i + 1 + n]]
+        i += 1 + n
+        path = os.path.join(top, names[-1])
+        if not is_source(path, exclude_globs):
+            continue
+        for line in check_output(diff + ["-U0", "--"] + names, cwd=top).splitlines():
+            m = _hunk_pattern.match(line)
+            if m:
+                first = int(m.group(1))
+                count = int(m.group(2)) if m.group(2) is not None else 1
+                # a hunk which only deletes lines has no lines to format
+                if count > 0:
+                    changed.setdefault(path, []).append((first, first + count - 1))
+    untracked = check_output(git + ["ls-files", "--others", "--exclude-standard",
+                                    "-z", "--", source_dir], cwd=top)
+    for name in untracked.split(b'\0'):
+        path = os.path.join(top, os.fsdecode(name))
+        if name and is_source(path, exclude_globs):
+            changed[path] = []
+    return changed
 
 
 def stdout_pathcolonline(completed_process, filenames):
@@ -20,16 +20,131 @@
 
 from __future__ import print_function
 import lintutils
-from subprocess import PIPE
+from subprocess import PIPE, CalledProcessError, check_output
 import argparse
 import difflib
+import hashlib
 import multiprocessing as mp
+import os
+import sqlite3
 import sys
+import time
 from functools import partial
 
 
+class _CleanCache(object):
+    """
+    A persistent set of the file contents clang-format found clean, keyed by
+    the hash of the content and the style the file is formatted with: the
+    clang-format version and the nearest .clang-format. The cache is a sqlite
+    database, so concurrent runs can share it, and the entries unused for
+    `max_age_days`, of another clang-format version or of a removed file are
+    pruned.
+    """
+
+    def __init__(self, path, clang_format_binary, max_age_days=30):
+        self.version = hashlib.sha256(
+            check_output([clang_format_binary, "--version"])).hexdigest()
+        self.max_age = max_age_days * 24 * 3600
+        self.styles = {}
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        with self.db:
+            # the entries of the former clean table have no path to prune them by
+            self.db.execute("DROP TABLE IF EXISTS clean")
+            self.db.execute("CREATE TABLE IF NOT EXISTS clean_files (key TEXT NOT NULL, "
+                            "path TEXT NOT NULL, version TEXT NOT NULL, "
+                            "last_used INTEGER NOT NULL, PRIMARY KEY (key, path))")
+            self.db.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, "
+                            "value REAL NOT NULL)")
+
+    def _get_style(self, filename):
+        "the hash of the .clang-format which applies to filename"
+        directory = os.path.dirname(os.path.abspath(filename))
+        if directory not in self.styles:
+            style_file = os.path.join(directory, ".clang-format")
+            parent = os.path.dirname(directory)
+            if os.path.exists(style_file):
+                with open(style_file, "rb") as reader:
+                    self.styles[directory] = hashlib.sha256(reader.read()).hexdigest()
+            elif parent != directory:
+                self.styles[directory] = self._get_style(directory)
+            else:
+                self.styles[directory] = ""
+        return self.styles[directory]
+
+    def get_key(self, filename, digest):
+        "the key of filename with the content of the given sha256 digest"
+        sha256 = hashlib.sha256()
+        sha256.update(self.version.encode())
+        sha256.update(self._get_style(filename).encode())
+        sha256.update(digest.encode())
+        return sha256.hexdigest()
+
+    def filter_clean(self, filenames):
+        """
+        returns the files which aren't known to be clean, the clean ones are
+        marked as used
+        """
+        keys = {}
+        for filename in filenames:
+            with open(filename, "rb") as reader:
+                keys[filename] = self.get_key(filename, _digest(reader.read()))
+        clean = set()
+        values = list(keys.values())
+        for i in range(0, len(values), 500):
+            batch = values[i:i + 500]
+            clean.update(row[0] for row in self.db.execute(
+                "SELECT key FROM clean_files WHERE key IN (%s)" % ",".join("?" * len(batch)), batch))
+        with self.db:
+            self.db.executemany("UPDATE clean_files SET last_used = ? WHERE key = ?",
+                                [(int(time.time()), key) for key in clean])
+        unknown = [filename for filename in filenames if keys[filename] not in clean]
+        self.hits += len(filenames) - len(unknown)
+        self.misses += len(unknown)
+        return unknown
+
+    def add_clean(self, clean, seconds_per_file):
+        "clean is a list of the tuples of a filename and the key of its content"
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO clean_files VALUES (?, ?, ?, ?)",
+                                [(key, os.path.abspath(filename), self.version, int(time.time()))
+                                 for filename, key in clean])
+            if seconds_per_file is not None:
+                self.db.execute("INSERT OR REPLACE INTO stats VALUES ('seconds_per_file', ?)",
+                                (seconds_per_file,))
+
+    def get_seconds_per_file(self):
+        row = self.db.execute("SELECT value FROM stats WHERE name = 'seconds_per_file'").fetchone()
+        return row[0] if row else 0.0
+
+    def prune(self):
+        removed = [(row[0],) for row in self.db.execute("SELECT DISTINCT path FROM clean_files")
+                   if not os.path.exists(row[0])]
+        with self.db:
+            pruned = self.db.execute("DELETE FROM clean_files WHERE version != ? OR last_used < ?",
+                                     (self.version, int(time.time()) - self.max_age)).rowcount
+            if removed:
+                pruned += self.db.executemany("DELETE FROM clean_files WHERE path = ?",
+                                              removed).rowcount
+            return pruned
+
+    def close(self):
+        self.db.close()
+
+
+def _digest(content):
+    return hashlib.sha256(content).hexdigest()
+
+
 # examine the output of clang-format and if changes are
-# present assemble a (unified)patch of the difference
+# present assemble a (unified)patch of the difference, the digest of
+# the content compared is returned, it's the content found clean
 def _check_one_file(filename, formatted):
     with open(filename, "rb") as reader:
         original = reader.read()
@@ -45,12 +160,34 @@ def _check_one_file(filename, formatted):
     else:
         diff = None
 
-    return filename, diff
+    return filename, diff, _digest(original)
+
+def _get_changed_lines(arguments, source_dir, exclude_globs):
+    try:
+        return lintutils.get_changed_lines(source_dir, arguments.since,
+                                           exclude_globs)
+    except CalledProcessError as e:
+        print("Failed to get the changes of {} since {}".format(
+            source_dir, arguments.since), file=sys.stderr)
+        sys.exit(e.returncode)
 
-def _check_dir(arguments, source_dir, exclude_globs):
-    formatted_filenames = []
-    for path in lintutils.get_sources(source_dir, exclude_globs):
-            formatted_filenames.append(str(path))
+
+def _check_dir(arguments, source_dir, exclude_globs, cache=None):
+    if arguments.since:
+        changed_lines = _get_changed_lines(arguments, source_dir, exclude_globs)
+        formatted_filenames = sorted(changed_lines)
+    else:
+        changed_lines = None
+        formatted_filenames = []
+        for path in lintutils.get_sources(source_dir, exclude_globs):
+                formatted_filenames.append(str(path))
+
+    def lines_of(filename):
+        "only format the changed lines of filename with --since, all of a new file"
+        if changed_lines is None:
+            return []
+        return ["--lines={}:{}".format(first, last)
+                for first, last in changed_lines[filename]]
 
     if arguments.fix:
         if not arguments.quiet:
@@ -58,39 +195,55 @@ def _check_dir(arguments, source_dir, exclude_globs):
                                 formatted_filenames)))
 
         # Break clang-format invocations into chunks: each invocation formats
-        # 16 files. Wait for all processes to complete
-        results = lintutils.run_parallel([
-            [arguments.clang_format_binary, "-style=file", "-i"] + some
-            for some in lintutils.chunk(formatted_filenames, 16)
-        ])
-        for returncode, stdout, stderr in results:
+        # 16 files. --lines applies to a single file, so with --since each
+        # invocation formats one. The largest chunks start first
+        chunks = lintutils.chunk(formatted_filenames,
+                                 1 if changed_lines is not None else 16)
+        results = lintutils.run_parallel_as_completed([
+            [arguments.clang_format_binary, "-style=file", "-i"] +
+            lines_of(some[0]) + some
+            for some in chunks
+        ], costs=[sum(map(lintutils.get_file_size, some)) for some in chunks])
+        for _, (returncode, stdout, stderr) in results:
             # if any clang-format reported a parse error, bubble it
             if returncode != 0:
                 sys.exit(returncode)
 
     else:
+        if cache is not None:
+            formatted_filenames = cache.filter_clean(formatted_filenames)
+        start = time.time()
+
         # run an instance of clang-format for each source file in parallel,
-        # then wait for all processes to complete
-        results = lintutils.run_parallel([
-            [arguments.clang_format_binary, "-style=file", filename]
+        # the largest files first, and collect the output as each completes
+        results = lintutils.run_parallel_as_completed([
+            [arguments.clang_format_binary, "-style=file"] +
+            lines_of(filename) + [filename]
             for filename in formatted_filenames
-        ], stdout=PIPE, stderr=PIPE)
+        ], costs=[lintutils.get_file_size(filename) for filename in formatted_filenames],
+            stdout=PIPE, stderr=PIPE)
 
-        checker_args = []
-        for filename, res in zip(formatted_filenames, results):
+        outputs = [None] * len(formatted_filenames)
+        for i, (returncode, stdout, stderr) in results:
             # if any clang-format reported a parse error, bubble it
-            returncode, stdout, stderr = res
             if returncode != 0:
                 sys.exit(returncode)
-            checker_args.append((filename, stdout))
+            outputs[i] = stdout
+        # report in the order of the files
+        checker_args = list(zip(formatted_filenames, outputs))
 
         error = False
+        clean = []
         pool = mp.Pool()
         try:
             # check the output from each invocation of clang-format in parallel
-            for filename, diff in pool.starmap(_check_one_file, checker_args):
+            for filename, diff, digest in pool.starmap(_check_one_file, checker_args):
                 if not arguments.quiet:
                     print("Checking {}".format(filename))
+                if not diff and cache is not None:
+                    # the content clang-format's output was compared to, an
+                    # edit after clang-format read the file isn't marked clean
+                    clean.append((filename, cache.get_key(filename, digest)))
                 if diff:
                     print("{} had clang-format style issues".format(filename))
                     # Print out the diff to stderr
@@ -104,6 +257,10 @@ def _check_dir(arguments, source_dir, exclude_globs):
         finally:
             pool.terminate()
             pool.join()
+        if cache is not None:
+            elapsed = time.time() - start
+            cache.add_clean(clean,
+                            elapsed / len(formatted_filenames) if formatted_filenames else None)
         if error:
             sys.exit(1)
 
@@ -129,6 +286,14 @@ if __name__ == "__main__":
                         help="If specified, will re-format the source "
                         "code instead of comparing the re-formatted "
                         "output, defaults to %(default)s")
+    parser.add_argument("--since",
+                        help="Only check or fix the lines changed since the "
+                        "merge-base of this git revision and HEAD, "
+                        "the uncommitted changes included")
+    parser.add_argument("--cache_file",
+                        help="Path of the cache of the files clang-format "
+                        "found clean, which are skipped by the next checks. "
+                        "The checks aren't cached if not set")
     parser.add_argument("--quiet", default=False,
                         action="store_true",
                         help="If specified, only print errors")
@@ -139,6 +304,19 @@ if __name__ == "__main__":
         with open(arguments.exclude_globs) as f:
             exclude_globs.extend(line.strip() for line in f)
 
-    for source_dir in arguments.source_dirs.split(','):
-        if len(source_dir) > 0:
-            _check_dir(arguments, source_dir, exclude_globs)
+    cache = None
+    # the cache holds whole files, not the changed lines of --since
+    if arguments.cache_file and not arguments.fix and not arguments.since:
+        cache = _CleanCache(arguments.cache_file, arguments.clang_format_binary)
+    try:
+        for source_dir in arguments.source_dirs.split(','):
+            if len(source_dir) > 0:
+                _check_dir(arguments, source_dir, exclude_globs, cache)
+    finally:
+        if cache is not None:
+            pruned = cache.prune()
+            if not arguments.quiet:
+                print("run_clang_format.py cache: {} hits, {} misses, {} pruned, "
+                      "{:.1f}s saved".format(cache.hits, cache.misses, pruned,
+                                             cache.hits * cache.get_seconds_per_file()))
+            cache.close()
@@ -20,10 +20,14 @@ java {
                 srcDir("build/generated-sources/thrift")
                 srcDir("build/generated-sources/genscript")
             }
+            resources {
+                srcDir("build/generated-resources/genscript")
+            }
         }
         test {
             java {
                 srcDir("src/test/java")
+                srcDir("build/generated-test-sources/genscript")
             }
             resources {
                 srcDir("src/test/resources")
@@ -392,11 +396,17 @@ tasks.register<Task>("generateByScripts") {
     group = "build"
 
     val outputDir = layout.buildDirectory.get().dir("generated-sources/genscript").asFile
+    val resourcesOutputDir = layout.buildDirectory.get().dir("generated-resources/genscript").asFile
+    val testOutputDir = layout.buildDirectory.get().dir("generated-test-sources/genscript").asFile
 
     outputs.dir(outputDir)
+    outputs.dir(resourcesOutputDir)
+    outputs.dir(testOutputDir)
 
     doFirst {
         mkdir(outputDir)
+        mkdir(resourcesOutputDir)
+        mkdir(testOutputDir)
 
         // First Python script - build version generation
         project.exec {
@@ -412,7 +422,9 @@ tasks.register<Task>("generateByScripts") {
             commandLine("python3",
                 "${project.rootProject.projectDir}/../gensrc/script/gen_functions.py",
                 "--cpp", outputDir.toString(),
-                "--java", outputDir.toString()
+                "--java", outputDir.toString(),
+                "--java_resources", resourcesOutputDir.toString(),
+                "--java_benchmark", testOutputDir.toString()
             )
         }
     }
@@ -428,6 +440,10 @@ tasks.named<PrecompileTask>("jprotobuf_precompile") {
     generateProtoFile="true"
 }
 
+tasks.processResources {
+    dependsOn("generateByScripts")
+}
+
 tasks.named<ProcessResources>("processTestResources") {
     duplicatesStrategy = DuplicatesStrategy.EXCLUDE
 }
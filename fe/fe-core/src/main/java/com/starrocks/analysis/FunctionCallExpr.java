@@ -77,10 +77,6 @@ public class FunctionCallExpr extends Expr {
     // The slot SlotDescriptor nullable info will lost or change
     private boolean mergeAggFnHasNullableChild = true;
 
-    // TODO(yan): add more known functions which are monotonic.
-    private static final ImmutableSet<String> MONOTONIC_FUNCTION_SET =
-            new ImmutableSet.Builder<String>().add(FunctionSet.YEAR).build();
-
     public boolean isAnalyticFnCall() {
         return isAnalyticFnCall;
     }
@@ -360,6 +356,10 @@ public class FunctionCallExpr extends Expr {
             return false;
         }
         // check children nullable
+        if (fn != null && fn.getNullHandling() == Function.NullHandling.STRICT) {
+            // decimal operation may overflow
+            return children.stream().anyMatch(e -> e.isNullable() || e.getType().isDecimalOfAnyVersion());
+        }
         if (nullableSameWithChildrenFunctions.contains(fnName.getFunction())) {
             return children.stream().anyMatch(e -> e.isNullable() || e.getType().isDecimalV3());
         }
@@ -469,11 +469,18 @@ public class FunctionCallExpr extends Expr {
 
     @Override
     public boolean isSelfMonotonic() {
-        FunctionName name = getFnName();
-        if (name.getDb() == null && MONOTONIC_FUNCTION_SET.contains(name.getFunction())) {
-            return true;
+        // the monotonicity of the builtin functions is declared in functions.py,
+        // every non-constant argument must be monotonic
+        Function fn = getFn();
+        if (fn == null || getFnName().getDb() != null || children.isEmpty()) {
+            return false;
         }
-        return false;
+        for (int i = 0; i < children.size(); i++) {
+            if (fn.getMonotonicity(i) == Function.Monotonicity.NONE && !children.get(i).isConstant()) {
+                return false;
+            }
+        }
+        return true;
     }
 
     @Override
@@ -0,0 +1,293 @@
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.starrocks.catalog;
+
+import com.google.common.annotations.VisibleForTesting;
+import com.google.common.collect.Lists;
+import com.google.common.collect.Maps;
+import com.starrocks.builtins.VectorizedBuiltinFunctions;
+import org.apache.logging.log4j.LogManager;
+import org.apache.logging.log4j.Logger;
+
+import java.io.IOException;
+import java.io.InputStream;
+import java.net.URISyntaxException;
+import java.net.URL;
+import java.nio.BufferUnderflowException;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Paths;
+import java.nio.file.StandardOpenOption;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+
+/**
+ * The vectorized scalar builtins in the binary catalog generated by gensrc/script/gen_functions.py.
+ * The catalog holds the same functions as {@link VectorizedBuiltinFunctions} and a table of the functions
+ * of every name, so FunctionSet can create the functions of a name on its first lookup instead of
+ * executing the generated registration code at startup. Aliases of a function, like ceil and ceiling,
+ * share the argument types of the function. The catalog also holds the overloads FunctionSet resolves the calls
+ * one implicit cast away from an overload to, for the functions of simple scalar types. See gen_functions.py
+ * for the format.
+ */
+public class BuiltinFunctionCatalog {
+    private static final Logger LOG = LogManager.getLogger(BuiltinFunctionCatalog.class);
+
+    private static final String RESOURCE = "/com/starrocks/builtins/vectorized_builtin_functions.bin";
+    private static final byte[] MAGIC = {'S', 'R', 'F', 'C'};
+    private static final int VERSION = 5;
+    private static final int FINGERPRINT_LENGTH = 32;
+    // u64 id, u32 name, u16 flags, u16 return type, u32 first argument, u16 argument count, u16 alias,
+    // u32 properties
+    private static final int FUNCTION_SIZE = 28;
+    private static final int FLAG_VARARGS = 0x1;
+    private static final int CAST_FLAG_STRICT = 0x1;
+
+    private final ByteBuffer functions;
+    private final int[] arguments;
+    // function name -> indexes of its functions in registration order
+    private final Map<String, int[]> nameFunctions;
+    // function name -> the casts of its calls, every cast is the index of the resolved function in the functions
+    // of the name, the flags and the type string indexes of the call
+    private final Map<String, int[][]> nameCasts;
+    // string index -> type, for the strings used as types
+    private final Type[] types;
+    // function index -> argument types, shared by the function and its aliases
+    private final Type[][] argTypes;
+
+    private BuiltinFunctionCatalog(ByteBuffer functions, int[] arguments, Map<String, int[]> nameFunctions,
+                                   Map<String, int[][]> nameCasts, Type[] types) {
+        this.functions = functions;
+        this.arguments = arguments;
+        this.nameFunctions = nameFunctions;
+        this.nameCasts = nameCasts;
+        this.types = types;
+        this.argTypes = new Type[functions.limit() / FUNCTION_SIZE][];
+    }
+
+    /**
+     * Returns the catalog on the classpath, or null if the catalog is missing, unreadable or generated from
+     * another function list than the VectorizedBuiltinFunctions classes.
+     */
+    public static BuiltinFunctionCatalog open() {
+        URL url = BuiltinFunctionCatalog.class.getResource(RESOURCE);
+        if (url == null) {
+            LOG.info("builtin function catalog {} is not found", RESOURCE);
+            return null;
+        }
+        try {
+            return decode(map(url));
+        } catch (IOException | URISyntaxException | ReflectiveOperationException | BufferUnderflowException |
+                IndexOutOfBoundsException | IllegalStateException | ClassCastException e) {
+            LOG.warn("failed to read builtin function catalog {}", url, e);
+            return null;
+        }
+    }
+
+    /**
+     * Registers all functions of the catalog to functionSet at once. Returns false without registering anything
+     * if there is no usable catalog. FunctionSet resolves the functions lazily through {@link #open()} instead.
+     */
+    @VisibleForTesting
+    public static boolean load(FunctionSet functionSet) {
+        BuiltinFunctionCatalog catalog = open();
+        if (catalog == null) {
+            return false;
+        }
+        for (String name : catalog.getFunctionNames()) {
+            for (Function fn : catalog.getFunctions(name)) {
+                functionSet.addVectorizedBuiltin(fn);
+            }
+        }
+        return true;
+    }
+
+    public Set<String> getFunctionNames() {
+        return Collections.unmodifiableSet(nameFunctions.keySet());
+    }
+
+    /**
+     * Creates the functions of name in registration order, every call returns new instances.
+     */
+    public synchronized List<Function> getFunctions(String name) {
+        int[] indexes = nameFunctions.get(name);
+        if (indexes == null) {
+            return Collections.emptyList();
+        }
+        List<Function> fns = Lists.newArrayListWithCapacity(indexes.length);
+        for (int index : indexes) {
+            int offset = index * FUNCTION_SIZE;
+            long id = functions.getLong(offset);
+            int flags = Short.toUnsignedInt(functions.getShort(offset + 12));
+            Type retType = types[Short.toUnsignedInt(functions.getShort(offset + 14))];
+            int alias = Short.toUnsignedInt(functions.getShort(offset + 22));
+            Function fn = ScalarFunction.createVectorizedBuiltin(id, name, getArgTypes(alias > 0 ? alias - 1 : index),
+                    (flags & FLAG_VARARGS) != 0, retType);
+            fn.setBuiltinProperties(functions.getInt(offset + 24));
+            fns.add(fn);
+        }
+        return fns;
+    }
+
+    /**
+     * Adds the cast table of name to overloads, fns are the functions of name returned by getFunctions.
+     */
+    void addCastFunctions(String name, List<Function> fns, BuiltinFunctionOverloads overloads) {
+        int[][] casts = nameCasts.get(name);
+        if (casts == null) {
+            return;
+        }
+        for (int[] cast : casts) {
+            Type[] callTypes = new Type[cast.length - 2];
+            for (int i = 0; i < callTypes.length; i++) {
+                callTypes[i] = types[cast[i + 2]];
+            }
+            overloads.addCastFunction(callTypes, fns.get(cast[0]), (cast[1] & CAST_FLAG_STRICT) != 0);
+        }
+    }
+
+    private Type[] getArgTypes(int index) {
+        if (argTypes[index] == null) {
+            int offset = index * FUNCTION_SIZE;
+            int firstArgument = functions.getInt(offset + 16);
+            Type[] fnArgTypes = new Type[Short.toUnsignedInt(functions.getShort(offset + 20))];
+            for (int i = 0; i < fnArgTypes.length; i++) {
+                fnArgTypes[i] = types[arguments[firstArgument + i]];
+            }
+            argTypes[index] = fnArgTypes;
+        }
+        return argTypes[index];
+    }
+
+    // The catalog is mapped if it's a plain file, and read into memory if it's packaged in a jar.
+    private static ByteBuffer map(URL url) throws IOException, URISyntaxException {
+        if ("file".equals(url.getProtocol())) {
+            try (FileChannel channel = FileChannel.open(Paths.get(url.toURI()), StandardOpenOption.READ)) {
+                return channel.map(FileChannel.MapMode.READ_ONLY, 0, channel.size());
+            }
+        }
+        try (InputStream in = url.openStream()) {
+            return ByteBuffer.wrap(in.readAllBytes());
+        }
+    }
+
+    private static BuiltinFunctionCatalog decode(ByteBuffer buffer) throws ReflectiveOperationException {
+        byte[] magic = new byte[MAGIC.length];
+        buffer.get(magic);
+        int version = Short.toUnsignedInt(buffer.getShort());
+        if (!Arrays.equals(MAGIC, magic) || version != VERSION) {
+            throw new IllegalStateException("unknown builtin function catalog version " + version);
+        }
+        buffer.getShort();
+        byte[] fingerprint = new byte[FINGERPRINT_LENGTH];
+        buffer.get(fingerprint);
+        String catalogFingerprint = new String(fingerprint, StandardCharsets.US_ASCII);
+        if (!catalogFingerprint.equals(VectorizedBuiltinFunctions.FINGERPRINT)) {
+            throw new IllegalStateException("builtin function catalog fingerprint " + catalogFingerprint +
+                    " does not match " + VectorizedBuiltinFunctions.FINGERPRINT);
+        }
+        int stringCount = buffer.getInt();
+        int functionCount = buffer.getInt();
+        int argumentCount = buffer.getInt();
+        int nameCount = buffer.getInt();
+        int castCount = buffer.getInt();
+        int castArgumentCount = buffer.getInt();
+
+        String[] strings = new String[stringCount];
+        for (int i = 0; i < stringCount; i++) {
+            byte[] bytes = new byte[Short.toUnsignedInt(buffer.getShort())];
+            buffer.get(bytes);
+            strings[i] = new String(bytes, StandardCharsets.UTF_8);
+        }
+
+        ByteBuffer functions = buffer.slice();
+        functions.limit(functionCount * FUNCTION_SIZE);
+        buffer.position(buffer.position() + functionCount * FUNCTION_SIZE);
+
+        int[] arguments = new int[argumentCount];
+        for (int i = 0; i < argumentCount; i++) {
+            arguments[i] = Short.toUnsignedInt(buffer.getShort());
+        }
+
+        // u32 name, u32 first name function, u16 function count, u16 cast count, u32 first cast
+        int[][] names = new int[nameCount][];
+        for (int i = 0; i < nameCount; i++) {
+            names[i] = new int[] {buffer.getInt(), buffer.getInt(), Short.toUnsignedInt(buffer.getShort()),
+                    Short.toUnsignedInt(buffer.getShort()), buffer.getInt()};
+        }
+        int[] nameIndexes = new int[functionCount];
+        for (int i = 0; i < functionCount; i++) {
+            nameIndexes[i] = Short.toUnsignedInt(buffer.getShort());
+        }
+        // u16 function index, u8 flags, u8 argument count, u32 first cast argument
+        int[][] casts = new int[castCount][];
+        for (int i = 0; i < castCount; i++) {
+            casts[i] = new int[] {Short.toUnsignedInt(buffer.getShort()), Byte.toUnsignedInt(buffer.get()),
+                    Byte.toUnsignedInt(buffer.get()), buffer.getInt()};
+        }
+        int[] castArguments = new int[castArgumentCount];
+        for (int i = 0; i < castArgumentCount; i++) {
+            castArguments[i] = Short.toUnsignedInt(buffer.getShort());
+        }
+        if (buffer.hasRemaining()) {
+            throw new IllegalStateException("trailing bytes in builtin function catalog");
+        }
+        Map<String, int[]> nameFunctions = Maps.newLinkedHashMapWithExpectedSize(nameCount);
+        Map<String, int[][]> nameCasts = Maps.newHashMapWithExpectedSize(nameCount);
+        for (int[] name : names) {
+            nameFunctions.put(strings[name[0]], Arrays.copyOfRange(nameIndexes, name[1], name[1] + name[2]));
+            if (name[3] == 0) {
+                continue;
+            }
+            int[][] nameCast = new int[name[3]][];
+            for (int i = 0; i < nameCast.length; i++) {
+                int[] cast = casts[name[4] + i];
+                if (cast[0] >= name[2]) {
+                    throw new IllegalStateException("cast of " + strings[name[0]] + " to an unknown function");
+                }
+                // function index, flags, argument types
+                nameCast[i] = new int[cast[2] + 2];
+                nameCast[i][0] = cast[0];
+                nameCast[i][1] = cast[1];
+                System.arraycopy(castArguments, cast[3], nameCast[i], 2, cast[2]);
+            }
+            nameCasts.put(strings[name[0]], nameCast);
+        }
+
+        // Resolve all types up front, so a lookup never fails on a type the FE doesn't know.
+        // Types are stored as the name of their static field in Type, the same as the generated java code uses.
+        Type[] types = new Type[stringCount];
+        for (int i = 0; i < functionCount; i++) {
+            resolveType(types, strings, Short.toUnsignedInt(functions.getShort(i * FUNCTION_SIZE + 14)));
+        }
+        for (int argument : arguments) {
+            resolveType(types, strings, argument);
+        }
+        for (int argument : castArguments) {
+            resolveType(types, strings, argument);
+        }
+        return new BuiltinFunctionCatalog(functions, arguments, nameFunctions, nameCasts, types);
+    }
+
+    private static void resolveType(Type[] types, String[] strings, int index) throws ReflectiveOperationException {
+        if (types[index] == null) {
+            types[index] = (Type) Type.class.getField(strings[index]).get(null);
+        }
+    }
+}
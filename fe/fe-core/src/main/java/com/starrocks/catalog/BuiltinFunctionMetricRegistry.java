@@ -0,0 +1,129 @@
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.starrocks.catalog;
+
+import com.starrocks.builtins.VectorizedBuiltinFunctions;
+import com.starrocks.common.Config;
+import com.starrocks.metric.LongCounterMetric;
+import com.starrocks.metric.Metric;
+import com.starrocks.metric.MetricLabel;
+import com.starrocks.metric.MetricVisitor;
+
+import java.util.concurrent.atomic.AtomicLongArray;
+import java.util.concurrent.atomic.AtomicReferenceArray;
+import java.util.concurrent.atomic.LongAdder;
+
+/**
+ * The resolutions of the vectorized builtins by {@link FunctionSet#getFunction}, counted per function and the
+ * match that resolved it, with the time spent. The counters of a function are in flat arrays at the slot
+ * of its id generated by gensrc/script/gen_functions.py, so counting is lock free and allocates nothing.
+ * Only counted if Config.enable_builtin_function_metrics is true, the functions are labeled by their ids,
+ * which are stable across regenerations of the function list.
+ */
+public class BuiltinFunctionMetricRegistry {
+
+    public enum MatchPath {
+        // the overload is identical or indistinguishable from the call
+        STRICT,
+        // the overload is generated from a polymorphic one
+        POLYMORPHIC,
+        // the arguments of the call are implicitly cast to the overload
+        CAST
+    }
+
+    private static final BuiltinFunctionMetricRegistry INSTANCE = new BuiltinFunctionMetricRegistry();
+
+    private static final MatchPath[] MATCH_PATHS = MatchPath.values();
+    // the counters of a slot: the resolutions of every match path, then the nanoseconds spent
+    private static final int SLOT_COUNTERS = MATCH_PATHS.length + 1;
+    private static final int NANOS = MATCH_PATHS.length;
+
+    private final AtomicLongArray counters = new AtomicLongArray(
+            VectorizedBuiltinFunctions.FUNCTION_COUNT * SLOT_COUNTERS);
+    // the name of every resolved slot, set on its first resolution
+    private final AtomicReferenceArray<String> names =
+            new AtomicReferenceArray<>(VectorizedBuiltinFunctions.FUNCTION_COUNT);
+    private final LongAdder misses = new LongAdder();
+    private final LongAdder missNanos = new LongAdder();
+
+    public static BuiltinFunctionMetricRegistry getInstance() {
+        return INSTANCE;
+    }
+
+    private BuiltinFunctionMetricRegistry() {
+    }
+
+    public static boolean isEnabled() {
+        return Config.enable_builtin_function_metrics;
+    }
+
+    // fn is the resolved function, only the vectorized builtins are counted
+    void recordMatch(Function fn, MatchPath path, long startNanos) {
+        int slot = VectorizedBuiltinFunctions.getSlot(fn.getFunctionId());
+        if (slot < 0) {
+            return;
+        }
+        long nanos = System.nanoTime() - startNanos;
+        if (names.get(slot) == null) {
+            names.lazySet(slot, fn.functionName());
+        }
+        counters.incrementAndGet(slot * SLOT_COUNTERS + path.ordinal());
+        counters.addAndGet(slot * SLOT_COUNTERS + NANOS, nanos);
+    }
+
+    void recordMiss(long startNanos) {
+        missNanos.add(System.nanoTime() - startNanos);
+        misses.increment();
+    }
+
+    public void visit(MetricVisitor visitor) {
+        for (int slot = 0; slot < names.length(); slot++) {
+            String name = names.get(slot);
+            if (name == null) {
+                continue;
+            }
+            for (MatchPath path : MATCH_PATHS) {
+                long count = counters.get(slot * SLOT_COUNTERS + path.ordinal());
+                if (count > 0) {
+                    LongCounterMetric metric = new LongCounterMetric("builtin_function_resolve_total",
+                            Metric.MetricUnit.OPERATIONS, "the resolutions of a builtin function by match path");
+                    addFunctionLabels(metric, slot, name);
+                    metric.addLabel(new MetricLabel("path", path.name().toLowerCase()));
+                    metric.increase(count);
+                    visitor.visit(metric);
+                }
+            }
+            LongCounterMetric nanos = new LongCounterMetric("builtin_function_resolve_nanos_total",
+                    Metric.MetricUnit.NANOSECONDS, "the time spent resolving a builtin function");
+            addFunctionLabels(nanos, slot, name);
+            nanos.increase(counters.get(slot * SLOT_COUNTERS + NANOS));
+            visitor.visit(nanos);
+        }
+
+        LongCounterMetric missCount = new LongCounterMetric("builtin_function_resolve_miss_total",
+                Metric.MetricUnit.OPERATIONS, "the lookups of a builtin function name without a matched overload");
+        missCount.increase(misses.sum());
+        visitor.visit(missCount);
+        LongCounterMetric missTime = new LongCounterMetric("builtin_function_resolve_miss_nanos_total",
+                Metric.MetricUnit.NANOSECONDS, "the time spent on the lookups without a matched overload");
+        missTime.increase(missNanos.sum());
+        visitor.visit(missTime);
+    }
+
+    private static void addFunctionLabels(Metric<?> metric, int slot, String name) {
+        metric.addLabel(new MetricLabel("function", name));
+        metric.addLabel(new MetricLabel("id", String.valueOf(VectorizedBuiltinFunctions.getFunctionId(slot))));
+    }
+}
@@ -0,0 +1,163 @@
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.starrocks.catalog;
+
+import com.google.common.collect.Lists;
+import com.google.common.collect.Maps;
+
+import java.util.Collections;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * All overloads of one builtin function name, indexed for {@link FunctionSet#getFunction}.
+ * The overloads are partitioned into non-polymorphic and polymorphic ones when they are added,
+ * and the non-polymorphic ones are bucketed by the exact match key of their argument types,
+ * so an identical match is a hash lookup instead of a scan.
+ * The overloads of a name loaded from {@link BuiltinFunctionCatalog} also hold the calls the catalog resolved by an
+ * implicit cast ahead of time, so the common cast matches are a hash lookup too.
+ * All lists keep the registration order, FunctionSet returns the first matched overload.
+ */
+class BuiltinFunctionOverloads {
+    private final List<Function> functions = Lists.newArrayList();
+    private final List<Function> standFunctions = Lists.newArrayList();
+    private final List<Function> polymorphicFunctions = Lists.newArrayList();
+    private final Map<String, List<Function>> identicalFunctions = Maps.newHashMap();
+    // false if any non-polymorphic overload has an argument type without an exact match key
+    private boolean indexed = true;
+    // key of a call -> the overload a strict or a non-strict cast resolves it to
+    private final Map<String, Function> castFunctions = Maps.newHashMap();
+    // key of a call -> the overload a strict cast resolves it to
+    private final Map<String, Function> strictCastFunctions = Maps.newHashMap();
+
+    void add(Function fn) {
+        functions.add(fn);
+        // the cast table is resolved against the overloads of the catalog only
+        castFunctions.clear();
+        strictCastFunctions.clear();
+        if (fn.isPolymorphic()) {
+            polymorphicFunctions.add(fn);
+            return;
+        }
+        standFunctions.add(fn);
+        String key = getIdenticalKey(fn);
+        if (key == null) {
+            indexed = false;
+            identicalFunctions.clear();
+        } else if (indexed) {
+            identicalFunctions.computeIfAbsent(key, k -> Lists.newArrayListWithCapacity(1)).add(fn);
+        }
+    }
+
+    List<Function> getFunctions() {
+        return Collections.unmodifiableList(functions);
+    }
+
+    List<Function> getStandFunctions() {
+        return standFunctions;
+    }
+
+    List<Function> getPolymorphicFunctions() {
+        return polymorphicFunctions;
+    }
+
+    /**
+     * Returns the first non-polymorphic overload identical to desc, the same one a scan of
+     * {@link Function.CompareMode#IS_IDENTICAL} over the non-polymorphic overloads returns.
+     */
+    Function getIdenticalFunction(Function desc) {
+        String key = indexed ? getIdenticalKey(desc) : null;
+        List<Function> candidates = key == null ? standFunctions : identicalFunctions.get(key);
+        if (candidates == null) {
+            return null;
+        }
+        for (Function fn : candidates) {
+            if (fn.compare(desc, Function.CompareMode.IS_IDENTICAL)) {
+                return fn;
+            }
+        }
+        return null;
+    }
+
+    void addCastFunction(Type[] callTypes, Function fn, boolean strict) {
+        String key = getIdenticalKey(false, callTypes);
+        castFunctions.put(key, fn);
+        if (strict) {
+            strictCastFunctions.put(key, fn);
+        }
+    }
+
+    /**
+     * Returns the overload a scan of {@link FunctionSet#getFunction} resolves desc to by an implicit cast,
+     * if desc is in the cast table, or null if desc must be resolved by the scan.
+     */
+    Function getCastFunction(Function desc, Function.CompareMode mode) {
+        Map<String, Function> casts;
+        if (mode == Function.CompareMode.IS_NONSTRICT_SUPERTYPE_OF) {
+            casts = castFunctions;
+        } else if (mode == Function.CompareMode.IS_SUPERTYPE_OF) {
+            casts = strictCastFunctions;
+        } else {
+            return null;
+        }
+        if (casts.isEmpty()) {
+            return null;
+        }
+        String key = getIdenticalKey(desc);
+        return key == null ? null : casts.get(key);
+    }
+
+    private static String getIdenticalKey(Function fn) {
+        return getIdenticalKey(fn.hasVarArgs(), fn.getArgs());
+    }
+
+    // Two functions can only be identical if their keys are equal, see Function.isIdentical and Type.matchesType.
+    // Returns null if any argument is a pseudo type or a type without a key.
+    private static String getIdenticalKey(boolean varArgs, Type[] argTypes) {
+        StringBuilder sb = new StringBuilder();
+        sb.append(varArgs ? "V" : "F");
+        for (Type type : argTypes) {
+            sb.append(',');
+            if (!appendTypeKey(sb, type)) {
+                return null;
+            }
+        }
+        return sb.toString();
+    }
+
+    private static boolean appendTypeKey(StringBuilder sb, Type type) {
+        if (type.isPseudoType()) {
+            return false;
+        } else if (type.isScalarType()) {
+            // all string types match each other
+            sb.append(type.isStringType() ? "STRING" : type.getPrimitiveType().name());
+            return true;
+        } else if (type.isArrayType()) {
+            sb.append("ARRAY<");
+            if (!appendTypeKey(sb, ((ArrayType) type).getItemType())) {
+                return false;
+            }
+            sb.append('>');
+            return true;
+        } else if (type.isMapType()) {
+            sb.append("MAP");
+            return true;
+        } else if (type.isStructType()) {
+            sb.append("STRUCT");
+            return true;
+        }
+        return false;
+    }
+}
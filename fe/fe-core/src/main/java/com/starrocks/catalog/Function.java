@@ -101,6 +101,38 @@ public class Function implements Writable {
         IS_NONSTRICT_SUPERTYPE_OF,
     }
 
+    // Properties of the vectorized builtin functions declared in gensrc/script/functions.py,
+    // keep them the same as gen_functions.py. The defaults are 0: deterministic, constant foldable,
+    // not injective, custom null handling and not monotonic.
+    public static final int NON_DETERMINISTIC = 0x1;
+    public static final int NOT_CONSTANT_FOLDABLE = 0x2;
+    // only used by BE
+    public static final int INJECTIVE = 0x4;
+    public static final int DICT_OPTIMIZABLE = 0x8;
+    // 2 bits for the NullHandling ordinal
+    private static final int NULL_HANDLING_SHIFT = 4;
+    // the capabilities of the backend function, only used by BE
+    public static final int SELECTION_VECTOR = 0x40;
+    public static final int CONSTANT_SPECIALIZED = 0x80;
+    // 2 bits for the Monotonicity ordinal of each of the first MONOTONIC_ARGS arguments
+    private static final int MONOTONIC_SHIFT = 8;
+    private static final int MONOTONIC_ARGS = 12;
+
+    public enum Monotonicity {
+        NONE,
+        INCREASING,
+        DECREASING,
+    }
+
+    public enum NullHandling {
+        // no declared relation between the nulls of the arguments and the result
+        CUSTOM,
+        // the result is null if and only if any argument is null
+        STRICT,
+        // the result is never null
+        NEVER_NULL,
+    }
+
     // for vectorized engine, function-id
     @SerializedName(value = "fid")
     protected long functionId;
@@ -157,6 +189,10 @@ public class Function implements Writable {
 
     private boolean isNullable = true;
 
+    // Not persisted, the builtin functions are rebuilt from the builtin catalog on startup,
+    // so a function restored from the image or journal always has the default properties.
+    private int builtinProperties = 0;
+
     private Vector<Pair<String, Expr>> defaultArgExprs;
 
     private boolean isMetaFunction = false;
@@ -236,6 +272,7 @@ public class Function implements Writable {
         isPolymorphic = other.isPolymorphic;
         couldApplyDictOptimize = other.couldApplyDictOptimize;
         isNullable = other.isNullable;
+        builtinProperties = other.builtinProperties;
         isMetaFunction = other.isMetaFunction;
         aggStateDesc = other.aggStateDesc;
     }
@@ -435,6 +472,32 @@ public class Function implements Writable {
         this.couldApplyDictOptimize = couldApplyDictOptimize;
     }
 
+    public void setBuiltinProperties(int builtinProperties) {
+        this.builtinProperties = builtinProperties;
+        this.couldApplyDictOptimize = (builtinProperties & DICT_OPTIMIZABLE) != 0;
+    }
+
+    public boolean isDeterministic() {
+        return (builtinProperties & NON_DETERMINISTIC) == 0;
+    }
+
+    // whether the function can be evaluated at plan time if all arguments are constant
+    public boolean isConstantFoldable() {
+        return (builtinProperties & NOT_CONSTANT_FOLDABLE) == 0;
+    }
+
+    public NullHandling getNullHandling() {
+        return NullHandling.values()[(builtinProperties >> NULL_HANDLING_SHIFT) & 0x3];
+    }
+
+    // how the result changes with the argument, when all the other arguments are constant
+    public Monotonicity getMonotonicity(int argIndex) {
+        if (argIndex >= MONOTONIC_ARGS) {
+            return Monotonicity.NONE;
+        }
+        return Monotonicity.values()[(builtinProperties >> (MONOTONIC_SHIFT + 2 * argIndex)) & 0x3];
+    }
+
     public AggStateDesc getAggStateDesc() {
         return aggStateDesc;
     }
@@ -58,6 +58,7 @@ import java.util.Collections;
 import java.util.List;
 import java.util.Map;
 import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
 import java.util.stream.Collectors;
 
 public class FunctionSet {
@@ -598,7 +599,12 @@ public class FunctionSet {
      * if we choose to use the vectorized function here. So... we need bind vectorized function
      * to row function when init.
      */
-    private final Map<String, List<Function>> vectorizedFunctions;
+    private final Map<String, BuiltinFunctionOverloads> vectorizedFunctions;
+
+    // The vectorized scalar builtins of these names are in builtinFunctionCatalog but not registered yet,
+    // they are registered on the first lookup of the name, see loadVectorizedBuiltins.
+    private final Set<String> unloadedVectorizedFunctions = ConcurrentHashMap.newKeySet();
+    private BuiltinFunctionCatalog builtinFunctionCatalog;
 
     // This contains the nullable functions, which cannot return NULL result directly for the NULL parameter.
     // This does not contain any user defined functions. All UDFs handle null values by themselves.
@@ -606,14 +612,6 @@ public class FunctionSet {
             ImmutableSet.of(IF, CONCAT_WS, IFNULL, NULLIF, NULL_OR_EMPTY, COALESCE, BITMAP_HASH, BITMAP_HASH64,
                     PERCENTILE_HASH, HLL_HASH, JSON_ARRAY, JSON_OBJECT, ROW, STRUCT, NAMED_STRUCT);
 
-    // If low cardinality string column with global dict, for some string functions,
-    // we could evaluate the function only with the dict content, not all string column data.
-    public final ImmutableSet<String> couldApplyDictOptimizationFunctions =
-            ImmutableSet.of(APPEND_TRAILING_CHAR_IF_ABSENT, CONCAT, CONCAT_WS, HEX, LEFT, LIKE, LOWER, LPAD, LTRIM,
-                    REGEXP_EXTRACT, REGEXP_REPLACE, REPEAT, REPLACE, REVERSE, RIGHT, RPAD, RTRIM, SPLIT_PART, SUBSTR,
-                    SUBSTRING, SUBSTRING_INDEX,
-                    TRIM, UPPER, IF);
-
     public static final Set<String> alwaysReturnNonNullableFunctions =
             ImmutableSet.<String>builder()
                     .add(FunctionSet.COUNT)
@@ -810,7 +808,7 @@ public class FunctionSet {
             ImmutableSet.<String>builder().add().add(ROW_NUMBER).add(RANK).add(DENSE_RANK).build();
 
     public FunctionSet() {
-        vectorizedFunctions = Maps.newHashMap();
+        vectorizedFunctions = Maps.newConcurrentMap();
     }
 
     /**
@@ -874,7 +872,13 @@ public class FunctionSet {
     public void init() {
         ArithmeticExpr.initBuiltins(this);
         TableFunction.initBuiltins(this);
-        VectorizedBuiltinFunctions.initBuiltins(this);
+        // fall back to the generated registration code if the builtin function catalog is not usable
+        builtinFunctionCatalog = BuiltinFunctionCatalog.open();
+        if (builtinFunctionCatalog != null) {
+            unloadedVectorizedFunctions.addAll(builtinFunctionCatalog.getFunctionNames());
+        } else {
+            VectorizedBuiltinFunctions.initBuiltins(this);
+        }
         initAggregateBuiltins();
     }
 
@@ -962,55 +966,137 @@ public class FunctionSet {
     }
 
     public Function getFunction(Function desc, Function.CompareMode mode) {
-        List<Function> fns = vectorizedFunctions.get(desc.functionName());
-        if (desc.hasNamedArg() && fns != null && !fns.isEmpty()) {
-            fns = fns.stream().filter(Function::hasNamedArg).collect(Collectors.toList());
-        }
-        if (fns == null || fns.isEmpty()) {
+        BuiltinFunctionOverloads overloads = getOverloads(desc.functionName());
+        if (overloads == null) {
             return null;
         }
+        // 0 if the resolutions are not counted, see BuiltinFunctionMetricRegistry
+        long startNanos = BuiltinFunctionMetricRegistry.isEnabled() ? System.nanoTime() : 0;
+
+        if (desc.hasNamedArg()) {
+            List<Function> fns = overloads.getFunctions().stream().filter(Function::hasNamedArg)
+                    .collect(Collectors.toList());
+            if (fns.isEmpty()) {
+                return null;
+            }
+            List<Function> standFns = fns.stream().filter(fn -> !fn.isPolymorphic()).collect(Collectors.toList());
+            List<Function> polyFns = fns.stream().filter(Function::isPolymorphic).collect(Collectors.toList());
+            return matchFunction(desc, mode, standFns, polyFns, startNanos);
+        }
+
+        // Most calls match an overload exactly, which is resolved by the index without a scan.
+        Function func = overloads.getIdenticalFunction(desc);
+        if (func != null) {
+            return recordMatch(func, BuiltinFunctionMetricRegistry.MatchPath.STRICT, startNanos);
+        }
+        // the cast table of the catalog resolves the calls one implicit cast away from an overload
+        func = overloads.getCastFunction(desc, mode);
+        if (func != null) {
+            return recordMatch(func, BuiltinFunctionMetricRegistry.MatchPath.CAST, startNanos);
+        }
+        return matchFunction(desc, mode, overloads.getStandFunctions(), overloads.getPolymorphicFunctions(),
+                startNanos);
+    }
 
+    private Function matchFunction(Function desc, Function.CompareMode mode, List<Function> standFns,
+                                   List<Function> polyFns, long startNanos) {
         Function func;
         // To be back-compatible, we first choose the functions from the non-polymorphic functions, if we can't find
         // a suitable in non-polymorphic functions. We will try to search in the polymorphic functions.
-        List<Function> standFns = fns.stream().filter(fn -> !fn.isPolymorphic()).collect(Collectors.toList());
         func = matchStrictFunction(desc, mode, standFns);
         if (func != null) {
-            return func;
+            return recordMatch(func, BuiltinFunctionMetricRegistry.MatchPath.STRICT, startNanos);
         }
 
-        List<Function> polyFns = fns.stream().filter(Function::isPolymorphic).collect(Collectors.toList());
         func = matchPolymorphicFunction(desc, mode, polyFns, standFns);
         if (func != null) {
-            return func;
+            return recordMatch(func, BuiltinFunctionMetricRegistry.MatchPath.POLYMORPHIC, startNanos);
+        }
+
+        func = matchCastFunction(desc, mode, standFns);
+        if (func != null) {
+            return recordMatch(func, BuiltinFunctionMetricRegistry.MatchPath.CAST, startNanos);
+        }
+        if (startNanos != 0) {
+            BuiltinFunctionMetricRegistry.getInstance().recordMiss(startNanos);
+        }
+        return null;
+    }
+
+    private static Function recordMatch(Function fn, BuiltinFunctionMetricRegistry.MatchPath path, long startNanos) {
+        if (startNanos != 0) {
+            BuiltinFunctionMetricRegistry.getInstance().recordMatch(fn, path, startNanos);
         }
+        return fn;
+    }
 
-        return matchCastFunction(desc, mode, standFns);
+    private BuiltinFunctionOverloads getOverloads(String name) {
+        if (unloadedVectorizedFunctions.contains(name)) {
+            loadVectorizedBuiltins(name);
+        }
+        return vectorizedFunctions.get(name);
+    }
+
+    // Registers the vectorized scalar builtins of name from the catalog, after the functions registered before.
+    // The overloads are replaced by an updated copy, so concurrent lookups never see them partially registered.
+    private synchronized void loadVectorizedBuiltins(String name) {
+        if (!unloadedVectorizedFunctions.contains(name)) {
+            return;
+        }
+        BuiltinFunctionOverloads overloads = new BuiltinFunctionOverloads();
+        BuiltinFunctionOverloads registered = vectorizedFunctions.get(name);
+        if (registered != null) {
+            registered.getFunctions().forEach(overloads::add);
+        }
+        List<Function> fns = builtinFunctionCatalog.getFunctions(name);
+        for (Function fn : fns) {
+            prepareVectorizedBuiltin(fn);
+            overloads.add(fn);
+        }
+        // the cast table only holds the overloads of the catalog
+        if (registered == null) {
+            builtinFunctionCatalog.addCastFunctions(name, fns, overloads);
+        }
+        vectorizedFunctions.put(name, overloads);
+        unloadedVectorizedFunctions.remove(name);
     }
 
     private void addBuiltInFunction(Function fn) {
         Preconditions.checkArgument(!fn.getReturnType().isPseudoType() || fn.isPolymorphic(), fn.toString());
+        // keep the registration order of the overloads the same as registering all builtins at once
+        getOverloads(fn.functionName());
         if (!fn.isPolymorphic() && getFunction(fn, Function.CompareMode.IS_INDISTINGUISHABLE) != null) {
             return;
         }
         fn.setIsNullable(!alwaysReturnNonNullableFunctions.contains(fn.functionName()));
-        List<Function> fns = vectorizedFunctions.computeIfAbsent(fn.functionName(), k -> Lists.newArrayList());
-        fns.add(fn);
+        vectorizedFunctions.computeIfAbsent(fn.functionName(), k -> new BuiltinFunctionOverloads()).add(fn);
     }
 
     // for vectorized engine
     public void addVectorizedScalarBuiltin(long fid, String fnName, boolean varArgs,
                                            Type retType, Type... args) {
+        addVectorizedScalarBuiltin(fid, fnName, varArgs, 0, retType, args);
+    }
 
+    // properties are the Function.NON_DETERMINISTIC... flags declared in functions.py
+    public void addVectorizedScalarBuiltin(long fid, String fnName, boolean varArgs, int properties,
+                                           Type retType, Type... args) {
         List<Type> argsType = Arrays.stream(args).collect(Collectors.toList());
-        addVectorizedBuiltin(ScalarFunction.createVectorizedBuiltin(fid, fnName, argsType, varArgs, retType));
+        Function fn = ScalarFunction.createVectorizedBuiltin(fid, fnName, argsType, varArgs, retType);
+        fn.setBuiltinProperties(properties);
+        addVectorizedBuiltin(fn);
     }
 
-    private void addVectorizedBuiltin(Function fn) {
-        fn.setCouldApplyDictOptimize(couldApplyDictOptimizationFunctions.contains(fn.functionName()));
-        fn.setIsNullable(!alwaysReturnNonNullableFunctions.contains(fn.functionName()));
-        List<Function> fns = vectorizedFunctions.computeIfAbsent(fn.functionName(), k -> Lists.newArrayList());
-        fns.add(fn);
+    void addVectorizedBuiltin(Function fn) {
+        getOverloads(fn.functionName());
+        prepareVectorizedBuiltin(fn);
+        vectorizedFunctions.computeIfAbsent(fn.functionName(), k -> new BuiltinFunctionOverloads()).add(fn);
+    }
+
+    // whether the function could apply the dict optimization and how it handles nulls is declared in functions.py
+    private void prepareVectorizedBuiltin(Function fn) {
+        fn.setIsNullable(fn.getNullHandling() != Function.NullHandling.NEVER_NULL &&
+                !alwaysReturnNonNullableFunctions.contains(fn.functionName()));
     }
 
     /**
@@ -1628,9 +1714,12 @@ public class FunctionSet {
     }
 
     public List<Function> getBuiltinFunctions() {
+        for (String name : unloadedVectorizedFunctions) {
+            loadVectorizedBuiltins(name);
+        }
         List<Function> builtinFunctions = Lists.newArrayList();
-        for (Map.Entry<String, List<Function>> entry : vectorizedFunctions.entrySet()) {
-            builtinFunctions.addAll(entry.getValue());
+        for (Map.Entry<String, BuiltinFunctionOverloads> entry : vectorizedFunctions.entrySet()) {
+            builtinFunctions.addAll(entry.getValue().getFunctions());
         }
         return builtinFunctions;
     }
@@ -103,6 +103,10 @@ public class ScalarFunction extends Function {
         super(fid, name, argTypes, retType, hasVarArgs);
     }
 
+    public ScalarFunction(long fid, FunctionName name, Type[] argTypes, Type retType, boolean hasVarArgs) {
+        super(fid, name, argTypes, retType, hasVarArgs);
+    }
+
     public ScalarFunction(ScalarFunction other) {
         super(other);
         symbolName = other.symbolName;
@@ -122,6 +126,15 @@ public class ScalarFunction extends Function {
         return fn;
     }
 
+    // argTypes is not copied, builtin aliases share it
+    public static ScalarFunction createVectorizedBuiltin(long fid, String name, Type[] argTypes,
+                                                         boolean hasVarArgs, Type retType) {
+        ScalarFunction fn = new ScalarFunction(fid, new FunctionName(name), argTypes, retType, hasVarArgs);
+        fn.setBinaryType(TFunctionBinaryType.BUILTIN);
+        fn.setUserVisible(true);
+        return fn;
+    }
+
     /**
      * Creates a builtin scalar operator function. This is a helper that wraps a few steps
      * into one call.
@@ -803,6 +803,13 @@ public class Config extends ConfigBase {
     @ConfField(mutable = true)
     public static boolean enable_http_detail_metrics = false;
 
+    /**
+     * Whether to count the resolutions of every vectorized builtin function by the analyzer and the time
+     * spent, the counters are exported as the builtin_function_resolve_* metrics.
+     */
+    @ConfField(mutable = true)
+    public static boolean enable_builtin_function_metrics = false;
+
     /**
      * Cluster name will be shown as the title of web page
      */
@@ -44,6 +44,7 @@ import com.starrocks.alter.AlterJobV2;
 import com.starrocks.backup.AbstractJob;
 import com.starrocks.backup.BackupJob;
 import com.starrocks.backup.RestoreJob;
+import com.starrocks.catalog.BuiltinFunctionMetricRegistry;
 import com.starrocks.catalog.Database;
 import com.starrocks.catalog.OlapTable;
 import com.starrocks.catalog.Table;
@@ -939,6 +940,11 @@ public final class MetricRepo {
         // collect merge commit metrics
         MergeCommitMetricRegistry.getInstance().visit(visitor);
 
+        // collect builtin function resolution metrics
+        if (Config.enable_builtin_function_metrics) {
+            BuiltinFunctionMetricRegistry.getInstance().visit(visitor);
+        }
+
         // node info
         visitor.getNodeInfo();
         return visitor.build();
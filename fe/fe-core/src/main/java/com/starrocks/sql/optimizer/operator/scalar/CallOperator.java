@@ -165,6 +165,11 @@ public class CallOperator extends ScalarOperator {
             return false;
         }
         // check children nullable
+        if (fn != null && fn.getNullHandling() == Function.NullHandling.STRICT) {
+            // decimal operation may overflow
+            return arguments.stream()
+                    .anyMatch(argument -> argument.isNullable() || argument.getType().isDecimalOfAnyVersion());
+        }
         if (FunctionCallExpr.nullableSameWithChildrenFunctions.contains(fnName)) {
             // decimal operation may overflow
             return arguments.stream()
@@ -184,7 +189,7 @@ public class CallOperator extends ScalarOperator {
 
     @Override
     public boolean isConstant() {
-        if (FunctionSet.nonDeterministicFunctions.contains(fnName)) {
+        if (FunctionSet.nonDeterministicFunctions.contains(fnName) || (fn != null && !fn.isDeterministic())) {
             return false;
         }
         for (ScalarOperator child : getChildren()) {
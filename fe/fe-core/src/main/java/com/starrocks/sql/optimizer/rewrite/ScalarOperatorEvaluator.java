@@ -147,7 +147,7 @@ public enum ScalarOperatorEvaluator {
         }
 
         Function fn = root.getFunction();
-        if (fn == null) {
+        if (fn == null || !fn.isConstantFoldable()) {
             return root;
         }
 
@@ -0,0 +1,77 @@
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.starrocks.benchmark;
+
+import com.starrocks.builtins.VectorizedBuiltinFunctions;
+import com.starrocks.catalog.BuiltinFunctionCatalog;
+import com.starrocks.catalog.FunctionSet;
+import org.openjdk.jmh.annotations.Benchmark;
+import org.openjdk.jmh.annotations.BenchmarkMode;
+import org.openjdk.jmh.annotations.Fork;
+import org.openjdk.jmh.annotations.Measurement;
+import org.openjdk.jmh.annotations.Mode;
+import org.openjdk.jmh.annotations.OutputTimeUnit;
+import org.openjdk.jmh.annotations.Scope;
+import org.openjdk.jmh.annotations.State;
+import org.openjdk.jmh.annotations.Warmup;
+import org.openjdk.jmh.runner.Runner;
+import org.openjdk.jmh.runner.RunnerException;
+import org.openjdk.jmh.runner.options.Options;
+import org.openjdk.jmh.runner.options.OptionsBuilder;
+
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Benchmark the population of {@link FunctionSet} as it happens during FE startup.
+ * Every fork measures one cold run in a fresh JVM, so the numbers include class loading and
+ * interpretation of the generated builtin registration code.
+ * Run it on the builds before and after a change of gen_functions.py to compare.
+ */
+@BenchmarkMode(Mode.SingleShotTime)
+@OutputTimeUnit(TimeUnit.MILLISECONDS)
+@State(Scope.Benchmark)
+@Fork(value = 10)
+@Warmup(iterations = 0)
+@Measurement(iterations = 1)
+public class FunctionSetInitBench {
+
+    public static void main(String[] args) throws RunnerException {
+        Options opt = new OptionsBuilder()
+                .include(FunctionSetInitBench.class.getSimpleName())
+                .build();
+        new Runner(opt).run();
+    }
+
+    @Benchmark
+    public FunctionSet initVectorizedBuiltins() {
+        FunctionSet functionSet = new FunctionSet();
+        VectorizedBuiltinFunctions.initBuiltins(functionSet);
+        return functionSet;
+    }
+
+    @Benchmark
+    public FunctionSet initVectorizedBuiltinsFromCatalog() {
+        FunctionSet functionSet = new FunctionSet();
+        BuiltinFunctionCatalog.load(functionSet);
+        return functionSet;
+    }
+
+    @Benchmark
+    public FunctionSet initFunctionSet() {
+        FunctionSet functionSet = new FunctionSet();
+        functionSet.init();
+        return functionSet;
+    }
+}
@@ -0,0 +1,120 @@
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.starrocks.benchmark;
+
+import com.google.common.collect.Lists;
+import com.starrocks.common.FeConstants;
+import com.starrocks.qe.ConnectContext;
+import com.starrocks.qe.ConnectProcessor;
+import com.starrocks.utframe.StarRocksAssert;
+import com.starrocks.utframe.UtFrameUtils;
+import org.junit.Assume;
+import org.junit.Test;
+
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
+import java.util.Arrays;
+import java.util.List;
+
+/**
+ * Benchmark the planning of the SQL corpus generated by gensrc/script/gen_function_workload.py, which calls
+ * every vectorized builtin function. The corpus is planned in FE without BE, and the test reports
+ * queries/sec, p50/p99 planning latency and the allocation per query. The queries the planner rejects are
+ * listed with the error, they are left out of the measurement. It runs only if the corpus is given:
+ *   python3 gensrc/script/gen_function_workload.py --output /tmp/function_workload.sql
+ *   mvn test -pl fe-core -Dtest=FunctionWorkloadBenchTest -Dfunction_workload=/tmp/function_workload.sql
+ * Set -Dfunction_workload_rounds to change the number of measured rounds over the corpus, 3 by default.
+ */
+public class FunctionWorkloadBenchTest {
+    private static final String DB_NAME = "function_workload_db";
+
+    private static List<String> readStatements(String path) throws Exception {
+        List<String> statements = Lists.newArrayList();
+        StringBuilder statement = new StringBuilder();
+        for (String line : Files.readAllLines(Paths.get(path), StandardCharsets.UTF_8)) {
+            if (line.startsWith("--") || line.isBlank()) {
+                continue;
+            }
+            statement.append(line).append('\n');
+            if (line.endsWith(";")) {
+                statements.add(statement.substring(0, statement.length() - 2));
+                statement.setLength(0);
+            }
+        }
+        return statements;
+    }
+
+    @Test
+    public void benchFunctionWorkload() throws Exception {
+        String path = System.getProperty("function_workload");
+        Assume.assumeTrue("run with -Dfunction_workload=<corpus of gen_function_workload.py>", path != null);
+        int rounds = Integer.getInteger("function_workload_rounds", 3);
+
+        FeConstants.runningUnitTest = true;
+        UtFrameUtils.createMinStarRocksCluster();
+        ConnectContext ctx = UtFrameUtils.createDefaultCtx();
+        StarRocksAssert starRocksAssert = new StarRocksAssert(ctx);
+        starRocksAssert.withDatabase(DB_NAME).useDatabase(DB_NAME);
+
+        List<String> queries = Lists.newArrayList();
+        for (String statement : readStatements(path)) {
+            if (statement.startsWith("CREATE TABLE")) {
+                starRocksAssert.withTable(statement);
+            } else {
+                queries.add(statement);
+            }
+        }
+
+        // the first round warms up, the queries the planner rejects are listed and not measured
+        List<String> planned = Lists.newArrayList();
+        List<String> rejected = Lists.newArrayList();
+        for (String query : queries) {
+            try {
+                UtFrameUtils.getPlanAndFragment(ctx, query);
+                planned.add(query);
+            } catch (Exception e) {
+                rejected.add(query + "\n    " + e);
+            }
+        }
+        for (String query : rejected) {
+            System.out.printf("rejected by the planner: %s%n", query);
+        }
+
+        long threadId = Thread.currentThread().getId();
+        long[] latencies = new long[planned.size() * rounds];
+        long allocatedBytes = ConnectProcessor.getThreadAllocatedBytes(threadId);
+        long start = System.nanoTime();
+        for (int round = 0; round < rounds; round++) {
+            for (int i = 0; i < planned.size(); i++) {
+                long begin = System.nanoTime();
+                UtFrameUtils.getPlanAndFragment(ctx, planned.get(i));
+                latencies[round * planned.size() + i] = System.nanoTime() - begin;
+            }
+        }
+        long elapsed = System.nanoTime() - start;
+        allocatedBytes = ConnectProcessor.getThreadAllocatedBytes(threadId) - allocatedBytes;
+
+        Arrays.sort(latencies);
+        int count = latencies.length;
+        System.out.printf("function workload: %d queries, %d rejected by the planner, %d rounds%n",
+                queries.size(), rejected.size(), rounds);
+        if (count > 0) {
+            System.out.printf("qps: %.1f, p50: %.3f ms, p99: %.3f ms, allocation: %d bytes/query%n",
+                    count * 1e9 / elapsed, latencies[count / 2] / 1e6,
+                    latencies[Math.min(count - 1, (int) (count * 0.99))] / 1e6, allocatedBytes / count);
+        }
+    }
+}
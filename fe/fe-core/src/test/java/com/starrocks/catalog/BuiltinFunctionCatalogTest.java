@@ -0,0 +1,156 @@
+// Copyright 2021-present StarRocks, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.starrocks.catalog;
+
+import com.google.common.collect.Lists;
+import com.starrocks.analysis.FunctionName;
+import com.starrocks.builtins.VectorizedBuiltinFunctions;
+import mockit.Mock;
+import mockit.MockUp;
+import org.junit.Assert;
+import org.junit.Test;
+
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.stream.Collectors;
+
+public class BuiltinFunctionCatalogTest {
+
+    private static Map<String, List<Function>> getFunctionsByName(FunctionSet functionSet) {
+        return functionSet.getBuiltinFunctions().stream()
+                .collect(Collectors.groupingBy(Function::functionName));
+    }
+
+    private static void assertSameFunctions(FunctionSet expected, FunctionSet actual) {
+        Map<String, List<Function>> expectedFunctions = getFunctionsByName(expected);
+        Map<String, List<Function>> actualFunctions = getFunctionsByName(actual);
+        Assert.assertEquals(expectedFunctions.keySet(), actualFunctions.keySet());
+        for (Map.Entry<String, List<Function>> entry : expectedFunctions.entrySet()) {
+            List<Function> overloads = actualFunctions.get(entry.getKey());
+            Assert.assertEquals(entry.getKey(), entry.getValue().size(), overloads.size());
+            // the overloads must be registered in the same order, the first matched one wins
+            for (int i = 0; i < overloads.size(); i++) {
+                Function e = entry.getValue().get(i);
+                Function a = overloads.get(i);
+                Assert.assertEquals(e.getFunctionId(), a.getFunctionId());
+                Assert.assertEquals(e.hasVarArgs(), a.hasVarArgs());
+                Assert.assertEquals(e.getReturnType(), a.getReturnType());
+                Assert.assertArrayEquals(e.getArgs(), a.getArgs());
+            }
+        }
+    }
+
+    @Test
+    public void testLoadSameAsGeneratedClasses() {
+        FunctionSet expected = new FunctionSet();
+        VectorizedBuiltinFunctions.initBuiltins(expected);
+        FunctionSet actual = new FunctionSet();
+        Assert.assertTrue(BuiltinFunctionCatalog.load(actual));
+        assertSameFunctions(expected, actual);
+    }
+
+    @Test
+    public void testAliasesShareArgTypes() {
+        BuiltinFunctionCatalog catalog = BuiltinFunctionCatalog.open();
+        Assert.assertNotNull(catalog);
+        Function ceil = catalog.getFunctions("ceil").get(0);
+        Function ceiling = catalog.getFunctions("ceiling").get(0);
+        Assert.assertSame(ceil.getArgs(), ceiling.getArgs());
+        Assert.assertNotEquals(ceil.getFunctionId(), ceiling.getFunctionId());
+        Assert.assertEquals("ceiling", ceiling.functionName());
+    }
+
+    @Test
+    public void testLazyRegistrationSameAsEager() {
+        FunctionSet lazy = new FunctionSet();
+        lazy.init();
+        // register some names before the others
+        Function upper = lazy.getFunction(new Function(new FunctionName("upper"), new Type[] {Type.VARCHAR},
+                Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertNotNull(upper);
+        Assert.assertTrue(upper.isCouldApplyDictOptimize());
+
+        new MockUp<BuiltinFunctionCatalog>() {
+            @Mock
+            public BuiltinFunctionCatalog open() {
+                return null;
+            }
+        };
+        FunctionSet eager = new FunctionSet();
+        eager.init();
+        assertSameFunctions(eager, lazy);
+    }
+
+    @Test
+    public void testCastTableSameAsScan() {
+        FunctionSet lazy = new FunctionSet();
+        lazy.init();
+        new MockUp<BuiltinFunctionCatalog>() {
+            @Mock
+            public BuiltinFunctionCatalog open() {
+                return null;
+            }
+        };
+        FunctionSet eager = new FunctionSet();
+        eager.init();
+
+        // the calls one implicit cast away from an overload, a superset of the cast table
+        Type[] castTypes = {Type.BOOLEAN, Type.TINYINT, Type.SMALLINT, Type.INT, Type.BIGINT, Type.LARGEINT,
+                Type.FLOAT, Type.DOUBLE, Type.DATE, Type.DATETIME, Type.VARCHAR};
+        for (Function fn : eager.getBuiltinFunctions()) {
+            if (fn.isPolymorphic() || fn.hasNamedArg()) {
+                continue;
+            }
+            for (int i = 0; i < fn.getNumArgs(); i++) {
+                for (Type type : castTypes) {
+                    Type[] args = fn.getArgs().clone();
+                    args[i] = type;
+                    Function desc = new Function(fn.getFunctionName(), args, Type.INVALID, false);
+                    for (Function.CompareMode mode : new Function.CompareMode[] {
+                            Function.CompareMode.IS_SUPERTYPE_OF, Function.CompareMode.IS_NONSTRICT_SUPERTYPE_OF}) {
+                        Function expected = eager.getFunction(desc, mode);
+                        Function actual = lazy.getFunction(desc, mode);
+                        Assert.assertEquals(desc + " " + mode, expected == null ? null : expected.getFunctionId(),
+                                actual == null ? null : actual.getFunctionId());
+                    }
+                }
+            }
+        }
+    }
+
+    @Test
+    public void testConcurrentLookup() throws Exception {
+        FunctionSet functionSet = new FunctionSet();
+        functionSet.init();
+        Function desc = new Function(new FunctionName("abs"), new Type[] {Type.DOUBLE}, Type.INVALID, false);
+        ExecutorService executor = Executors.newFixedThreadPool(8);
+        try {
+            List<Future<Function>> futures = Lists.newArrayList();
+            for (int i = 0; i < 64; i++) {
+                futures.add(executor.submit(() -> functionSet.getFunction(desc, Function.CompareMode.IS_IDENTICAL)));
+            }
+            Function expected = futures.get(0).get();
+            Assert.assertNotNull(expected);
+            for (Future<Function> future : futures) {
+                Assert.assertSame(expected, future.get());
+            }
+        } finally {
+            executor.shutdownNow();
+        }
+    }
+}
@@ -15,12 +15,23 @@
 package com.starrocks.catalog;
 
 import com.google.common.collect.Lists;
+import com.starrocks.analysis.FunctionCallExpr;
 import com.starrocks.analysis.FunctionName;
+import com.starrocks.analysis.IntLiteral;
+import com.starrocks.analysis.SlotRef;
+import com.starrocks.analysis.StringLiteral;
+import com.starrocks.builtins.VectorizedBuiltinFunctions;
+import com.starrocks.common.Config;
+import com.starrocks.metric.PrometheusMetricVisitor;
 import com.starrocks.sql.analyzer.SemanticException;
+import com.starrocks.sql.optimizer.operator.scalar.CallOperator;
+import com.starrocks.sql.optimizer.operator.scalar.ColumnRefOperator;
 import org.junit.Assert;
 import org.junit.Before;
 import org.junit.Test;
 
+import java.util.List;
+
 public class FunctionSetTest {
 
     private FunctionSet functionSet;
@@ -56,6 +67,41 @@ public class FunctionSetTest {
         Assert.assertTrue(newArgTypes[0].matchesType(ScalarType.VARCHAR));
     }
 
+    @Test
+    public void testGetIdenticalFunction() {
+        List<Function> builtins = functionSet.getBuiltinFunctions();
+        for (Function fn : builtins) {
+            if (fn.isPolymorphic() || fn.hasNamedArg()) {
+                continue;
+            }
+            Function desc = new Function(fn.getFunctionName(), fn.getArgs(), Type.INVALID, fn.hasVarArgs());
+            // the index must resolve the same overload as a scan in registration order
+            Function expected = builtins.stream()
+                    .filter(f -> f.functionName().equals(fn.functionName()) && !f.isPolymorphic())
+                    .filter(f -> f.compare(desc, Function.CompareMode.IS_IDENTICAL))
+                    .findFirst().orElse(null);
+            if (expected == null) {
+                // e.g. MAP arguments never match exactly
+                continue;
+            }
+            Assert.assertSame(fn.signatureString(), expected,
+                    functionSet.getFunction(desc, Function.CompareMode.IS_IDENTICAL));
+        }
+
+        // abs(DECIMAL32(9, 2)) matches abs(DECIMAL32) exactly
+        Type[] argTypes = {ScalarType.createDecimalV3NarrowestType(9, 2)};
+        Function desc = new Function(new FunctionName("abs"), argTypes, Type.INVALID, false);
+        Function fn = functionSet.getFunction(desc, Function.CompareMode.IS_IDENTICAL);
+        Assert.assertNotNull(fn);
+        Assert.assertEquals(PrimitiveType.DECIMAL32, fn.getArgs()[0].getPrimitiveType());
+
+        // upper(CHAR) matches upper(VARCHAR) exactly
+        desc = new Function(new FunctionName("upper"), new Type[] {Type.CHAR}, Type.INVALID, false);
+        fn = functionSet.getFunction(desc, Function.CompareMode.IS_IDENTICAL);
+        Assert.assertNotNull(fn);
+        Assert.assertEquals(Type.VARCHAR, fn.getArgs()[0]);
+    }
+
     @Test
     public void testPolymorphicFunction() {
         // array_append(ARRAY<INT>, INT)
@@ -345,4 +391,130 @@ public class FunctionSetTest {
         Assert.assertEquals(Type.BIGINT, tableFunction.getTableFnReturnTypes().get(0));
         Assert.assertEquals(Type.VARCHAR, tableFunction.getTableFnReturnTypes().get(1));
     }
+
+    @Test
+    public void testBuiltinProperties() {
+        Function rand = functionSet.getFunction(new Function(new FunctionName("rand"), new Type[] {},
+                Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertFalse(rand.isDeterministic());
+        Assert.assertFalse(rand.isConstantFoldable());
+
+        Function negative = functionSet.getFunction(new Function(new FunctionName("negative"),
+                new Type[] {Type.BIGINT}, Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertTrue(negative.isDeterministic());
+        Assert.assertTrue(negative.isConstantFoldable());
+        Assert.assertEquals(Function.Monotonicity.DECREASING, negative.getMonotonicity(0));
+
+        Function dateTrunc = functionSet.getFunction(new Function(new FunctionName("date_trunc"),
+                new Type[] {Type.VARCHAR, Type.DATE}, Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertEquals(Function.Monotonicity.NONE, dateTrunc.getMonotonicity(0));
+        Assert.assertEquals(Function.Monotonicity.INCREASING, dateTrunc.getMonotonicity(1));
+
+        // date_trunc('month', col) is monotonic, date_trunc(col, col) isn't
+        SlotRef col = new SlotRef(null, "c1");
+        FunctionCallExpr call = new FunctionCallExpr("date_trunc", Lists.newArrayList(new StringLiteral("month"), col));
+        call.setFn(dateTrunc);
+        Assert.assertTrue(call.isMonotonic());
+        call = new FunctionCallExpr("date_trunc", Lists.newArrayList(col, col));
+        call.setFn(dateTrunc);
+        Assert.assertFalse(call.isMonotonic());
+
+        // the interval of days_add may overflow the result to null, only a constant interval is monotonic
+        Function daysAdd = functionSet.getFunction(new Function(new FunctionName("days_add"),
+                new Type[] {Type.DATETIME, Type.INT}, Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertEquals(Function.Monotonicity.INCREASING, daysAdd.getMonotonicity(0));
+        Assert.assertEquals(Function.Monotonicity.NONE, daysAdd.getMonotonicity(1));
+        call = new FunctionCallExpr("days_add", Lists.newArrayList(col, new IntLiteral(1)));
+        call.setFn(daysAdd);
+        Assert.assertTrue(call.isMonotonic());
+        call = new FunctionCallExpr("days_add", Lists.newArrayList(col, col));
+        call.setFn(daysAdd);
+        Assert.assertFalse(call.isMonotonic());
+
+        // the optimizer still uses the name list, it must agree with functions.py
+        for (Function fn : functionSet.getBuiltinFunctions()) {
+            if (FunctionSet.nonDeterministicFunctions.contains(fn.functionName()) && fn instanceof ScalarFunction) {
+                Assert.assertFalse(fn.functionName(), fn.isDeterministic());
+            }
+        }
+    }
+
+    @Test
+    public void testDictOptimizable() {
+        for (String name : Lists.newArrayList("upper", "ucase", "substr", "concat_ws")) {
+            for (Function fn : functionSet.getBuiltinFunctions()) {
+                if (fn.functionName().equals(name)) {
+                    Assert.assertTrue(name, fn.isCouldApplyDictOptimize());
+                }
+            }
+        }
+        Function md5 = functionSet.getFunction(new Function(new FunctionName("md5"), new Type[] {Type.VARCHAR},
+                Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertFalse(md5.isCouldApplyDictOptimize());
+    }
+
+    @Test
+    public void testNullHandling() {
+        Function pi = functionSet.getFunction(new Function(new FunctionName("pi"), new Type[] {},
+                Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertEquals(Function.NullHandling.NEVER_NULL, pi.getNullHandling());
+        Assert.assertFalse(pi.isNullable());
+        Function abs = functionSet.getFunction(new Function(new FunctionName("abs"), new Type[] {Type.DOUBLE},
+                Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertEquals(Function.NullHandling.STRICT, abs.getNullHandling());
+        Assert.assertTrue(abs.isNullable());
+        // a strict function returns null for a null argument
+        for (Function fn : functionSet.getBuiltinFunctions()) {
+            if (fn.getNullHandling() == Function.NullHandling.STRICT) {
+                Assert.assertFalse(fn.functionName(),
+                        functionSet.isNotAlwaysNullResultWithNullParamFunctions(fn.functionName()));
+            }
+        }
+    }
+
+    @Test
+    public void testDecimalNullHandling() {
+        // abs of the decimal minimum overflows to null, even if the argument is not null
+        Type decimal = ScalarType.createDecimalV3NarrowestType(9, 2);
+        Function abs = functionSet.getFunction(new Function(new FunctionName("abs"), new Type[] {decimal},
+                Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertEquals(Function.NullHandling.CUSTOM, abs.getNullHandling());
+        ColumnRefOperator column = new ColumnRefOperator(1, decimal, "c", false);
+        CallOperator call = new CallOperator("abs", decimal, Lists.newArrayList(column), abs);
+        Assert.assertTrue(call.isNullable());
+
+        // a strict function of a decimal is nullable too
+        Function sign = functionSet.getFunction(new Function(new FunctionName("sign"), new Type[] {Type.DOUBLE},
+                Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+        Assert.assertEquals(Function.NullHandling.STRICT, sign.getNullHandling());
+        call = new CallOperator("sign", Type.FLOAT, Lists.newArrayList(column), sign);
+        Assert.assertTrue(call.isNullable());
+        call = new CallOperator("sign", Type.FLOAT,
+                Lists.newArrayList(new ColumnRefOperator(2, Type.DOUBLE, "d", false)), sign);
+        Assert.assertFalse(call.isNullable());
+    }
+
+    @Test
+    public void testResolutionMetrics() {
+        boolean enabled = Config.enable_builtin_function_metrics;
+        Config.enable_builtin_function_metrics = true;
+        try {
+            Function abs = functionSet.getFunction(new Function(new FunctionName("abs"), new Type[] {Type.DOUBLE},
+                    Type.INVALID, false), Function.CompareMode.IS_IDENTICAL);
+            Assert.assertEquals(abs.getFunctionId(),
+                    VectorizedBuiltinFunctions.getFunctionId(VectorizedBuiltinFunctions.getSlot(abs.getFunctionId())));
+            Assert.assertNull(functionSet.getFunction(new Function(new FunctionName("abs"),
+                    new Type[] {Type.BITMAP, Type.BITMAP}, Type.INVALID, false), Function.CompareMode.IS_IDENTICAL));
+
+            PrometheusMetricVisitor visitor = new PrometheusMetricVisitor("starrocks_fe");
+            BuiltinFunctionMetricRegistry.getInstance().visit(visitor);
+            String metrics = visitor.build();
+            Assert.assertTrue(metrics, metrics.contains("builtin_function_resolve_total{function=\"abs\", id=\"" +
+                    abs.getFunctionId() + "\", path=\"strict\"}"));
+            Assert.assertTrue(metrics, metrics.contains("builtin_function_resolve_miss_total"));
+        } finally {
+            Config.enable_builtin_function_metrics = enabled;
+        }
+        Assert.assertEquals(-1, VectorizedBuiltinFunctions.getSlot(-1));
+    }
 }
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An index of the static members declared by the classes of the be/src/exprs headers, so gen_functions.py can check
+the backend symbols of functions.py before builtin_functions.cpp is compiled. It's a lightweight parser, not a
+C++ front end: it only finds the member declarations at the top level of a class body, by their name and number of
+parameters, and the DEFINE_VECTORIZED_FN style macros. The index of every header is cached by its modification time
+and size.
+"""
+
+import os
+import pickle
+import re
+import tempfile
+
+import function_registry
+
+CACHE_PATH = os.path.join(function_registry.CACHE_DIR, "exprs_symbols.pickle")
+
+# the number of parameters of a function member, and of prepare and close
+function_params = 2
+prepare_close_params = 2
+
+# the macros which declare a function member, see exprs/function_helper.h
+function_macros = {"DEFINE_VECTORIZED_FN", "DEFINE_VECTORIZED_FN_TEMPLATE"}
+
+comment_pattern = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+string_pattern = re.compile(r'"(?:\\.|[^"\\])*"')
+class_pattern = re.compile(r"\b(?:class|struct)\s+(\w+)\b[^;{()]*\{")
+macro_pattern = re.compile(r"^(?:template\s*<.*>\s*)?(\w+)\s*\(\s*(\w+)\s*\)$", re.S)
+
+
+def _match_close(text, start, open_char, close_char):
+    """ the index of the bracket closing the one at text[start] """
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == open_char:
+            depth += 1
+        elif text[i] == close_char:
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(text)
+
+
+def _count_params(params):
+    params = params.strip()
+    if not params or params == "void":
+        return 0
+    depth = 0
+    count = 1
+    for c in params:
+        if c in "(<[{":
+            depth += 1
+        elif c in ")>]}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            count += 1
+    return count
+
+
+def _parse_member(declaration, members):
+    """ adds the function declared by one top level declaration of a class body to members """
+    declaration = " ".join(declaration.split())
+    m = macro_pattern.match(declaration)
+    if m:
+        if m.group(1) in function_macros:
+            members.setdefault(m.group(2), set()).add(function_params)
+        return
+    if not re.search(r"\bstatic\b", declaration):
+        return
+    # the name is the identifier before the first parenthesis outside of template arguments
+    depth = 0
+    for i, c in enumerate(declaration):
+        if c == "<":
+            depth += 1
+        elif c == ">":
+            depth -= 1
+        elif c == "(" and depth == 0:
+            name = re.search(r"(\w+)\s*$", declaration[:i])
+            if name:
+                params = declaration[i + 1:_match_close(declaration, i, "(", ")")]
+                members.setdefault(name.group(1), set()).add(_count_params(params))
+            return
+
+
+def _parse_class_body(body):
+    members = dict()
+    declaration_start = 0
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c == "{":
+            # an inline definition or a nested type, the declaration ends with its body
+            end = _match_close(body, i, "{", "}")
+            _parse_member(body[declaration_start:i], members)
+            i = end + 1
+            declaration_start = i
+            continue
+        if c == ";":
+            _parse_member(body[declaration_start:i], members)
+            declaration_start = i + 1
+        elif c == ":" and re.search(r"\b(public|protected|private)\s*$", body[declaration_start:i]):
+            declaration_start = i + 1
+        i += 1
+    return members
+
+
+def parse_header(text):
+    """ returns class name -> member name -> the set of the numbers of parameters of its overloads """
+    text = string_pattern.sub('""', comment_pattern.sub(" ", text))
+    text = "\n".join([line for line in text.split("\n") if not line.lstrip().startswith("#")])
+    classes = dict()
+    for m in class_pattern.finditer(text):
+        start = m.end() - 1
+        body = text[start + 1:_match_close(text, start, "{", "}")]
+        classes.setdefault(m.group(1), dict()).update(_parse_class_body(body))
+    return classes
+
+
+class SymbolIndex(object):
+    """ the parsed headers of be/src, cached by the modification time and size of every header """
+
+    def __init__(self, be_src, cache_path=CACHE_PATH):
+        self.be_src = be_src
+        self.cache_path = cache_path
+        self.headers = dict()
+        self.dirty = False
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    self.headers = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                self.headers = dict()
+
+    def get_classes(self, header):
+        """ the classes of a header relative to be_src, None if it doesn't exist """
+        path = os.path.join(self.be_src, header)
+        if not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        cached = self.headers.get(key)
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+        with open(path, "r", errors="replace") as f:
+            classes = parse_header(f.read())
+        self.headers[key] = ((stat.st_mtime_ns, stat.st_size), classes)
+        self.dirty = True
+        return classes
+
+    def save(self):
+        """ the cache is only an optimization, an unwritable cache directory is ignored """
+        if not self.dirty or not self.cache_path:
+            return
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".exprs_symbols_")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(self.headers, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+
+def split_symbol(symbol):
+    """ Class::member<template arguments> -> (Class, member) """
+    symbol = re.sub(r"<.*>$", "", symbol)
+    if "::" not in symbol:
+        return None, symbol
+    cls, member = symbol.rsplit("::", 1)
+    return cls, member
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The function list of functions.py as validated records, shared by the generators of gensrc/script.
+Every row is checked column by column and all errors of the list are reported at once. The records are cached
+in the build directory by the hash of functions.py and of this file, so the generators run by the gensrc Makefile
+load the list once instead of each one parsing and validating it again.
+
+    registry = function_registry.load()
+    for record in registry.functions:
+        print(record.id, record.name, record.args)
+"""
+
+import hashlib
+import importlib.util
+import os
+import pickle
+import re
+import tempfile
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FUNCTIONS_PATH = os.path.join(SCRIPT_DIR, "functions.py")
+CACHE_DIR = os.path.join(SCRIPT_DIR, "..", "build", "function_registry")
+
+# the properties a function may declare in the dict at the end of its row, see functions.py
+property_names = ["deterministic", "constant_foldable", "injective", "monotonic", "dict_optimizable",
+                  "null_handling", "selection_vector", "constant_specialized"]
+monotonicity_values = [None, "increasing", "decreasing"]
+null_handling_values = ["custom", "strict", "never_null"]
+# the properties have 2 bits of monotonicity for each of the first arguments only
+max_monotonic_args = 12
+
+type_pattern = re.compile(r"^[A-Z][A-Z0-9_]*$")
+symbol_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(::[A-Za-z_][A-Za-z0-9_<>, ]*)*$")
+
+
+class FunctionRegistryError(Exception):
+    def __init__(self, errors):
+        super(FunctionRegistryError, self).__init__("%d errors in functions.py" % len(errors))
+        self.errors = errors
+
+
+class FunctionRecord(object):
+    """ one row of functions.py, prepare and close are None if the row doesn't declare them """
+    __slots__ = ("id", "name", "exception_safe", "check_overflow", "ret", "args", "fn", "prepare", "close",
+                 "declared")
+
+    def __init__(self, fn_id, name, exception_safe, check_overflow, ret, args, fn, prepare, close, declared):
+        self.id = fn_id
+        self.name = name
+        self.exception_safe = exception_safe
+        self.check_overflow = check_overflow
+        self.ret = ret
+        self.args = args
+        self.fn = fn
+        self.prepare = prepare
+        self.close = close
+        # the properties declared at the end of the row, the undeclared ones take the defaults
+        self.declared = declared
+
+    @property
+    def has_varargs(self):
+        return "..." in self.args
+
+    @property
+    def fixed_args(self):
+        return [arg for arg in self.args if arg != "..."]
+
+    def __repr__(self):
+        return "FunctionRecord(%d, %s(%s))" % (self.id, self.name, ", ".join(self.args))
+
+
+class FunctionRegistry(object):
+    __slots__ = ("digest", "functions")
+
+    def __init__(self, digest, functions):
+        # sha256 of functions.py and this file
+        self.digest = digest
+        self.functions = functions
+
+
+def _check_bool(row, index, column, errors):
+    if not isinstance(row[index], bool):
+        errors.append("%s must be True or False" % column)
+
+
+def _check_symbol(row, index, column, errors, nullable):
+    value = row[index]
+    if nullable and value == "nullptr":
+        return
+    if not isinstance(value, str) or not symbol_pattern.match(value):
+        errors.append("%s must be a backend function like Class::function, not %r" % (column, value))
+
+
+def _check_properties(declared, ret, args, errors):
+    unknown = sorted(set(declared) - set(property_names))
+    if unknown:
+        errors.append("unknown properties: " + ", ".join(unknown))
+    deterministic = declared.get("deterministic", True)
+    constant_foldable = declared.get("constant_foldable", deterministic)
+    injective = declared.get("injective", False)
+    monotonic = declared.get("monotonic", [])
+    dict_optimizable = declared.get("dict_optimizable", False)
+    null_handling = declared.get("null_handling", "custom")
+    selection_vector = declared.get("selection_vector", False)
+    constant_specialized = declared.get("constant_specialized", False)
+    fixed_args = [arg for arg in args if arg != "..."]
+
+    for name, value in [("deterministic", deterministic), ("constant_foldable", constant_foldable),
+                        ("injective", injective), ("dict_optimizable", dict_optimizable),
+                        ("selection_vector", selection_vector), ("constant_specialized", constant_specialized)]:
+        if not isinstance(value, bool):
+            errors.append("%s must be True or False" % name)
+    if not isinstance(monotonic, list) or any(m not in monotonicity_values for m in monotonic):
+        errors.append("monotonic must be a list of \"increasing\", \"decreasing\" or None")
+        monotonic = []
+    if len(monotonic) > len(fixed_args):
+        errors.append("monotonic is declared for more arguments than the function has")
+    if len(monotonic) > max_monotonic_args:
+        errors.append("monotonic can only be declared for the first %d arguments" % max_monotonic_args)
+    if null_handling not in null_handling_values:
+        errors.append("null_handling must be one of " + ", ".join(null_handling_values))
+    if null_handling == "strict" and not fixed_args:
+        errors.append("a function without arguments can't be strict, it's never_null or custom")
+    if null_handling == "strict" and isinstance(ret, str) and ret.startswith("DECIMAL"):
+        errors.append("a decimal function may overflow to null, it can't be strict")
+    if not deterministic and constant_foldable:
+        errors.append("a non deterministic function can't be constant foldable")
+    if not deterministic and (injective or any(monotonic)):
+        errors.append("a non deterministic function can't be injective or monotonic")
+    if not deterministic and dict_optimizable:
+        errors.append("a non deterministic function can't be evaluated on the global dict")
+    if constant_specialized is True and not args:
+        errors.append("a function without arguments can't have a specialization for constant arguments")
+
+
+def parse_row(row):
+    """ returns the record of a row of functions.py and the errors of the row, the record is None if there are any """
+    errors = []
+    if not isinstance(row, list):
+        return None, ["a function must be a list"]
+    declared = row[-1] if row and isinstance(row[-1], dict) else None
+    columns = row[:-1] if declared is not None else row
+    # the rows of get_json_int have an unused trailing flag
+    if len(columns) == 10 and isinstance(columns[9], bool):
+        columns = columns[:9]
+    if len(columns) not in (7, 9):
+        return None, ["a function must have 7 columns, or 9 with prepare and close, not %d" % len(columns)]
+
+    if not isinstance(columns[0], int) or isinstance(columns[0], bool) or columns[0] <= 0:
+        errors.append("id must be a positive integer")
+    if not isinstance(columns[1], str) or not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", columns[1]):
+        errors.append("name must be an identifier")
+    _check_bool(columns, 2, "exception_safe", errors)
+    _check_bool(columns, 3, "check_overflow", errors)
+    if not isinstance(columns[4], str) or not type_pattern.match(columns[4]):
+        errors.append("return type must be a type name, not %r" % (columns[4],))
+    args = columns[5]
+    if not isinstance(args, list) or any(not isinstance(arg, str) for arg in args):
+        errors.append("arguments must be a list of type names")
+        args = []
+    for i, arg in enumerate(args):
+        if arg == "...":
+            if i != len(args) - 1:
+                errors.append("variadic parameter must be at the end")
+            elif i == 0:
+                errors.append("variadic parameter must follow an argument")
+        elif not type_pattern.match(arg):
+            errors.append("argument %d must be a type name, not %r" % (i, arg))
+    _check_symbol(columns, 6, "backend function", errors, True)
+    if len(columns) == 9:
+        _check_symbol(columns, 7, "prepare function", errors, True)
+        _check_symbol(columns, 8, "close function", errors, True)
+    _check_properties(declared or dict(), columns[4], args, errors)
+
+    if errors:
+        return None, errors
+    prepare, close = (columns[7], columns[8]) if len(columns) == 9 else (None, None)
+    return FunctionRecord(columns[0], columns[1], columns[2], columns[3], columns[4], list(args), columns[6],
+                          prepare, close, dict(declared or dict())), []
+
+
+def parse(rows):
+    """ returns the records of the rows of functions.py, raises FunctionRegistryError with the errors of all rows """
+    errors = []
+    records = []
+    ids = dict()
+    signatures = dict()
+    for index, row in enumerate(rows):
+        record, row_errors = parse_row(row)
+        errors.extend(["row %d %s: %s" % (index, _describe(row), error) for error in row_errors])
+        if record is None:
+            continue
+        signature = "%s#%s#(%s)" % (record.ret, record.name, ", ".join(record.args))
+        if record.id in ids:
+            errors.append("row %d %r: duplicated function id of %r" % (index, record, ids[record.id]))
+        elif signature in signatures:
+            errors.append("row %d %r: duplicated function signature of %r" % (index, record, signatures[signature]))
+        ids.setdefault(record.id, record)
+        signatures.setdefault(signature, record)
+        records.append(record)
+    if errors:
+        raise FunctionRegistryError(errors)
+    return records
+
+
+def _describe(row):
+    return repr(row[:2]) if isinstance(row, list) else repr(row)
+
+
+def get_digest(functions_path):
+    sha256 = hashlib.sha256()
+    for path in [functions_path, os.path.abspath(__file__)]:
+        with open(path, "rb") as f:
+            sha256.update(f.read())
+    return sha256.hexdigest()
+
+
+def _read_rows(functions_path):
+    spec = importlib.util.spec_from_file_location("functions", functions_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.vectorized_functions
+
+
+def load(functions_path=FUNCTIONS_PATH, cache_dir=CACHE_DIR):
+    """
+    returns the FunctionRegistry of functions_path, from the cache in cache_dir if it's parsed before,
+    cache_dir None disables the cache. Raises FunctionRegistryError if the function list is invalid.
+    """
+    digest = get_digest(functions_path)
+    cache_path = os.path.join(cache_dir, "functions_%s.pickle" % digest) if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                registry = pickle.load(f)
+            if isinstance(registry, FunctionRegistry) and registry.digest == digest:
+                return registry
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass
+
+    registry = FunctionRegistry(digest, parse(_read_rows(functions_path)))
+    if cache_path:
+        _write_cache(cache_dir, cache_path, registry)
+    return registry
+
+
+def _write_cache(cache_dir, cache_path, registry):
+    """ the cache is only an optimization, a cache which can't be written is ignored """
+    tmp_path = None
+    try:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".functions_")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(registry, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+        for stale in os.listdir(cache_dir):
+            if stale.startswith("functions_") and os.path.join(cache_dir, stale) != cache_path:
+                os.remove(os.path.join(cache_dir, stale))
+    except (OSError, pickle.PicklingError):
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def load_or_exit(functions_path=FUNCTIONS_PATH, cache_dir=CACHE_DIR):
+    """ load for the generators, prints every error of the function list and exits if it's invalid """
+    try:
+        return load(functions_path, cache_dir)
+    except FunctionRegistryError as e:
+        print("=================================================================")
+        print("Invalid functions in %s:" % functions_path)
+        for error in e.errors:
+            print("\t" + error)
+        print("=================================================================")
+        exit(1)
@@ -20,9 +20,29 @@
 #   <function id> <name>, <exception_safe>, <check_overflow>, <return_type>, [<args>], <backend fn>
 # With an optional
 #   <prepare fn>, <close fn>
+# and an optional dict of properties at the end, the undeclared ones take the defaults:
+#   "deterministic": False if the function may return different results for the same arguments, default True
+#   "constant_foldable": False if the function must not be evaluated at plan time, default the same as deterministic
+#   "injective": True if different arguments always give different results, default False
+#   "monotonic": ["increasing" | "decreasing" | None, ...] for every argument in order, default not monotonic.
+#                The planner only treats a call as monotonic if its arguments declared None are constant. Don't
+#                declare an argument which can overflow the result to null, e.g. the interval of days_add.
+#   "dict_optimizable": True if the function can be evaluated on the global dict of a low cardinality string
+#                       column instead of the column data, default False. gen_functions.py reports the VARCHAR to
+#                       VARCHAR functions which don't declare it, declare False for the ones which can't be.
+#   "null_handling": "strict" if the result is null if and only if any argument is null,
+#                    "never_null" if the result is never null, default "custom" for any other null handling.
+#                    A decimal function which may overflow to null isn't strict.
+#   "selection_vector": True if the backend function can evaluate only the rows of a selection vector, so the
+#                       filtered rows aren't materialized before it's called, default False
+#   "constant_specialized": True if the backend function has a specialization for constant arguments, so the
+#                           constant columns aren't unpacked before it's called, default False
+# gen_functions.py --capability_report prints the coverage of dict_optimizable, selection_vector and
+# constant_specialized by function module.
 #
 # example:
 #   [1, "add", "TINYINT", ["TINYINT", "TINYINT"], "Math::add", "Math::add_prepare", "Math::add_close"]
+#   [2, "negative", "INT", ["INT"], "Math::negative", {"monotonic": ["decreasing"], "injective": True}]
 #
 # the id rule: {module function group}|0|{function group}|{sub-function/alias-function}
 #
@@ -31,47 +51,51 @@
 #                   {math function} {function group} {sub-function}
 vectorized_functions = [
     # 10xxx: math functions
-    [10010, "pi", True, False, "DOUBLE", [], "MathFunctions::pi"],
-    [10020, "e", True, False, "DOUBLE", [], "MathFunctions::e"],
-    [10030, "sign", True, False, "FLOAT", ["DOUBLE"], "MathFunctions::sign"],
-
-    [10040, "abs", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::abs_double"],
-    [10041, "abs", True, False, "FLOAT", ["FLOAT"], "MathFunctions::abs_float"],
-    [10042, "abs", True, False, "LARGEINT", ["LARGEINT"], "MathFunctions::abs_largeint"],
-    [10043, "abs", True, False, "LARGEINT", ["BIGINT"], "MathFunctions::abs_bigint"],
-    [10044, "abs", True, False, "BIGINT", ["INT"], "MathFunctions::abs_int"],
-    [10045, "abs", True, False, "INT", ["SMALLINT"], "MathFunctions::abs_smallint"],
-    [10046, "abs", True, False, "SMALLINT", ["TINYINT"], "MathFunctions::abs_tinyint"],
-    [10047, "abs", True, False, "DECIMALV2", ["DECIMALV2"], "MathFunctions::abs_decimalv2val"],
-    [100470, "abs", True, False, "DECIMAL32", ["DECIMAL32"], "MathFunctions::abs_decimal32"],
-    [100471, "abs", True, False, "DECIMAL64", ["DECIMAL64"], "MathFunctions::abs_decimal64"],
-    [100472, "abs", True, False, "DECIMAL128", ["DECIMAL128"], "MathFunctions::abs_decimal128"],
-
-    [10050, "sin", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::sin"],
+    [10010, "pi", True, False, "DOUBLE", [], "MathFunctions::pi", {"null_handling": "never_null"}],
+    [10020, "e", True, False, "DOUBLE", [], "MathFunctions::e", {"null_handling": "never_null"}],
+    [10030, "sign", True, False, "FLOAT", ["DOUBLE"], "MathFunctions::sign", {"null_handling": "strict"}],
+
+    [10040, "abs", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::abs_double", {"null_handling": "strict"}],
+    [10041, "abs", True, False, "FLOAT", ["FLOAT"], "MathFunctions::abs_float", {"null_handling": "strict"}],
+    [10042, "abs", True, False, "LARGEINT", ["LARGEINT"], "MathFunctions::abs_largeint", {"null_handling": "strict"}],
+    [10043, "abs", True, False, "LARGEINT", ["BIGINT"], "MathFunctions::abs_bigint", {"null_handling": "strict"}],
+    [10044, "abs", True, False, "BIGINT", ["INT"], "MathFunctions::abs_int", {"null_handling": "strict"}],
+    [10045, "abs", True, False, "INT", ["SMALLINT"], "MathFunctions::abs_smallint", {"null_handling": "strict"}],
+    [10046, "abs", True, False, "SMALLINT", ["TINYINT"], "MathFunctions::abs_tinyint", {"null_handling": "strict"}],
+    [10047, "abs", True, False, "DECIMALV2", ["DECIMALV2"], "MathFunctions::abs_decimalv2val",
+     {"null_handling": "custom"}],
+    [100470, "abs", True, False, "DECIMAL32", ["DECIMAL32"], "MathFunctions::abs_decimal32",
+     {"null_handling": "custom"}],
+    [100471, "abs", True, False, "DECIMAL64", ["DECIMAL64"], "MathFunctions::abs_decimal64",
+     {"null_handling": "custom"}],
+    [100472, "abs", True, False, "DECIMAL128", ["DECIMAL128"], "MathFunctions::abs_decimal128",
+     {"null_handling": "custom"}],
+
+    [10050, "sin", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::sin", {"null_handling": "strict"}],
     [10060, "asin", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::asin"],
     [10061, "sinh", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::sinh"],
-    [10070, "cos", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::cos"],
+    [10070, "cos", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::cos", {"null_handling": "strict"}],
     [10080, "acos", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::acos"],
     [10081, "cosh", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::cosh"],
     [10090, "tan", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::tan"],
-    [10100, "atan", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::atan"],
-    [10101, "tanh", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::tanh"],
+    [10100, "atan", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::atan", {"null_handling": "strict"}],
+    [10101, "tanh", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::tanh", {"null_handling": "strict"}],
 
     #   cosine function
     [10102, "cosine_similarity", True, False, "FLOAT", ["ARRAY_FLOAT", "ARRAY_FLOAT"], "MathFunctions::cosine_similarity<TYPE_FLOAT, false>"],
     [10103, "cosine_similarity_norm", True, False, "FLOAT", ["ARRAY_FLOAT", "ARRAY_FLOAT"], "MathFunctions::cosine_similarity<TYPE_FLOAT, true>"],
     [10106, "approx_cosine_similarity", True, False, "FLOAT", ["ARRAY_FLOAT", "ARRAY_FLOAT"], "MathFunctions::cosine_similarity<TYPE_FLOAT, false>"],
 
-    [10110, "ceil", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::ceil"],
-    [10111, "ceiling", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::ceil"],
-    [10112, "dceil", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::ceil"],
+    [10110, "ceil", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::ceil", {"monotonic": ["increasing"]}],
+    [10111, "ceiling", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::ceil", {"monotonic": ["increasing"]}],
+    [10112, "dceil", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::ceil", {"monotonic": ["increasing"]}],
 
     #   l2 function
     [10114, "l2_distance", True, False, "FLOAT", ["ARRAY_FLOAT", "ARRAY_FLOAT"], "MathFunctions::l2_distance<TYPE_FLOAT>"],
     [10116, "approx_l2_distance", True, False, "FLOAT", ["ARRAY_FLOAT", "ARRAY_FLOAT"], "MathFunctions::l2_distance<TYPE_FLOAT>"],
 
-    [10120, "floor", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::floor"],
-    [10121, "dfloor", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::floor"],
+    [10120, "floor", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::floor", {"monotonic": ["increasing"]}],
+    [10121, "dfloor", True, False, "BIGINT", ["DOUBLE"], "MathFunctions::floor", {"monotonic": ["increasing"]}],
 
     [10125, "dround", True, False, "DECIMAL128", ["DECIMAL128"], "MathFunctions::round_decimal128"],
     [10126, "dround", True, False, "DECIMAL128", ["DECIMAL128", "INT"], "MathFunctions::round_up_to_decimal128"],
@@ -136,12 +160,18 @@ vectorized_functions = [
     [102621, "positive", True, False, "DECIMAL64", ["DECIMAL64"], "MathFunctions::positive<TYPE_DECIMAL64>"],
     [102622, "positive", True, False, "DECIMAL128", ["DECIMAL128"], "MathFunctions::positive<TYPE_DECIMAL128>"],
 
-    [10270, "negative", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::negative<TYPE_DOUBLE>"],
-    [10271, "negative", True, False, "BIGINT", ["BIGINT"], "MathFunctions::negative<TYPE_BIGINT>"],
-    [10272, "negative", True, False, "DECIMALV2", ["DECIMALV2"], "MathFunctions::negative<TYPE_DECIMALV2>"],
-    [102720, "negative", True, False, "DECIMAL32", ["DECIMAL32"], "MathFunctions::negative<TYPE_DECIMAL32>"],
-    [102721, "negative", True, False, "DECIMAL64", ["DECIMAL64"], "MathFunctions::negative<TYPE_DECIMAL64>"],
-    [102722, "negative", True, False, "DECIMAL128", ["DECIMAL128"], "MathFunctions::negative<TYPE_DECIMAL128>"],
+    [10270, "negative", True, False, "DOUBLE", ["DOUBLE"], "MathFunctions::negative<TYPE_DOUBLE>",
+ {"monotonic": ["decreasing"], "injective": True, "null_handling": "strict"}],
+    [10271, "negative", True, False, "BIGINT", ["BIGINT"], "MathFunctions::negative<TYPE_BIGINT>",
+ {"monotonic": ["decreasing"], "injective": True, "null_handling": "strict"}],
+    [10272, "negative", True, False, "DECIMALV2", ["DECIMALV2"], "MathFunctions::negative<TYPE_DECIMALV2>",
+ {"monotonic": ["decreasing"], "injective": True, "null_handling": "custom"}],
+    [102720, "negative", True, False, "DECIMAL32", ["DECIMAL32"], "MathFunctions::negative<TYPE_DECIMAL32>",
+ {"monotonic": ["decreasing"], "injective": True, "null_handling": "custom"}],
+    [102721, "negative", True, False, "DECIMAL64", ["DECIMAL64"], "MathFunctions::negative<TYPE_DECIMAL64>",
+ {"monotonic": ["decreasing"], "injective": True, "null_handling": "custom"}],
+    [102722, "negative", True, False, "DECIMAL128", ["DECIMAL128"], "MathFunctions::negative<TYPE_DECIMAL128>",
+ {"monotonic": ["decreasing"], "injective": True, "null_handling": "custom"}],
 
     [10280, "least", True, False, "TINYINT", ["TINYINT", "..."], "MathFunctions::least<TYPE_TINYINT>"],
     [10281, "least", True, False, "SMALLINT", ["SMALLINT", "..."], "MathFunctions::least<TYPE_SMALLINT>"],
@@ -172,19 +202,22 @@ vectorized_functions = [
     [10299, "greatest", True, False, "VARCHAR", ["VARCHAR", "..."], "MathFunctions::greatest<TYPE_VARCHAR>"],
 
     [10300, "rand", True, False, "DOUBLE", [], "MathFunctions::rand", "MathFunctions::rand_prepare",
-     "MathFunctions::rand_close"],
+     "MathFunctions::rand_close", {"deterministic": False}],
     [10301, "random", True, False, "DOUBLE", [], "MathFunctions::rand", "MathFunctions::rand_prepare",
-     "MathFunctions::rand_close"],
+     "MathFunctions::rand_close", {"deterministic": False}],
     [10302, "rand", True, False, "DOUBLE", ["BIGINT"], "MathFunctions::rand_seed", "MathFunctions::rand_prepare",
-     "MathFunctions::rand_close"],
+     "MathFunctions::rand_close", {"deterministic": False}],
     [10303, "random", True, False, "DOUBLE", ["BIGINT"], "MathFunctions::rand_seed", "MathFunctions::rand_prepare",
-     "MathFunctions::rand_close"],
+     "MathFunctions::rand_close", {"deterministic": False}],
 
     [10311, "bin", True, False, "VARCHAR", ['BIGINT'], "MathFunctions::bin"],
 
-    [10312, "hex", True, False, "VARCHAR", ['BIGINT'], "StringFunctions::hex_int"],
-    [10313, "hex", True, False, "VARCHAR", ['VARCHAR'], "StringFunctions::hex_string"],
-    [10323, "hex", True, False, "VARCHAR", ['VARBINARY'], "StringFunctions::hex_string"],
+    [10312, "hex", True, False, "VARCHAR", ['BIGINT'], "StringFunctions::hex_int",
+     {"injective": True, "dict_optimizable": True}],
+    [10313, "hex", True, False, "VARCHAR", ['VARCHAR'], "StringFunctions::hex_string",
+     {"injective": True, "dict_optimizable": True}],
+    [10323, "hex", True, False, "VARCHAR", ['VARBINARY'], "StringFunctions::hex_string",
+     {"injective": True, "dict_optimizable": True}],
     [10314, "unhex", True, False, "VARCHAR", ['VARCHAR'], "StringFunctions::unhex"],
     [10315, "sm3", True, False, "VARCHAR", ['VARCHAR'], "StringFunctions::sm3"],
     [10316, "hex_decode_binary", True, False, "VARBINARY", ['VARCHAR'], "StringFunctions::unhex"],
@@ -203,7 +236,7 @@ vectorized_functions = [
     [10343, '__iceberg_transform_truncate', True, False, 'DECIMAL64', ['DECIMAL64', 'INT'], 'MathFunctions::iceberg_truncate_decimal<TYPE_DECIMAL64>'],
     [10344, '__iceberg_transform_truncate', True, False, 'DECIMAL128', ['DECIMAL128', 'INT'], 'MathFunctions::iceberg_truncate_decimal<TYPE_DECIMAL128>'],
     [10345, '__iceberg_transform_truncate', True, False, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::left',
-     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close'],
+     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close', {"dict_optimizable": True}],
     [10346, '__iceberg_transform_truncate', True, False, 'VARBINARY', ['VARBINARY', 'INT'], 'BinaryFunctions::iceberg_truncate_binary'],
      
 
@@ -274,23 +307,23 @@ vectorized_functions = [
 
     # 30xxx: string functions
     [30010, 'substr', True, False, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::substring',
-     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close'],
+     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close', {"dict_optimizable": True}],
     [30011, 'substr', True, False, 'VARCHAR', ['VARCHAR', 'INT', 'INT'], 'StringFunctions::substring',
-     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close'],
+     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close', {"dict_optimizable": True}],
     [30012, 'substring', True, False, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::substring',
-     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close'],
+     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close', {"dict_optimizable": True}],
     [30013, 'substring', True, False, 'VARCHAR', ['VARCHAR', 'INT', 'INT'], 'StringFunctions::substring',
-     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close'],
+     'StringFunctions::sub_str_prepare', 'StringFunctions::sub_str_close', {"dict_optimizable": True}],
 
     [30020, 'left', True, False, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::left',
-     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close'],
+     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close', {"dict_optimizable": True}],
     [30021, 'strleft', True, False, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::left',
-     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close'],
+     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close', {"dict_optimizable": True}],
 
     [30030, 'right', True, False, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::right',
-     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close'],
+     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close', {"dict_optimizable": True}],
     [30031, 'strright', True, False, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::right',
-     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close'],
+     'StringFunctions::left_or_right_prepare', 'StringFunctions::left_or_right_close', {"dict_optimizable": True}],
 
     [30040, 'ends_with', True, False, 'BOOLEAN', ['VARCHAR', 'VARCHAR'], 'StringFunctions::ends_with'],
     [30050, 'starts_with', True, False, 'BOOLEAN', ['VARCHAR', 'VARCHAR'], 'StringFunctions::starts_with'],
@@ -298,42 +331,47 @@ vectorized_functions = [
     [30060, 'null_or_empty', True, False, 'BOOLEAN', ['VARCHAR'], 'StringFunctions::null_or_empty'],
 
     [30070, 'space', True, True, 'VARCHAR', ['INT'], 'StringFunctions::space'],
-    [30080, 'repeat', True, True, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::repeat'],
+    [30080, 'repeat', True, True, 'VARCHAR', ['VARCHAR', 'INT'], 'StringFunctions::repeat', {"dict_optimizable": True}],
 
     [30090, 'lpad', True, False, 'VARCHAR', ['VARCHAR', 'INT', 'VARCHAR'], 'StringFunctions::lpad',
-     'StringFunctions::pad_prepare', 'StringFunctions::pad_close'],
+     'StringFunctions::pad_prepare', 'StringFunctions::pad_close', {"dict_optimizable": True}],
     [30100, 'rpad', True, False, 'VARCHAR', ['VARCHAR', 'INT', 'VARCHAR'], 'StringFunctions::rpad',
-     'StringFunctions::pad_prepare', 'StringFunctions::pad_close'],
+     'StringFunctions::pad_prepare', 'StringFunctions::pad_close', {"dict_optimizable": True}],
 
     [30110, 'append_trailing_char_if_absent', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR'],
-     'StringFunctions::append_trailing_char_if_absent'],
+     'StringFunctions::append_trailing_char_if_absent', {"dict_optimizable": True}],
 
     [30120, 'length', True, False, 'INT', ['VARCHAR'], 'StringFunctions::length'],
     [30130, 'char_length', True, False, 'INT', ['VARCHAR'], 'StringFunctions::utf8_length'],
     [30131, 'character_length', True, False, 'INT', ['VARCHAR'], 'StringFunctions::utf8_length'],
     [30132, 'inet_aton', True, False, 'BIGINT', ['VARCHAR'], 'StringFunctions::inet_aton'],
 
-    [30140, 'lower', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::lower', 'StringFunctions::lower_prepare', 'StringFunctions::lower_close'],
-    [30141, 'lcase', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::lower', 'StringFunctions::lower_prepare', 'StringFunctions::lower_close'],
+    [30140, 'lower', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::lower', 'StringFunctions::lower_prepare', 'StringFunctions::lower_close',
+ {"dict_optimizable": True, "null_handling": "strict"}],
+    [30141, 'lcase', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::lower', 'StringFunctions::lower_prepare', 'StringFunctions::lower_close',
+ {"dict_optimizable": True, "null_handling": "strict"}],
 
 
-    [30150, 'upper', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::upper', 'StringFunctions::upper_prepare', 'StringFunctions::upper_close'],
-    [30151, 'ucase', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::upper', 'StringFunctions::upper_prepare', 'StringFunctions::upper_close'],
+    [30150, 'upper', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::upper', 'StringFunctions::upper_prepare', 'StringFunctions::upper_close',
+ {"dict_optimizable": True, "null_handling": "strict"}],
+    [30151, 'ucase', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::upper', 'StringFunctions::upper_prepare', 'StringFunctions::upper_close',
+ {"dict_optimizable": True, "null_handling": "strict"}],
 
-    [30160, 'reverse', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::reverse'],
+    [30160, 'reverse', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::reverse',
+     {"injective": True, "dict_optimizable": True}],
 
     [30170, 'trim', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::trim',
-     'StringFunctions::trim_prepare', 'StringFunctions::trim_close'],
+     'StringFunctions::trim_prepare', 'StringFunctions::trim_close', {"dict_optimizable": True}],
     [30171, 'trim', True, False, 'VARCHAR', ['VARCHAR', 'VARCHAR'], 'StringFunctions::trim',
-     'StringFunctions::trim_prepare', 'StringFunctions::trim_close'],
+     'StringFunctions::trim_prepare', 'StringFunctions::trim_close', {"dict_optimizable": True}],
     [30180, 'ltrim', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::ltrim',
-     'StringFunctions::trim_prepare', 'StringFunctions::trim_close'],
+     'StringFunctions::trim_prepare', 'StringFunctions::trim_close', {"dict_optimizable": True}],
     [30181, 'ltrim', True, False, 'VARCHAR', ['VARCHAR', 'VARCHAR'], 'StringFunctions::ltrim',
-     'StringFunctions::trim_prepare', 'StringFunctions::trim_close'],
+     'StringFunctions::trim_prepare', 'StringFunctions::trim_close', {"dict_optimizable": True}],
     [30190, 'rtrim', True, False, 'VARCHAR', ['VARCHAR'], 'StringFunctions::rtrim',
-     'StringFunctions::trim_prepare', 'StringFunctions::trim_close'],
+     'StringFunctions::trim_prepare', 'StringFunctions::trim_close', {"dict_optimizable": True}],
     [30191, 'rtrim', True, False, 'VARCHAR', ['VARCHAR', 'VARCHAR'], 'StringFunctions::rtrim',
-     'StringFunctions::trim_prepare', 'StringFunctions::trim_close'],
+     'StringFunctions::trim_prepare', 'StringFunctions::trim_close', {"dict_optimizable": True}],
 
     [30200, 'ascii', True, False, 'INT', ['VARCHAR'], 'StringFunctions::ascii'],
     [30500, 'char', True, False, 'VARCHAR', ['INT'], "StringFunctions::get_char"],
@@ -342,16 +380,19 @@ vectorized_functions = [
     [30221, 'locate', True, False, 'INT', ['VARCHAR', 'VARCHAR', 'INT'], 'StringFunctions::locate_pos'],
 
     [30250, 'concat', True, True, 'VARCHAR', ['VARCHAR', '...'], 'StringFunctions::concat',
-     'StringFunctions::concat_prepare', 'StringFunctions::concat_close'],
+     'StringFunctions::concat_prepare', 'StringFunctions::concat_close', {"dict_optimizable": True}],
 
-    [30260, 'concat_ws', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR', '...'], 'StringFunctions::concat_ws'],
-    [30261, 'concat_ws', True, True, 'VARCHAR', ['VARCHAR', 'ARRAY_VARCHAR'], 'ArrayFunctions::array_concat_ws'],
+    [30260, 'concat_ws', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR', '...'], 'StringFunctions::concat_ws',
+     {"dict_optimizable": True}],
+    [30261, 'concat_ws', True, True, 'VARCHAR', ['VARCHAR', 'ARRAY_VARCHAR'], 'ArrayFunctions::array_concat_ws',
+     {"dict_optimizable": True}],
     [30270, 'find_in_set', True, False, 'INT', ['VARCHAR', 'VARCHAR'], 'StringFunctions::find_in_set'],
-    [30310, 'split_part', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR', 'INT'], 'StringFunctions::split_part'],
+    [30310, 'split_part', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR', 'INT'], 'StringFunctions::split_part',
+     {"dict_optimizable": True}],
     [30311, 'split', True, True, 'ARRAY_VARCHAR', ['VARCHAR', 'VARCHAR'], 'StringFunctions::split',
      'StringFunctions::split_prepare', 'StringFunctions::split_close'],
     [30312, 'substring_index', True, False, 'VARCHAR', ['VARCHAR', 'VARCHAR', 'INT'],
-     'StringFunctions::substring_index'],
+     'StringFunctions::substring_index', {"dict_optimizable": True}],
     # v1 is deprecated
     [30316, 'str_to_map', True, False, 'MAP_VARCHAR_VARCHAR', ['ARRAY_VARCHAR', 'VARCHAR'],
      'StringFunctions::str_to_map_v1'],
@@ -360,17 +401,17 @@ vectorized_functions = [
 
     [30320, 'regexp_extract', True, False, 'VARCHAR', ['VARCHAR', 'VARCHAR', 'BIGINT'],
      'StringFunctions::regexp_extract',
-     'StringFunctions::regexp_extract_prepare', 'StringFunctions::regexp_close'],
+     'StringFunctions::regexp_extract_prepare', 'StringFunctions::regexp_close', {"dict_optimizable": True}],
     [30321, 'regexp_extract_all', True, False, 'ARRAY_VARCHAR', ['VARCHAR', 'VARCHAR', 'BIGINT'],
      'StringFunctions::regexp_extract_all', 'StringFunctions::regexp_extract_prepare', 'StringFunctions::regexp_close'],
     [30330, 'regexp_replace', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR', 'VARCHAR'],
      'StringFunctions::regexp_replace',
-     'StringFunctions::regexp_replace_prepare', 'StringFunctions::regexp_close'],
+     'StringFunctions::regexp_replace_prepare', 'StringFunctions::regexp_close', {"dict_optimizable": True}],
     # @Deprecated: 'replace_old' will be deleted in the future version, keep it just for compatible
     [30331, 'replace_old', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR', 'VARCHAR'], 'StringFunctions::regexp_replace',
-     'StringFunctions::regexp_replace_prepare', 'StringFunctions::regexp_close'],
+     'StringFunctions::regexp_replace_prepare', 'StringFunctions::regexp_close', {"dict_optimizable": True}],
     [30332, 'replace', True, True, 'VARCHAR', ['VARCHAR', 'VARCHAR', 'VARCHAR'], 'StringFunctions::replace',
-     'StringFunctions::replace_prepare', 'StringFunctions::replace_close'],
+     'StringFunctions::replace_prepare', 'StringFunctions::replace_close', {"dict_optimizable": True}],
     [30333, 'regexp_split', True, True, 'ARRAY_VARCHAR', ['VARCHAR', 'VARCHAR'], 'StringFunctions::regexp_split',
      'StringFunctions::regexp_extract_prepare', 'StringFunctions::regexp_close'],
     [30334, 'regexp_split', True, True, 'ARRAY_VARCHAR', ['VARCHAR', 'VARCHAR', 'INT'], 'StringFunctions::regexp_split',
@@ -446,9 +487,12 @@ vectorized_functions = [
      'BinaryFunctions::from_binary_prepare', 'BinaryFunctions::from_binary_close'],
 
     # 50xxx: timestamp functions
-    [50008, 'year', True, False, 'SMALLINT', ['DATE'], 'TimeFunctions::yearV3'],
-    [50009, 'year', True, False, 'SMALLINT', ['DATETIME'], 'TimeFunctions::yearV2'],
-    [50010, 'year', True, False, 'INT', ['DATETIME'], 'TimeFunctions::year'],
+    [50008, 'year', True, False, 'SMALLINT', ['DATE'], 'TimeFunctions::yearV3',
+     {"monotonic": ["increasing"], "null_handling": "strict"}],
+    [50009, 'year', True, False, 'SMALLINT', ['DATETIME'], 'TimeFunctions::yearV2',
+     {"monotonic": ["increasing"], "null_handling": "strict"}],
+    [50010, 'year', True, False, 'INT', ['DATETIME'], 'TimeFunctions::year',
+     {"monotonic": ["increasing"], "null_handling": "strict"}],
     [50018, 'month', True, False, 'TINYINT', ['DATE'], 'TimeFunctions::monthV3'],
     [50019, 'month', True, False, 'TINYINT', ['DATETIME'], 'TimeFunctions::monthV2'],
     [50020, 'month', True, False, 'INT', ['DATETIME'], 'TimeFunctions::month'],
@@ -457,8 +501,10 @@ vectorized_functions = [
     [50041, 'dayofweek_iso', True, False, 'INT', ['DATETIME'], 'TimeFunctions::day_of_week_iso'],
     [50042, 'yearweek', True, False, 'INT', ['DATETIME'], 'TimeFunctions::year_week_with_default_mode'],
     [50043, 'yearweek', True, False, 'INT', ['DATETIME', 'INT'], 'TimeFunctions::year_week_with_mode'],
-    [50050, 'to_date', True, False, 'DATE', ['DATETIME'], 'TimeFunctions::to_date'],
-    [50051, 'date', True, False, 'DATE', ['DATETIME'], 'TimeFunctions::to_date'],
+    [50050, 'to_date', True, False, 'DATE', ['DATETIME'], 'TimeFunctions::to_date',
+     {"monotonic": ["increasing"], "null_handling": "strict"}],
+    [50051, 'date', True, False, 'DATE', ['DATETIME'], 'TimeFunctions::to_date',
+     {"monotonic": ["increasing"], "null_handling": "strict"}],
     [50052, 'to_tera_date', True, False, 'DATE', ['VARCHAR', 'VARCHAR'], 'TimeFunctions::to_tera_date',
      "TimeFunctions::to_tera_date_prepare", "TimeFunctions::to_tera_date_close"],
     [50053, 'to_tera_timestamp', True, False, 'DATETIME', ['VARCHAR', 'VARCHAR'], 'TimeFunctions::to_tera_timestamp',
@@ -482,7 +528,8 @@ vectorized_functions = [
     [50089, 'second', True, False, 'TINYINT', ['DATETIME'], 'TimeFunctions::secondV2'],
     [50090, 'second', True, False, 'INT', ['DATETIME'], 'TimeFunctions::second'],
 
-    [50110, 'years_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::years_add'],
+    [50110, 'years_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::years_add',
+     {"monotonic": ["increasing"]}],
     [50111, 'years_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::years_sub'],
     [50115, 'quarters_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::quarters_add'],
     [50116, 'quarters_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::quarters_sub'],
@@ -491,14 +538,20 @@ vectorized_functions = [
     [50122, 'add_months', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::months_add'],
     [50130, 'weeks_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::weeks_add'],
     [50131, 'weeks_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::weeks_sub'],
-    [50140, 'days_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_add'],
-    [50141, 'days_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_sub'],
+    [50140, 'days_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_add',
+     {"monotonic": ["increasing"]}],
+    [50141, 'days_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_sub',
+     {"monotonic": ["increasing"]}],
 
-    [50142, 'date_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_add'],
-    [50143, 'date_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_sub'],
+    [50142, 'date_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_add',
+     {"monotonic": ["increasing"]}],
+    [50143, 'date_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_sub',
+     {"monotonic": ["increasing"]}],
 
-    [50144, 'adddate', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_add'],
-    [50145, 'subdate', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_sub'],
+    [50144, 'adddate', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_add',
+     {"monotonic": ["increasing"]}],
+    [50145, 'subdate', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::days_sub',
+     {"monotonic": ["increasing"]}],
 
     [50150, 'hours_add', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::hours_add'],
     [50151, 'hours_sub', True, False, 'DATETIME', ['DATETIME', 'INT'], 'TimeFunctions::hours_sub'],
@@ -531,8 +584,8 @@ vectorized_functions = [
     [50211, 'current_time', True, False, 'TIME', [], 'TimeFunctions::curtime'],
     [50220, 'curdate', True, False, 'DATE', [], 'TimeFunctions::curdate'],
     [50221, 'current_date', True, False, 'DATE', [], 'TimeFunctions::curdate'],
-    [50230, 'from_days', True, False, 'DATE', ['INT'], 'TimeFunctions::from_days'],
-    [50231, 'to_days', True, False, 'INT', ['DATE'], 'TimeFunctions::to_days'],
+    [50230, 'from_days', True, False, 'DATE', ['INT'], 'TimeFunctions::from_days', {"monotonic": ["increasing"]}],
+    [50231, 'to_days', True, False, 'INT', ['DATE'], 'TimeFunctions::to_days', {"monotonic": ["increasing"]}],
     [50241, 'date_format', True, False, 'VARCHAR', ['DATETIME', 'VARCHAR'], 'TimeFunctions::datetime_format',
      'TimeFunctions::format_prepare', 'TimeFunctions::format_close'],
     [50242, 'date_format', True, False, 'VARCHAR', ['DATE', 'VARCHAR'], 'TimeFunctions::date_format',
@@ -591,9 +644,10 @@ vectorized_functions = [
     [50330, 'utc_timestamp', True, False, 'DATETIME', [], 'TimeFunctions::utc_timestamp'],
     [50331, 'utc_time', True, False, 'TIME', [], 'TimeFunctions::utc_time'],
     [50340, 'date_trunc', True, False, 'DATETIME', ['VARCHAR', 'DATETIME'], 'TimeFunctions::datetime_trunc',
-     'TimeFunctions::datetime_trunc_prepare', 'TimeFunctions::datetime_trunc_close'],
+     'TimeFunctions::datetime_trunc_prepare', 'TimeFunctions::datetime_trunc_close',
+     {"monotonic": [None, "increasing"]}],
     [50350, 'date_trunc', True, False, 'DATE', ['VARCHAR', 'DATE'], 'TimeFunctions::date_trunc',
-     'TimeFunctions::date_trunc_prepare', 'TimeFunctions::date_trunc_close'],
+     'TimeFunctions::date_trunc_prepare', 'TimeFunctions::date_trunc_close', {"monotonic": [None, "increasing"]}],
     [50360, 'timestamp', True, False, 'DATETIME', ['DATETIME'], 'TimeFunctions::timestamp'],
     [50370, 'date_slice', True, False, 'DATE', ['DATE', 'INT', 'VARCHAR'], 'TimeFunctions::time_slice',
      'TimeFunctions::time_slice_prepare', 'TimeFunctions::time_slice_close'],
@@ -636,29 +690,36 @@ vectorized_functions = [
     # execute all the children expressions ahead of time in function_call_expr, but condition
     # expressions may not need execute all children expressions if the condition be true ahead
     # of time
-    [70100, 'if', True, False, 'BOOLEAN', ['BOOLEAN', 'BOOLEAN', 'BOOLEAN'], 'nullptr'],
-    [70101, 'if', True, False, 'TINYINT', ['BOOLEAN', 'TINYINT', 'TINYINT'], 'nullptr'],
-    [70102, 'if', True, False, 'SMALLINT', ['BOOLEAN', 'SMALLINT', 'SMALLINT'], 'nullptr'],
-    [70103, 'if', True, False, 'INT', ['BOOLEAN', 'INT', 'INT'], 'nullptr'],
-    [70104, 'if', True, False, 'BIGINT', ['BOOLEAN', 'BIGINT', 'BIGINT'], 'nullptr'],
-    [70105, 'if', True, False, 'LARGEINT', ['BOOLEAN', 'LARGEINT', 'LARGEINT'], 'nullptr'],
-    [70106, 'if', True, False, 'FLOAT', ['BOOLEAN', 'FLOAT', 'FLOAT'], 'nullptr'],
-    [70107, 'if', True, False, 'DOUBLE', ['BOOLEAN', 'DOUBLE', 'DOUBLE'], 'nullptr'],
-    [70108, 'if', True, False, 'DATETIME', ['BOOLEAN', 'DATETIME', 'DATETIME'], 'nullptr'],
-    [70109, 'if', True, False, 'DATE', ['BOOLEAN', 'DATE', 'DATE'], 'nullptr'],
-    [70110, 'if', True, False, 'DECIMALV2', ['BOOLEAN', 'DECIMALV2', 'DECIMALV2'], 'nullptr'],
-    [701100, 'if', True, False, 'DECIMAL32', ['BOOLEAN', 'DECIMAL32', 'DECIMAL32'], 'nullptr'],
-    [701101, 'if', True, False, 'DECIMAL64', ['BOOLEAN', 'DECIMAL64', 'DECIMAL64'], 'nullptr'],
-    [701102, 'if', True, False, 'DECIMAL128', ['BOOLEAN', 'DECIMAL128', 'DECIMAL128'], 'nullptr'],
-    [70111, 'if', True, False, 'VARCHAR', ['BOOLEAN', 'VARCHAR', 'VARCHAR'], 'nullptr'],
-    [70112, 'if', True, False, 'BITMAP', ['BOOLEAN', 'BITMAP', 'BITMAP'], 'nullptr'],
-    [70113, 'if', True, False, 'PERCENTILE', ['BOOLEAN', 'PERCENTILE', 'PERCENTILE'], 'nullptr'],
-    [70114, 'if', True, False, 'HLL', ['BOOLEAN', 'HLL', 'HLL'], 'nullptr'],
-    [70115, 'if', True, False, 'TIME', ['BOOLEAN', 'TIME', 'TIME'], 'nullptr'],
-    [70116, 'if', True, False, 'ANY_ARRAY', ['BOOLEAN', 'ANY_ARRAY', 'ANY_ARRAY'], 'nullptr'],
-    [70117, 'if', True, False, 'ANY_MAP', ['BOOLEAN', 'ANY_MAP', 'ANY_MAP'], 'nullptr'],
-    [70118, 'if', True, False, 'ANY_STRUCT', ['BOOLEAN', 'ANY_STRUCT', 'ANY_STRUCT'], 'nullptr'],
-    [70119, 'if', True, False, 'JSON', ['BOOLEAN', 'JSON', 'JSON'], 'nullptr'],
+    [70100, 'if', True, False, 'BOOLEAN', ['BOOLEAN', 'BOOLEAN', 'BOOLEAN'], 'nullptr', {"dict_optimizable": True}],
+    [70101, 'if', True, False, 'TINYINT', ['BOOLEAN', 'TINYINT', 'TINYINT'], 'nullptr', {"dict_optimizable": True}],
+    [70102, 'if', True, False, 'SMALLINT', ['BOOLEAN', 'SMALLINT', 'SMALLINT'], 'nullptr', {"dict_optimizable": True}],
+    [70103, 'if', True, False, 'INT', ['BOOLEAN', 'INT', 'INT'], 'nullptr', {"dict_optimizable": True}],
+    [70104, 'if', True, False, 'BIGINT', ['BOOLEAN', 'BIGINT', 'BIGINT'], 'nullptr', {"dict_optimizable": True}],
+    [70105, 'if', True, False, 'LARGEINT', ['BOOLEAN', 'LARGEINT', 'LARGEINT'], 'nullptr', {"dict_optimizable": True}],
+    [70106, 'if', True, False, 'FLOAT', ['BOOLEAN', 'FLOAT', 'FLOAT'], 'nullptr', {"dict_optimizable": True}],
+    [70107, 'if', True, False, 'DOUBLE', ['BOOLEAN', 'DOUBLE', 'DOUBLE'], 'nullptr', {"dict_optimizable": True}],
+    [70108, 'if', True, False, 'DATETIME', ['BOOLEAN', 'DATETIME', 'DATETIME'], 'nullptr', {"dict_optimizable": True}],
+    [70109, 'if', True, False, 'DATE', ['BOOLEAN', 'DATE', 'DATE'], 'nullptr', {"dict_optimizable": True}],
+    [70110, 'if', True, False, 'DECIMALV2', ['BOOLEAN', 'DECIMALV2', 'DECIMALV2'], 'nullptr',
+     {"dict_optimizable": True}],
+    [701100, 'if', True, False, 'DECIMAL32', ['BOOLEAN', 'DECIMAL32', 'DECIMAL32'], 'nullptr',
+     {"dict_optimizable": True}],
+    [701101, 'if', True, False, 'DECIMAL64', ['BOOLEAN', 'DECIMAL64', 'DECIMAL64'], 'nullptr',
+     {"dict_optimizable": True}],
+    [701102, 'if', True, False, 'DECIMAL128', ['BOOLEAN', 'DECIMAL128', 'DECIMAL128'], 'nullptr',
+     {"dict_optimizable": True}],
+    [70111, 'if', True, False, 'VARCHAR', ['BOOLEAN', 'VARCHAR', 'VARCHAR'], 'nullptr', {"dict_optimizable": True}],
+    [70112, 'if', True, False, 'BITMAP', ['BOOLEAN', 'BITMAP', 'BITMAP'], 'nullptr', {"dict_optimizable": True}],
+    [70113, 'if', True, False, 'PERCENTILE', ['BOOLEAN', 'PERCENTILE', 'PERCENTILE'], 'nullptr',
+     {"dict_optimizable": True}],
+    [70114, 'if', True, False, 'HLL', ['BOOLEAN', 'HLL', 'HLL'], 'nullptr', {"dict_optimizable": True}],
+    [70115, 'if', True, False, 'TIME', ['BOOLEAN', 'TIME', 'TIME'], 'nullptr', {"dict_optimizable": True}],
+    [70116, 'if', True, False, 'ANY_ARRAY', ['BOOLEAN', 'ANY_ARRAY', 'ANY_ARRAY'], 'nullptr',
+     {"dict_optimizable": True}],
+    [70117, 'if', True, False, 'ANY_MAP', ['BOOLEAN', 'ANY_MAP', 'ANY_MAP'], 'nullptr', {"dict_optimizable": True}],
+    [70118, 'if', True, False, 'ANY_STRUCT', ['BOOLEAN', 'ANY_STRUCT', 'ANY_STRUCT'], 'nullptr',
+     {"dict_optimizable": True}],
+    [70119, 'if', True, False, 'JSON', ['BOOLEAN', 'JSON', 'JSON'], 'nullptr', {"dict_optimizable": True}],
 
     [70200, 'ifnull', True, False, 'BOOLEAN', ['BOOLEAN', 'BOOLEAN'], 'nullptr'],
     [70201, 'ifnull', True, False, 'TINYINT', ['TINYINT', 'TINYINT'], 'nullptr'],
@@ -785,12 +846,14 @@ vectorized_functions = [
 
 
     # Utility functions
-    [100011, 'sleep', True, False, 'BOOLEAN', ['INT'], "UtilityFunctions::sleep"],
+    [100011, 'sleep', True, False, 'BOOLEAN', ['INT'], "UtilityFunctions::sleep", {"deterministic": False}],
     [100012, 'version', True, False, 'VARCHAR', [], "UtilityFunctions::version"],
     [100013, 'current_version', True, False, 'VARCHAR', [], "UtilityFunctions::current_version"],
     [100014, 'last_query_id', True, False, 'VARCHAR', [], "UtilityFunctions::last_query_id"],
-    [100015, 'uuid', True, False, 'VARCHAR', [], "UtilityFunctions::uuid"],
-    [100016, 'uuid_numeric', True, False, 'LARGEINT', [], "UtilityFunctions::uuid_numeric"],
+    [100015, 'uuid', True, False, 'VARCHAR', [], "UtilityFunctions::uuid",
+     {"deterministic": False, "null_handling": "never_null"}],
+    [100016, 'uuid_numeric', True, False, 'LARGEINT', [], "UtilityFunctions::uuid_numeric",
+     {"deterministic": False, "null_handling": "never_null"}],
     [100017, 'assert_true', True, False, 'BOOLEAN', ['BOOLEAN'], 'UtilityFunctions::assert_true'],
     [100019, 'assert_true', True, False, 'BOOLEAN', ['BOOLEAN', "VARCHAR"], 'UtilityFunctions::assert_true'],
     [100018, 'host_name', True, False, 'VARCHAR', [], "UtilityFunctions::host_name"],
@@ -851,13 +914,13 @@ vectorized_functions = [
     [120120, "from_base64", False, False, "VARCHAR", ["VARCHAR"], "EncryptionFunctions::from_base64"],
     [120121, "base64_decode_binary", False, False, "VARBINARY", ["VARCHAR"], "EncryptionFunctions::from_base64"],
     [120122, "base64_decode_string", False, False, "VARCHAR", ["VARCHAR"], "EncryptionFunctions::from_base64"],
-    [120130, "to_base64", False, True, "VARCHAR", ["VARCHAR"], "EncryptionFunctions::to_base64"],
+    [120130, "to_base64", False, True, "VARCHAR", ["VARCHAR"], "EncryptionFunctions::to_base64", {"injective": True}],
     [120140, "md5", False, False, "VARCHAR", ["VARCHAR"], "EncryptionFunctions::md5"],
     [120150, "md5sum", False, False, "VARCHAR", ["VARCHAR", "..."], "EncryptionFunctions::md5sum"],
     [120151, "md5sum_numeric", False, False, "LARGEINT", ["VARCHAR", "..."], "EncryptionFunctions::md5sum_numeric"],
     [120160, "sha2", False, False, "VARCHAR", ["VARCHAR", "INT"], "EncryptionFunctions::sha2",
      "EncryptionFunctions::sha2_prepare", "EncryptionFunctions::sha2_close"],
-    [120161, "to_base64", False, True, "VARCHAR", ["VARBINARY"], "EncryptionFunctions::to_base64"],
+    [120161, "to_base64", False, True, "VARCHAR", ["VARBINARY"], "EncryptionFunctions::to_base64", {"injective": True}],
 
     # geo function
     [120000, "ST_Point", False, False, "VARCHAR", ["DOUBLE", "DOUBLE"], "GeoFunctions::st_point"],
@@ -1057,31 +1120,41 @@ vectorized_functions = [
     [150121, 'array_sort', True, False, 'ARRAY_DATE', ['ARRAY_DATE'], 'ArrayFunctions::array_sort<TYPE_DATE>'],
     [150122, 'array_sort', True, False, 'ARRAY_JSON', ['ARRAY_JSON'], 'ArrayFunctions::array_sort<TYPE_JSON>'],
 
-    [150130, 'reverse', True, False, 'ARRAY_BOOLEAN', ['ARRAY_BOOLEAN'], 'ArrayFunctions::array_reverse<TYPE_BOOLEAN>'],
-    [150131, 'reverse', True, False, 'ARRAY_TINYINT', ['ARRAY_TINYINT'], 'ArrayFunctions::array_reverse<TYPE_TINYINT>'],
+    [150130, 'reverse', True, False, 'ARRAY_BOOLEAN', ['ARRAY_BOOLEAN'], 'ArrayFunctions::array_reverse<TYPE_BOOLEAN>',
+     {"dict_optimizable": True}],
+    [150131, 'reverse', True, False, 'ARRAY_TINYINT', ['ARRAY_TINYINT'], 'ArrayFunctions::array_reverse<TYPE_TINYINT>',
+     {"dict_optimizable": True}],
     [150132, 'reverse', True, False, 'ARRAY_SMALLINT', ['ARRAY_SMALLINT'],
-     'ArrayFunctions::array_reverse<TYPE_SMALLINT>'],
-    [150133, 'reverse', True, False, 'ARRAY_INT', ['ARRAY_INT'], 'ArrayFunctions::array_reverse<TYPE_INT>'],
-    [150134, 'reverse', True, False, 'ARRAY_BIGINT', ['ARRAY_BIGINT'], 'ArrayFunctions::array_reverse<TYPE_BIGINT>'],
+     'ArrayFunctions::array_reverse<TYPE_SMALLINT>', {"dict_optimizable": True}],
+    [150133, 'reverse', True, False, 'ARRAY_INT', ['ARRAY_INT'], 'ArrayFunctions::array_reverse<TYPE_INT>',
+     {"dict_optimizable": True}],
+    [150134, 'reverse', True, False, 'ARRAY_BIGINT', ['ARRAY_BIGINT'], 'ArrayFunctions::array_reverse<TYPE_BIGINT>',
+     {"dict_optimizable": True}],
     [150135, 'reverse', True, False, 'ARRAY_LARGEINT', ['ARRAY_LARGEINT'],
-     'ArrayFunctions::array_reverse<TYPE_LARGEINT>'],
-    [150136, 'reverse', True, False, 'ARRAY_FLOAT', ['ARRAY_FLOAT'], 'ArrayFunctions::array_reverse<TYPE_FLOAT>'],
+     'ArrayFunctions::array_reverse<TYPE_LARGEINT>', {"dict_optimizable": True}],
+    [150136, 'reverse', True, False, 'ARRAY_FLOAT', ['ARRAY_FLOAT'], 'ArrayFunctions::array_reverse<TYPE_FLOAT>',
+     {"dict_optimizable": True}],
     [150143, 'reverse', True, False, 'ARRAY_DECIMAL32', ['ARRAY_DECIMAL32'],
-     'ArrayFunctions::array_reverse<TYPE_DECIMAL32>'],
+     'ArrayFunctions::array_reverse<TYPE_DECIMAL32>', {"dict_optimizable": True}],
     [150144, 'reverse', True, False, 'ARRAY_DECIMAL64', ['ARRAY_DECIMAL64'],
-     'ArrayFunctions::array_reverse<TYPE_DECIMAL64>'],
+     'ArrayFunctions::array_reverse<TYPE_DECIMAL64>', {"dict_optimizable": True}],
     [150145, 'reverse', True, False, 'ARRAY_DECIMAL128', ['ARRAY_DECIMAL128'],
-     'ArrayFunctions::array_reverse<TYPE_DECIMAL128>'],
-    [150137, 'reverse', True, False, 'ARRAY_DOUBLE', ['ARRAY_DOUBLE'], 'ArrayFunctions::array_reverse<TYPE_DOUBLE>'],
-    [150138, 'reverse', True, False, 'ARRAY_VARCHAR', ['ARRAY_VARCHAR'], 'ArrayFunctions::array_reverse<TYPE_VARCHAR>'],
+     'ArrayFunctions::array_reverse<TYPE_DECIMAL128>', {"dict_optimizable": True}],
+    [150137, 'reverse', True, False, 'ARRAY_DOUBLE', ['ARRAY_DOUBLE'], 'ArrayFunctions::array_reverse<TYPE_DOUBLE>',
+     {"dict_optimizable": True}],
+    [150138, 'reverse', True, False, 'ARRAY_VARCHAR', ['ARRAY_VARCHAR'], 'ArrayFunctions::array_reverse<TYPE_VARCHAR>',
+     {"dict_optimizable": True}],
     [150139, 'reverse', True, False, 'ARRAY_DECIMALV2', ['ARRAY_DECIMALV2'],
-     'ArrayFunctions::array_reverse<TYPE_DECIMALV2>'],
+     'ArrayFunctions::array_reverse<TYPE_DECIMALV2>', {"dict_optimizable": True}],
     [150140, 'reverse', True, False, 'ARRAY_DATETIME', ['ARRAY_DATETIME'],
-     'ArrayFunctions::array_reverse<TYPE_DATETIME>'],
-    [150141, 'reverse', True, False, 'ARRAY_DATE', ['ARRAY_DATE'], 'ArrayFunctions::array_reverse<TYPE_DATE>'],
-    [150142, 'reverse', True, False, 'ARRAY_JSON', ['ARRAY_JSON'], 'ArrayFunctions::array_reverse<TYPE_JSON>'],
-
-    [150146, 'reverse', True, False, 'ANY_ARRAY', ['ANY_ARRAY'], 'ArrayFunctions::array_reverse_any_types'],
+     'ArrayFunctions::array_reverse<TYPE_DATETIME>', {"dict_optimizable": True}],
+    [150141, 'reverse', True, False, 'ARRAY_DATE', ['ARRAY_DATE'], 'ArrayFunctions::array_reverse<TYPE_DATE>',
+     {"dict_optimizable": True}],
+    [150142, 'reverse', True, False, 'ARRAY_JSON', ['ARRAY_JSON'], 'ArrayFunctions::array_reverse<TYPE_JSON>',
+     {"dict_optimizable": True}],
+
+    [150146, 'reverse', True, False, 'ANY_ARRAY', ['ANY_ARRAY'], 'ArrayFunctions::array_reverse_any_types',
+     {"dict_optimizable": True}],
 
     [150150, 'array_join', True, True, 'VARCHAR', ['ARRAY_VARCHAR', 'VARCHAR'], 'ArrayFunctions::array_join'],
     [150151, 'array_join', True, True, 'VARCHAR', ['ARRAY_VARCHAR', 'VARCHAR', 'VARCHAR'],
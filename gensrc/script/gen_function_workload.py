@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generates a deterministic SQL corpus from functions.py to benchmark the FE planner on function heavy queries.
+Every vectorized builtin is called once with column arguments and once with literal arguments of its declared
+types. A function with several arguments is also called with a column first and literals after it, and with a
+literal first and columns after it, like date_trunc('month', col), which takes the constant and cast paths of
+the planner. Variadic functions are called with 1 and 3 variadic arguments, polymorphic functions with flat and with
+nested ARRAY/MAP/STRUCT types. The corpus starts with the CREATE TABLE of the columns it uses.
+
+Replay the corpus in FE without BE with FunctionWorkloadBenchTest, it reports queries/sec,
+p50/p99 planning latency and the allocation per query:
+
+    python3 gensrc/script/gen_function_workload.py --output /tmp/function_workload.sql
+    cd fe && mvn test -pl fe-core -Dtest=FunctionWorkloadBenchTest -Dfunction_workload=/tmp/function_workload.sql
+"""
+
+import argparse
+import sys
+
+import function_registry
+
+table_name = "function_workload"
+
+# the scalar types of functions.py with a column: (column type, literal)
+scalar_types = {
+    "BOOLEAN": ("BOOLEAN", "true"),
+    "TINYINT": ("TINYINT", "cast(1 as tinyint)"),
+    "SMALLINT": ("SMALLINT", "cast(2 as smallint)"),
+    "INT": ("INT", "cast(3 as int)"),
+    "BIGINT": ("BIGINT", "cast(4 as bigint)"),
+    "LARGEINT": ("LARGEINT", "cast(5 as largeint)"),
+    "FLOAT": ("FLOAT", "cast(1.5 as float)"),
+    "DOUBLE": ("DOUBLE", "cast(2.5 as double)"),
+    "DECIMALV2": ("DECIMALV2(27, 9)", "cast(3.5 as decimalv2(27, 9))"),
+    "DECIMAL32": ("DECIMAL32(9, 2)", "cast(4.5 as decimal32(9, 2))"),
+    "DECIMAL64": ("DECIMAL64(18, 4)", "cast(5.5 as decimal64(18, 4))"),
+    "DECIMAL128": ("DECIMAL128(38, 9)", "cast(6.5 as decimal128(38, 9))"),
+    "DATE": ("DATE", "cast('2024-01-02' as date)"),
+    "DATETIME": ("DATETIME", "cast('2024-01-02 03:04:05' as datetime)"),
+    "VARCHAR": ("VARCHAR(100)", "'starrocks'"),
+    "JSON": ("JSON", "parse_json('{\"a\": 1, \"b\": [1, 2]}')"),
+    "VARBINARY": ("VARBINARY", "to_binary('starrocks')"),
+}
+
+# the scalar types of functions.py which can't be a column of a duplicate key table, they are computed from
+# another column: (column expression, literal)
+computed_types = {
+    "TIME": ("sec_to_time(c_int)", "sec_to_time(3600)"),
+    "BITMAP": ("to_bitmap(c_bigint)", "bitmap_from_string('1,2,3')"),
+    "HLL": ("hll_hash(c_varchar)", "hll_hash('starrocks')"),
+    "PERCENTILE": ("percentile_hash(c_double)", "percentile_hash(2.5)"),
+}
+
+# A concrete type is a functions.py scalar type name, ("ARRAY", element), ("MAP", key, value) or
+# ("STRUCT", field, ...). The polymorphic types are bound to flat and to nested concrete types.
+polymorphic_bindings = [
+    {
+        "ANY_ELEMENT": "INT",
+        "ANY_ARRAY": ("ARRAY", "INT"),
+        "ANY_MAP": ("MAP", "INT", "VARCHAR"),
+        "ANY_STRUCT": ("STRUCT", "INT", "VARCHAR"),
+    },
+    {
+        "ANY_ELEMENT": ("ARRAY", "INT"),
+        "ANY_ARRAY": ("ARRAY", ("ARRAY", "INT")),
+        "ANY_MAP": ("MAP", "INT", ("ARRAY", "INT")),
+        "ANY_STRUCT": ("STRUCT", ("ARRAY", "INT"), ("MAP", "INT", "VARCHAR")),
+    },
+]
+
+# the variadic argument counts a variadic function is called with
+vararg_counts = [1, 3]
+
+
+def get_concrete_type(arg, binding):
+    if arg in binding:
+        return binding[arg]
+    if arg.startswith("ARRAY_"):
+        return "ARRAY", arg[len("ARRAY_"):]
+    if arg == "MAP_VARCHAR_VARCHAR":
+        return "MAP", "VARCHAR", "VARCHAR"
+    if arg not in scalar_types and arg not in computed_types:
+        raise ValueError("unsupported argument type " + arg)
+    return arg
+
+
+def get_type_token(t):
+    if isinstance(t, str):
+        return t.lower()
+    return "_".join([t[0].lower()] + [get_type_token(f) for f in t[1:]])
+
+
+def get_column_type(t):
+    if isinstance(t, str):
+        return scalar_types[t][0]
+    if t[0] == "ARRAY":
+        return "ARRAY<%s>" % get_column_type(t[1])
+    if t[0] == "MAP":
+        return "MAP<%s, %s>" % (get_column_type(t[1]), get_column_type(t[2]))
+    return "STRUCT<%s>" % ", ".join(["f%d %s" % (i, get_column_type(f)) for i, f in enumerate(t[1:])])
+
+
+def get_literal(t):
+    if isinstance(t, str):
+        return scalar_types[t][1] if t in scalar_types else computed_types[t][1]
+    if t[0] == "ARRAY":
+        return "[%s, %s]" % (get_literal(t[1]), get_literal(t[1]))
+    if t[0] == "MAP":
+        return "map{%s: %s}" % (get_literal(t[1]), get_literal(t[2]))
+    return "row(%s)" % ", ".join([get_literal(f) for f in t[1:]])
+
+
+def get_column(t, columns):
+    """ the column expression of t, adds the column it reads to columns """
+    if t in computed_types:
+        for dependency in ["INT", "BIGINT", "VARCHAR", "DOUBLE"]:
+            get_column(dependency, columns)
+        return computed_types[t][0]
+    if any(isinstance(f, str) and f in computed_types for f in ([] if isinstance(t, str) else t[1:])):
+        # a complex type of a computed type has no column, use the literal
+        return get_literal(t)
+    column = "c_" + get_type_token(t)
+    columns.setdefault(column, get_column_type(t))
+    return column
+
+
+def get_lambda(args):
+    """ the lambda argument of a higher order function, it takes an element of every array or a map entry """
+    if any(isinstance(arg, tuple) and arg[0] == "MAP" for arg in args):
+        return "(k, v) -> (k, v)"
+    arrays = [arg for arg in args if isinstance(arg, tuple) and arg[0] == "ARRAY"]
+    params = ["x%d" % i for i in range(len(arrays))]
+    return "(%s) -> %s" % (", ".join(params), params[0])
+
+
+def get_mixed_args(column_args, literal_args):
+    """ the mixed argument lists of a call: a column then literals, and a literal then columns """
+    values = [i for i, arg in enumerate(column_args) if arg != literal_args[i]]
+    if len(values) < 2:
+        return []
+    first = values[0]
+    return [[column_args[i] if i == first else literal_args[i] for i in range(len(column_args))],
+            [literal_args[i] if i == first else column_args[i] for i in range(len(column_args))]]
+
+
+def get_calls(record, columns):
+    """ the calls of a function in functions.py, with column, literal and mixed arguments """
+    name = record.name
+    declared = record.args
+    polymorphic = any(arg in polymorphic_bindings[0] for arg in declared)
+    calls = []
+    for binding in polymorphic_bindings if polymorphic else polymorphic_bindings[:1]:
+        fixed = [arg for arg in declared if arg != "..."]
+        arg_lists = [fixed]
+        if "..." in declared:
+            arg_lists = [fixed + [fixed[-1]] * (count - 1) for count in vararg_counts]
+        for arg_list in arg_lists:
+            types = [None if arg == "FUNCTION" else get_concrete_type(arg, binding) for arg in arg_list]
+            lambda_arg = get_lambda([t for t in types if t is not None]) if None in types else None
+            column_args = [lambda_arg if t is None else get_column(t, columns) for t in types]
+            literal_args = [lambda_arg if t is None else get_literal(t) for t in types]
+            calls.append("SELECT %s(%s) FROM %s" % (name, ", ".join(column_args), table_name))
+            calls.append("SELECT %s(%s)" % (name, ", ".join(literal_args)))
+            for mixed_args in get_mixed_args(column_args, literal_args):
+                calls.append("SELECT %s(%s) FROM %s" % (name, ", ".join(mixed_args), table_name))
+    return calls
+
+
+def generate_workload(records):
+    """ returns the CREATE TABLE and the queries, in functions.py order """
+    columns = {"c_int": "INT"}
+    queries = []
+    seen = set()
+    for record in records:
+        for query in get_calls(record, columns):
+            if query not in seen:
+                seen.add(query)
+                queries.append(query)
+
+    ddl = "CREATE TABLE %s (\n%s\n) DUPLICATE KEY(c_int)\nDISTRIBUTED BY HASH(c_int) BUCKETS 1\n" \
+          "PROPERTIES (\"replication_num\" = \"1\")" % (
+              table_name, ",\n".join(["    %s %s" % (c, t) for c, t in columns.items()]))
+    return ddl, queries
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate a SQL corpus calling every vectorized builtin function")
+    parser.add_argument("--output", dest="output", default=None, type=str,
+                        help="Path of the generated corpus, print it to stdout if not set")
+    args = parser.parse_args()
+
+    records = function_registry.load_or_exit().functions
+    ddl, queries = generate_workload(records)
+    lines = ["-- This is a generated file by gensrc/script/gen_function_workload.py, DO NOT EDIT.",
+             "-- %d queries over %d functions" % (len(queries), len(records)),
+             ddl + ";"] + [query + ";" for query in queries]
+    content = "\n".join(lines) + "\n"
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(content)
+    else:
+        sys.stdout.write(content)
@@ -18,12 +18,20 @@
 """
 
 import argparse
+import glob
+import hashlib
+import json
 import os
+import re
+import struct
 import sys
+import tempfile
+import time
 
 from string import Template
 
-import functions
+import exprs_symbols
+import function_registry
 
 sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
@@ -51,21 +59,251 @@ license_string = """
 java_template = Template("""
 ${license}
 
+// FINGERPRINT: ${fingerprint}
+
 package com.starrocks.builtins;
 
 import com.starrocks.catalog.FunctionSet;
 import com.starrocks.catalog.Type;
 
+import java.util.Arrays;
+
 public class VectorizedBuiltinFunctions {
+    // also stored in the binary function catalog, to tell whether the catalog matches these classes
+    public static final String FINGERPRINT = "${fingerprint}";
+
+    // the ids of all functions in ascending order, the index of an id is the slot of the function
+    private static final long[] FUNCTION_IDS = {
+        ${function_ids}
+    };
+
+    public static final int FUNCTION_COUNT = FUNCTION_IDS.length;
+
     public static void initBuiltins(FunctionSet functionSet) {
-        ${functions}
-  }
+        ${modules}
+    }
+
+    /**
+     * Returns the slot of a function id, a dense index in [0, FUNCTION_COUNT) to keep per function state
+     * in flat arrays, or -1 if id is not a vectorized builtin. The slots are ordered by the function ids.
+     */
+    public static int getSlot(long id) {
+        int slot = Arrays.binarySearch(FUNCTION_IDS, id);
+        return slot < 0 ? -1 : slot;
+    }
+
+    public static long getFunctionId(int slot) {
+        return FUNCTION_IDS[slot];
+    }
 }
 
 """)
 
+# one class per function module, every method stays far below HotSpot's 8000 bytes huge method limit
+# so the registration code is JIT-compiled during FE startup
+java_module_template = Template("""
+${license}
+
+// FINGERPRINT: ${fingerprint}
+
+package com.starrocks.builtins;
+
+import com.starrocks.catalog.FunctionSet;
+import com.starrocks.catalog.Type;
+
+class ${class_name} {
+    static void initBuiltins(FunctionSet functionSet) {
+        ${methods}
+    }
+${bodies}}
+
+""")
+
+java_method_template = Template("""
+    private static void ${method}(FunctionSet functionSet) {
+        ${functions}
+    }
+""")
+
+# max number of functions registered by one generated java method
+java_method_functions = 64
+
+# JMH benchmark of FunctionSet.getFunction, one lookup list per function name and kind of match
+java_benchmark_template = Template("""
+${license}
+
+// FINGERPRINT: ${fingerprint}
+
+package com.starrocks.benchmark;
+
+import com.google.common.collect.Lists;
+import com.starrocks.analysis.FunctionName;
+import com.starrocks.catalog.Function;
+import com.starrocks.catalog.FunctionSet;
+import com.starrocks.catalog.StructType;
+import com.starrocks.catalog.Type;
+import org.openjdk.jmh.annotations.Benchmark;
+import org.openjdk.jmh.annotations.BenchmarkMode;
+import org.openjdk.jmh.annotations.Fork;
+import org.openjdk.jmh.annotations.Measurement;
+import org.openjdk.jmh.annotations.Mode;
+import org.openjdk.jmh.annotations.OutputTimeUnit;
+import org.openjdk.jmh.annotations.Param;
+import org.openjdk.jmh.annotations.Scope;
+import org.openjdk.jmh.annotations.Setup;
+import org.openjdk.jmh.annotations.State;
+import org.openjdk.jmh.annotations.Warmup;
+import org.openjdk.jmh.runner.Runner;
+import org.openjdk.jmh.runner.RunnerException;
+import org.openjdk.jmh.runner.options.CommandLineOptionException;
+import org.openjdk.jmh.runner.options.CommandLineOptions;
+import org.openjdk.jmh.runner.options.Options;
+import org.openjdk.jmh.runner.options.OptionsBuilder;
+
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Benchmark the resolution of the vectorized builtins by {@link FunctionSet#getFunction} with every
+ * {@link Function.CompareMode}. A lookup is "name/kind", the kind is
+ *   exact:       the declared argument types of every overload of name
+ *   cast:        narrower argument types, which only match an overload through an implicit cast
+ *   polymorphic: concrete types in place of ANY_ELEMENT, ANY_ARRAY, ANY_MAP and ANY_STRUCT
+ * Every benchmark op resolves the next descriptor of the lookup, so the result is a ns/op table by
+ * function name, kind and compare mode. Restrict a run with e.g. -p lookup=array_sortby/polymorphic.
+ */
+@BenchmarkMode(Mode.AverageTime)
+@OutputTimeUnit(TimeUnit.NANOSECONDS)
+@State(Scope.Benchmark)
+@Fork(value = 1)
+@Warmup(iterations = 1, time = 1)
+@Measurement(iterations = 2, time = 1)
+public class BuiltinFunctionResolutionBench {
+    private static final Type STRUCT_INT_VARCHAR = new StructType(Lists.newArrayList(Type.INT, Type.VARCHAR));
+
+    @Param({${lookup_names}})
+    public String lookup;
+
+    @Param({"IS_IDENTICAL", "IS_INDISTINGUISHABLE", "IS_SUPERTYPE_OF", "IS_NONSTRICT_SUPERTYPE_OF"})
+    public Function.CompareMode mode;
+
+    private FunctionSet functionSet;
+    private Function[] descs;
+    private int next;
+
+    public static void main(String[] args) throws RunnerException, CommandLineOptionException {
+        Options opt = new OptionsBuilder()
+                .parent(new CommandLineOptions(args))
+                .include(BuiltinFunctionResolutionBench.class.getSimpleName())
+                .build();
+        new Runner(opt).run();
+    }
+
+    @Setup
+    public void setup() {
+        functionSet = new FunctionSet();
+        functionSet.init();
+        Map<String, List<Function>> lookups = new HashMap<>();
+        addLookups(lookups);
+        descs = lookups.get(lookup).toArray(new Function[0]);
+        next = 0;
+    }
+
+    @Benchmark
+    public Function getFunction() {
+        Function desc = descs[next];
+        next = next + 1 == descs.length ? 0 : next + 1;
+        return functionSet.getFunction(desc, mode);
+    }
+
+    private static void add(Map<String, List<Function>> lookups, String lookup, boolean hasVarArgs, Type... args) {
+        String name = lookup.substring(0, lookup.lastIndexOf('/'));
+        lookups.computeIfAbsent(lookup, k -> new ArrayList<>())
+                .add(new Function(new FunctionName(name), args, Type.INVALID, hasVarArgs));
+    }
+
+    private static void addLookups(Map<String, List<Function>> lookups) {
+        ${methods}
+    }
+${bodies}}
+
+""")
+
+java_benchmark_method_template = Template("""
+    private static void ${method}(Map<String, List<Function>> lookups) {
+        ${lookups}
+    }
+""")
+
+# the argument types of a cast lookup, each one implicitly casts to the declared type
+java_benchmark_cast_types = {
+    "SMALLINT": "TINYINT", "INT": "SMALLINT", "BIGINT": "INT", "LARGEINT": "BIGINT", "DOUBLE": "FLOAT",
+    "FLOAT": "SMALLINT", "DATETIME": "DATE", "VARCHAR": "CHAR",
+    "ARRAY_SMALLINT": "ARRAY_TINYINT", "ARRAY_INT": "ARRAY_SMALLINT", "ARRAY_BIGINT": "ARRAY_INT",
+    "ARRAY_LARGEINT": "ARRAY_BIGINT", "ARRAY_DOUBLE": "ARRAY_FLOAT", "ARRAY_DATETIME": "ARRAY_DATE",
+}
+# the argument types of a polymorphic lookup, as java expressions
+java_benchmark_polymorphic_types = {
+    "ANY_ELEMENT": "Type.INT", "ANY_ARRAY": "Type.ARRAY_INT", "ANY_MAP": "Type.MAP_VARCHAR_VARCHAR",
+    "ANY_STRUCT": "STRUCT_INT_VARCHAR",
+}
+
+# Binary function catalog loaded by FE instead of running VectorizedBuiltinFunctions, see BuiltinFunctionCatalog.java.
+# All integers are big endian.
+#   header:    magic, u16 version, u16 reserved, fingerprint (32 ascii bytes),
+#              u32 string count, u32 function count, u32 argument count, u32 name count, u32 cast count,
+#              u32 cast argument count
+#   strings:   u16 length + utf-8 bytes, the interned function names and type names
+#   functions: fixed width records in registration order,
+#              u64 id, u32 name, u16 flags, u16 return type, u32 first argument, u16 argument count,
+#              u16 alias, 1 + the index of the function it's an alias of or 0, an alias shares its arguments,
+#              u32 properties
+#   arguments: u16 type
+#   names:     the loader table FE uses to register the functions of one name on its first lookup,
+#              u32 name, u32 first name function, u16 function count, u16 cast count, u32 first cast
+#   name functions: u16 function index, the functions of every name in registration order
+#   casts:     the calls FunctionSet.getFunction resolves by an implicit cast, see get_cast_table,
+#              u16 index of the function in the functions of the name, u8 flags, u8 argument count,
+#              u32 first cast argument
+#   cast arguments: u16 type
+# A type is the string index of the name of its static field in com.starrocks.catalog.Type.
+catalog_magic = b"SRFC"
+catalog_version = 5
+catalog_header = struct.Struct(">4sHH32sIIIIII")
+catalog_function = struct.Struct(">QIHHIHHI")
+catalog_string_length = struct.Struct(">H")
+catalog_argument = struct.Struct(">H")
+catalog_name = struct.Struct(">IIHHI")
+catalog_name_function = struct.Struct(">H")
+catalog_cast = struct.Struct(">HBBI")
+catalog_cast_argument = struct.Struct(">H")
+catalog_flag_varargs = 0x1
+# the call is resolved by a strict cast, FunctionSet only uses the others for IS_NONSTRICT_SUPERTYPE_OF
+catalog_cast_flag_strict = 0x1
+
+# The optional properties of a function in functions.py are encoded as flags in the FE and BE tables,
+# the defaults encode to 0. Keep them the same as Function.java.
+property_non_deterministic = 0x1
+property_not_constant_foldable = 0x2
+property_injective = 0x4
+property_dict_optimizable = 0x8
+# 2 bits for the null handling
+property_null_handling_shift = 4
+property_null_handling = {"custom": 0, "strict": 1, "never_null": 2}
+# the capabilities of the backend function, BE skips materializing the filtered rows and the constant arguments
+property_selection_vector = 0x40
+property_constant_specialized = 0x80
+# 2 bits for the monotonicity of each of the first property_monotonic_args arguments
+property_monotonic_shift = 8
+property_monotonic_args = function_registry.max_monotonic_args
+property_monotonicity = {None: 0, "increasing": 1, "decreasing": 2}
+
 cpp_template = Template("""
 ${license}
+// FINGERPRINT: ${fingerprint}
 
 #include "exprs/array_functions.h"
 #include "exprs/builtin_functions.h"
@@ -99,110 +337,1185 @@ BuiltinFunctions::FunctionTables BuiltinFunctions::_fn_tables = {
 }
 """)
 
+cpp_traits_template = Template("""
+${license}
+// FINGERPRINT: ${fingerprint}
+
+#pragma once
+
+#include <cstdint>
+
+namespace starrocks {
+
+constexpr uint32_t kBuiltinFunctionNonDeterministic = ${non_deterministic};
+constexpr uint32_t kBuiltinFunctionNotConstantFoldable = ${not_constant_foldable};
+constexpr uint32_t kBuiltinFunctionInjective = ${injective};
+constexpr uint32_t kBuiltinFunctionDictOptimizable = ${dict_optimizable};
+// the function can evaluate only the selected rows, the filtered rows needn't be materialized before it's called
+constexpr uint32_t kBuiltinFunctionSelectionVector = ${selection_vector};
+// the function has a specialization for constant arguments, the constant columns needn't be unpacked
+constexpr uint32_t kBuiltinFunctionConstantSpecialized = ${constant_specialized};
+
+enum class BuiltinFunctionMonotonicity : uint32_t { NONE = 0, INCREASING = 1, DECREASING = 2 };
+
+// CUSTOM: no declared relation between the nulls of the arguments and the result
+// STRICT: the result is null if and only if any argument is null
+// NEVER_NULL: the result is never null
+enum class BuiltinFunctionNullHandling : uint32_t { CUSTOM = 0, STRICT = 1, NEVER_NULL = 2 };
+
+constexpr BuiltinFunctionNullHandling builtin_function_null_handling(uint32_t properties) {
+    return static_cast<BuiltinFunctionNullHandling>((properties >> ${null_handling_shift}) & 0x3);
+}
+
+constexpr BuiltinFunctionMonotonicity builtin_function_monotonicity(uint32_t properties, int arg) {
+    if (arg >= ${monotonic_args}) {
+        return BuiltinFunctionMonotonicity::NONE;
+    }
+    return static_cast<BuiltinFunctionMonotonicity>((properties >> (${monotonic_shift} + 2 * arg)) & 0x3);
+}
+
+// The properties declared in functions.py of the builtin functions which don't take the defaults.
+struct BuiltinFunctionProperties {
+    uint64_t id;
+    uint32_t properties;
+};
+
+inline constexpr BuiltinFunctionProperties kBuiltinFunctionProperties[] = {
+        ${properties}
+};
+
+// A builtin function which is an alias of another one: the same implementation, return type and argument types,
+// only the id and the name differ.
+struct BuiltinFunctionAlias {
+    uint64_t id;
+    uint64_t alias_of;
+};
+
+inline constexpr BuiltinFunctionAlias kBuiltinFunctionAliases[] = {
+        ${aliases}
+};
+
+}
+""")
+
+cpp_shard_template = Template("""
+${license}
+// FINGERPRINT: ${fingerprint}
+// modules: ${modules}
+
+#include <utility>
+#include <vector>
+
+${includes}
+
+namespace starrocks {
+
+std::vector<std::pair<uint64_t, FunctionDescriptor>> builtin_functions_shard_${shard}() {
+    return {
+        ${functions}
+    };
+}
+
+}
+""")
+
+cpp_shard_merge_template = Template("""
+${license}
+// FINGERPRINT: ${fingerprint}
+
+#include <utility>
+#include <vector>
+
+#include "exprs/builtin_functions.h"
+
+namespace starrocks {
+
+${declarations}
+
+BuiltinFunctions::FunctionTables BuiltinFunctions::_fn_tables = [] {
+    FunctionTables tables;
+    for (auto* shard : {${shards}}) {
+        for (auto& entry : shard()) {
+            tables.emplace(entry.first, std::move(entry.second));
+        }
+    }
+    return tables;
+}();
+
+}
+""")
+
+# The dense dispatch table of --cpp_dense: the descriptors are indexed by the ordinal of the function, which is
+# the index of its id in the ascending ids, the same as the slot of VectorizedBuiltinFunctions.getSlot in FE.
+# A caller holding the ordinal indexes the array directly, a caller holding only the id searches the sorted ids.
+cpp_ordinals_template = Template("""
+${license}
+// FINGERPRINT: ${fingerprint}
+
+#pragma once
+
+#include <cstdint>
+
+namespace starrocks {
+
+struct FunctionDescriptor;
+
+// the ids of all builtin functions in ascending order, the index of an id is the ordinal of the function
+inline constexpr uint64_t kBuiltinFunctionIds[] = {
+        ${ids}
+};
+
+inline constexpr int kBuiltinFunctionCount = sizeof(kBuiltinFunctionIds) / sizeof(kBuiltinFunctionIds[0]);
+
+constexpr bool builtin_function_ids_ascending() {
+    for (int i = 1; i < kBuiltinFunctionCount; ++i) {
+        if (kBuiltinFunctionIds[i - 1] >= kBuiltinFunctionIds[i]) {
+            return false;
+        }
+    }
+    return true;
+}
+
+static_assert(builtin_function_ids_ascending(), "the ordinals must be the indexes of the ascending function ids");
+
+// the ordinal of a function id by a binary search of the sorted ids, or -1 if it's not a builtin function
+constexpr int builtin_function_ordinal(uint64_t id) {
+    int lo = 0;
+    int hi = kBuiltinFunctionCount;
+    while (lo < hi) {
+        int mid = lo + (hi - lo) / 2;
+        if (kBuiltinFunctionIds[mid] < id) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return lo < kBuiltinFunctionCount && kBuiltinFunctionIds[lo] == id ? lo : -1;
+}
+
+// O(1), the ordinal indexes the descriptor array
+const FunctionDescriptor* find_builtin_function_by_ordinal(int ordinal);
+
+// O(log n), a binary search of the sorted ids, see builtin_function_ordinal
+const FunctionDescriptor* find_builtin_function_by_sorted_id(uint64_t id);
+
+}
+""")
+
+cpp_dense_template = Template("""
+${license}
+// FINGERPRINT: ${fingerprint}
+
+#include <iterator>
+
+${includes}
+#include "opcode/builtin_function_ordinals.h"
+
+namespace starrocks {
+
+// indexed by the ordinal of the function, see builtin_function_ordinals.h
+static const FunctionDescriptor kBuiltinFunctionDescriptors[] = {
+        ${functions}
+};
+
+static_assert(std::size(kBuiltinFunctionDescriptors) == kBuiltinFunctionCount);
+
+const FunctionDescriptor* find_builtin_function_by_ordinal(int ordinal) {
+    if (ordinal < 0 || ordinal >= kBuiltinFunctionCount) {
+        return nullptr;
+    }
+    return &kBuiltinFunctionDescriptors[ordinal];
+}
+
+const FunctionDescriptor* find_builtin_function_by_sorted_id(uint64_t id) {
+    return find_builtin_function_by_ordinal(builtin_function_ordinal(id));
+}
+
+// BuiltinFunctions::find_builtin_function still looks the functions up in _fn_tables, the descriptors above are
+// initialized first as they are defined before it in this translation unit
+BuiltinFunctions::FunctionTables BuiltinFunctions::_fn_tables = [] {
+    FunctionTables tables;
+    for (int i = 0; i < kBuiltinFunctionCount; ++i) {
+        tables.emplace(kBuiltinFunctionIds[i], kBuiltinFunctionDescriptors[i]);
+    }
+    return tables;
+}();
+
+}
+""")
+
+# {module function group} of the function id, see the id rule in functions.py
+function_modules = {
+    "10": "math",
+    "11": "json",
+    "12": "encryption_geo",
+    "13": "percentile",
+    "14": "grouping_sets",
+    "15": "array",
+    "16": "lambda",
+    "17": "map_struct",
+    "18": "utility",
+    "19": "gin",
+    "20": "bit",
+    "30": "string",
+    "50": "time",
+    "60": "like",
+    "70": "condition",
+    "80": "hyperloglog",
+    "90": "bitmap",
+    "91": "bitmap",
+}
+
+# backend class of a function symbol -> the header declaring it
+function_headers = {
+    "ArrayFunctions": "exprs/array_functions.h",
+    "MapFunctions": "exprs/map_functions.h",
+    "StructFunctions": "exprs/struct_functions.h",
+    "MathFunctions": "exprs/math_functions.h",
+    "BitFunctions": "exprs/bit_functions.h",
+    "BinaryFunctions": "exprs/binary_functions.h",
+    "StringFunctions": "exprs/string_functions.h",
+    "TimeFunctions": "exprs/time_functions.h",
+    "LikePredicate": "exprs/like_predicate.h",
+    "IsNullPredicate": "exprs/is_null_predicate.h",
+    "HyperloglogFunctions": "exprs/hyperloglog_functions.h",
+    "BitmapFunctions": "exprs/bitmap_functions.h",
+    "JsonFunctions": "exprs/json_functions.h",
+    "HashFunctions": "exprs/hash_functions.h",
+    "EncryptionFunctions": "exprs/encryption_functions.h",
+    "GeoFunctions": "exprs/geo_functions.h",
+    "PercentileFunctions": "exprs/percentile_functions.h",
+    "GroupingSetsFunctions": "exprs/grouping_sets_functions.h",
+    "ESFunctions": "exprs/es_functions.h",
+    "UtilityFunctions": "exprs/utility_functions.h",
+    "GinFunctions": "exprs/gin_functions.h",
+}
+
 function_list = list()
-function_set = set()
-function_signature_set = set()
+# the digest of functions.py, set when the function list is loaded
+function_list_digest = None
+# every file generated by this run, written or left unchanged, see --stamp
+output_paths = list()
+
+
+def get_module(fn_id):
+    prefix = str(fn_id)[:2]
+    return function_modules.get(prefix, "module_" + prefix)
+
 
+def get_modules():
+    """ group function_list by module, modules are kept in the order they first appear in functions.py """
+    modules = dict()
+    for fnm in function_list:
+        modules.setdefault(get_module(fnm["id"]), []).append(fnm)
 
-def add_function(fn_data):
+    # FE matches overloads in registration order, grouping must not reorder the overloads of a function
+    module_order = {m: i for i, m in enumerate(modules)}
+    last_module = dict()
+    for fnm in function_list:
+        order = module_order[get_module(fnm["id"])]
+        if last_module.get(fnm["name"], order) > order:
+            print("=================================================================")
+            print("Overloads of %s are interleaved across modules, fix the function id: %d" % (fnm["name"], fnm["id"]))
+            print("=================================================================")
+            exit(1)
+        last_module[fnm["name"]] = order
+    return modules
+
+
+def get_properties(record):
+    """ returns the flags of the properties declared at the end of a function in functions.py """
+    declared = record.declared
+    deterministic = declared.get("deterministic", True)
+    constant_foldable = declared.get("constant_foldable", deterministic)
+    injective = declared.get("injective", False)
+    monotonic = declared.get("monotonic", [])
+    dict_optimizable = declared.get("dict_optimizable", False)
+    null_handling = declared.get("null_handling", "custom")
+    selection_vector = declared.get("selection_vector", False)
+    constant_specialized = declared.get("constant_specialized", False)
+
+    properties = 0
+    if not deterministic:
+        properties |= property_non_deterministic
+    if not constant_foldable:
+        properties |= property_not_constant_foldable
+    if injective:
+        properties |= property_injective
+    if dict_optimizable:
+        properties |= property_dict_optimizable
+    if selection_vector:
+        properties |= property_selection_vector
+    if constant_specialized:
+        properties |= property_constant_specialized
+    properties |= property_null_handling[null_handling] << property_null_handling_shift
+    for i, m in enumerate(monotonic):
+        properties |= property_monotonicity[m] << (property_monotonic_shift + 2 * i)
+    return properties
+
+
+def check_alias_properties():
+    """ aliases are the same function under another name, they must declare the same properties """
+    properties = dict([(fnm["id"], fnm["properties"]) for fnm in function_list])
+    for fn_id, alias_of in get_aliases().items():
+        if properties[fn_id] != properties[alias_of]:
+            print("=================================================================")
+            print("Conflicting properties of alias functions: %d and %d" % (alias_of, fn_id))
+            print("=================================================================")
+            exit(1)
+
+
+def report_dict_optimizable():
+    """
+    Print the VARCHAR to VARCHAR functions which don't declare dict_optimizable, the low cardinality rewrite
+    is silently disabled for them. Declare "dict_optimizable": False to leave a function out of the report.
+    """
+    missing = []
+    for fnm in function_list:
+        if fnm["ret"] != "VARCHAR" or "VARCHAR" not in fnm["args"] or fnm["properties"] & property_non_deterministic:
+            continue
+        if "dict_optimizable" in fnm["declared"]:
+            continue
+        missing.append("%s(%s)" % (fnm["name"], ", ".join(fnm["args"])))
+    if missing:
+        print("gen_functions.py: %d VARCHAR -> VARCHAR functions don't declare dict_optimizable: %s" % (
+            len(missing), ", ".join(missing)))
+
+
+capability_properties = [("dict", property_dict_optimizable), ("selection", property_selection_vector),
+                         ("constant", property_constant_specialized)]
+
+
+def report_capabilities(by_module):
+    """
+    Print how many functions declare the capabilities BE uses to skip materializing the dict decoded column,
+    the filtered rows and the constant arguments, in total and by function module if by_module
+    """
+    def get_coverage(fns):
+        return ["%s %d/%d" % (name, len([fnm for fnm in fns if fnm["properties"] & flag]), len(fns))
+                for name, flag in capability_properties]
+
+    print("gen_functions.py: capabilities of %d functions: %s" % (
+        len(function_list), ", ".join(get_coverage(function_list))))
+    if by_module:
+        for module, fns in get_modules().items():
+            print("    %-24s %s" % (module, ", ".join(get_coverage(fns))))
+
+
+def get_aliases():
+    """
+    returns the id of every alias function -> the id of the function it's an alias of, which is the first function
+    in functions.py with the same implementation, return type and argument types
+    """
+    aliases = dict()
+    implementations = dict()
+    for fnm in function_list:
+        if fnm["fn"] == "nullptr":
+            continue
+        key = (fnm["fn"], fnm.get("prepare"), fnm.get("close"), fnm["exception_safe"], fnm["check_overflow"],
+               fnm["ret"], tuple(fnm["args"]))
+        if key in implementations:
+            aliases[fnm["id"]] = implementations[key]
+        else:
+            implementations[key] = fnm["id"]
+    return aliases
+
+
+# The implicit casts FunctionSet.getFunction considers for the scalar types it's modeled for here, keep them the same
+# as Type.compatibilityMatrix and PrimitiveType.IMPLICIT_CAST_MAP. The types are in the order of PrimitiveType.
+cast_types = ["BOOLEAN", "TINYINT", "SMALLINT", "INT", "BIGINT", "LARGEINT", "FLOAT", "DOUBLE", "DATE", "DATETIME",
+              "VARCHAR"]
+# (smaller type, larger type) -> their assignment compatible type, for the non string types
+cast_compatible_types = dict(
+    [((t1, t2), t2) for i, t1 in enumerate(cast_types[:3]) for t2 in cast_types[i + 1:8]] +
+    [(("INT", "BIGINT"), "BIGINT"), (("INT", "LARGEINT"), "LARGEINT"), (("INT", "FLOAT"), "DOUBLE"),
+     (("INT", "DOUBLE"), "DOUBLE"), (("INT", "DATE"), "INT"),
+     (("BIGINT", "LARGEINT"), "LARGEINT"), (("BIGINT", "FLOAT"), "DOUBLE"), (("BIGINT", "DOUBLE"), "DOUBLE"),
+     (("BIGINT", "DATE"), "BIGINT"), (("BIGINT", "DATETIME"), "BIGINT"),
+     (("LARGEINT", "FLOAT"), "DOUBLE"), (("LARGEINT", "DOUBLE"), "DOUBLE"), (("LARGEINT", "DATE"), "LARGEINT"),
+     (("LARGEINT", "DATETIME"), "LARGEINT"),
+     (("FLOAT", "DOUBLE"), "DOUBLE"), (("DOUBLE", "DATETIME"), "DOUBLE"), (("DATE", "DATETIME"), "DATETIME")])
+# these functions have extra cast rules in FunctionSet.isCastMatchAllowed or Function.isSubtype
+cast_special_functions = {"hex", "lead", "lag", "approx_top_k", "ifnull", "nullif", "if", "coalesce"}
+
+
+def is_strict_castable(from_type, to_type):
+    """ Type.isImplicitlyCastable(from_type, to_type, true) """
+    if from_type == to_type:
+        return True
+    if from_type == "VARCHAR" or to_type == "VARCHAR":
+        return to_type == "VARCHAR"
+    smaller, larger = sorted([from_type, to_type], key=cast_types.index)
+    return cast_compatible_types.get((smaller, larger)) == to_type
+
+
+def is_cast_candidate(args, fn_args, strict):
+    """ Function.isSubtype if strict else Function.isAssignCompatible, of args to fn_args """
+    fixed = [arg for arg in fn_args if arg != "..."]
+    if len(args) < len(fixed) or (len(args) != len(fixed) and len(fixed) == len(fn_args)):
+        return False
+    # every type of cast_types non strictly casts to every other
+    return not strict or all(is_strict_castable(arg, fixed[min(i, len(fixed) - 1)]) for i, arg in enumerate(args))
+
+
+def is_indistinguishable(args, fn_args):
+    """ Function.isIndistinguishable of args to fn_args, it's true for an identical fn_args too """
+    fixed = [arg for arg in fn_args if arg != "..."]
+    if len(args) != len(fixed) and (len(fixed) == len(fn_args) or len(args) < len(fixed)):
+        return False
+    return all(arg == fixed[min(i, len(fixed) - 1)] for i, arg in enumerate(args))
+
+
+def get_cast_table(fns):
+    """
+    Resolves the calls one implicit cast away from an overload the way FunctionSet.getFunction does at runtime,
+    returns name -> [(argument types, index of the function in the functions of name, whether a strict cast
+    resolves it, whether other functions are candidates of the same cast pass)] and name -> the reason it's not
+    resolved here. Only the names without polymorphic overloads, special cast rules or argument types outside
+    cast_types are resolved, and only the calls without an identical or indistinguishable overload.
+    """
+    name_functions = dict()
+    for fnm in fns:
+        name_functions.setdefault(fnm["name"], []).append(fnm)
+
+    table = dict()
+    unresolved = dict()
+    for name, overloads in name_functions.items():
+        arg_types = set([arg for fnm in overloads for arg in fnm["args"] if arg != "..."])
+        if name in cast_special_functions:
+            unresolved[name] = "special cast rules"
+            continue
+        if any(arg.startswith("ANY_") for arg in arg_types):
+            unresolved[name] = "polymorphic"
+            continue
+        if arg_types - set(cast_types):
+            unresolved[name] = "decimal or complex arguments"
+            continue
+
+        calls = []
+        for fnm in overloads:
+            fixed = [arg for arg in fnm["args"] if arg != "..."]
+            for args in [fixed, fixed + fixed[-1:]] if len(fixed) != len(fnm["args"]) else [fixed]:
+                for i in range(len(args)):
+                    for t in cast_types:
+                        call = tuple(args[:i] + [t] + args[i + 1:])
+                        if t != args[i] and call not in calls:
+                            calls.append(call)
+
+        entries = []
+        for call in calls:
+            # FunctionSet.matchStrictFunction resolves it
+            if any(is_indistinguishable(call, fnm["args"]) for fnm in overloads):
+                continue
+            for strict in [True, False]:
+                candidates = [i for i, fnm in enumerate(overloads) if is_cast_candidate(call, fnm["args"], strict)]
+                if candidates:
+                    entries.append((call, candidates[0], strict, len(candidates) > 1))
+                    break
+        table[name] = entries
+    return table, unresolved
+
+
+def report_cast_table(table, unresolved):
+    """
+    Print the overloaded functions FE resolves by scanning the overloads at runtime, and the functions with calls
+    more than one overload accepts in the same cast pass, which the first registered overload wins.
+    """
+    overloads = dict()
+    for fnm in function_list:
+        overloads[fnm["name"]] = overloads.get(fnm["name"], 0) + 1
+    ambiguous = ["%s (%d calls)" % (name, len([e for e in entries if e[3]])) for name, entries in table.items()
+                 if any(entry[3] for entry in entries)]
+    runtime = ["%s (%s)" % (name, reason) for name, reason in unresolved.items() if overloads[name] > 1]
+    print("gen_functions.py: %d calls of %d functions are resolved by the cast table" % (
+        sum([len(entries) for entries in table.values()]), len(table)))
+    print("gen_functions.py: %d functions have calls resolved by the overload order: %s" % (
+        len(ambiguous), ", ".join(ambiguous)))
+    print("gen_functions.py: %d overloaded functions are resolved at runtime: %s" % (len(runtime), ", ".join(runtime)))
+
+
+def add_function(record):
+    """ record is a FunctionRecord of function_registry, it's validated when the function list is loaded """
     entry = dict()
-    if fn_data[0] in function_set:
-        print("=================================================================")
-        print("Duplicated function id: " + str(fn_data))
-        print("=================================================================")
-        exit(1)
-    function_set.add(fn_data[0])
+    entry["id"] = record.id
+    entry["name"] = record.name
+    entry["exception_safe"] = str(record.exception_safe).lower()
+    entry["check_overflow"] = str(record.check_overflow).lower()
+    entry["ret"] = record.ret
+    entry["args"] = record.args
+    entry["args_nums"] = len(record.fixed_args)
+    entry["declared"] = record.declared
+    entry["properties"] = get_properties(record)
+
+    entry["fn"] = "&" + record.fn if record.fn != "nullptr" else "nullptr"
+
+    if record.prepare is not None:
+        entry["prepare"] = "&" + record.prepare if record.prepare != "nullptr" else "nullptr"
+        entry["close"] = "&" + record.close if record.close != "nullptr" else "nullptr"
+
+    function_list.append(entry)
+
+
+def get_fingerprint(options=()):
+    """ fingerprint of the generated outputs, taken over the function list, this generator and its options """
+    md5 = hashlib.md5()
+    md5.update(function_list_digest.encode())
+    md5.update(repr(list(options)).encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        md5.update(f.read())
+    return md5.hexdigest()
+
+
+def skip_write_if_fingerprint_unchanged(path, content, fingerprint):
+    output_paths.append(os.path.abspath(path))
+    if os.path.exists(path):
+        with open(path) as f:
+            m = re.search(r"FINGERPRINT: (?P<fingerprint>\w+)", f.read())
+            old_fingerprint = m.group("fingerprint") if m else None
+        print("gen_functions.py {}: old fingerprint = {}, new fingerprint = {}".format(
+            path, old_fingerprint, fingerprint))
+        if old_fingerprint == fingerprint:
+            return
+
+    write_atomically(path, content)
+
+
+def write_atomically(path, content):
+    # write to a temp file in the same directory then rename it, so a concurrent build never sees a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp_", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, mode="wb" if isinstance(content, bytes) else "w") as f:
+            f.write(content)
+        # mkstemp creates the file as 0600, keep the permission a plain open() would give
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_java_class_name(module):
+    return "Vectorized%sBuiltinFunctions" % "".join([w.capitalize() for w in module.split("_")])
+
+
+def gen_fe_fn(fnm):
+    fn_template = Template('functionSet.addVectorizedScalarBuiltin('
+                           '${id}, "${name}", ${has_vargs}, ${properties}Type.${ret}${args_types});')
+
+    fnm["args_types"] = ", " if len(fnm["args"]) > 0 else ""
+    fnm["args_types"] = fnm["args_types"] + ", ".join(["Type." + i for i in fnm["args"] if i != "..."])
+    fnm["has_vargs"] = "true" if "..." in fnm["args"] else "false"
+
+    return fn_template.substitute(fnm, properties="0x%x, " % fnm["properties"] if fnm["properties"] else "")
+
+
+def generate_fe_module(path, class_name, fns, fingerprint):
+    methods = []
+    bodies = []
+    for i in range(0, len(fns), java_method_functions):
+        method = "initBuiltins%d" % len(methods)
+        methods.append(method + "(functionSet);")
+        bodies.append(java_method_template.substitute(
+            method=method,
+            functions="\n        ".join([gen_fe_fn(fnm) for fnm in fns[i:i + java_method_functions]])))
+
+    value = dict()
+    value["license"] = license_string
+    value["fingerprint"] = fingerprint
+    value["class_name"] = class_name
+    value["methods"] = "\n        ".join(methods)
+    value["bodies"] = "".join(bodies)
+
+    skip_write_if_fingerprint_unchanged(path, java_module_template.substitute(value), fingerprint)
+
+
+def generate_fe(path, fingerprint):
+    """
+    `path` is the VectorizedBuiltinFunctions dispatcher, it registers the modules in functions.py order,
+    FE matches the overloads of a function in their registration order.
+    """
+    fe_dir = os.path.dirname(path)
+    module_paths = []
+    modules = []
+    for module, fns in get_modules().items():
+        class_name = get_java_class_name(module)
+        module_path = os.path.join(fe_dir, class_name + ".java")
+        generate_fe_module(module_path, class_name, fns, fingerprint)
+        module_paths.append(module_path)
+        modules.append(class_name + ".initBuiltins(functionSet);")
+
+    value = dict()
+    value["license"] = license_string
+    value["fingerprint"] = fingerprint
+    value["modules"] = "\n        ".join(modules)
+    ids = sorted([fnm["id"] for fnm in function_list])
+    value["function_ids"] = "\n        ".join([" ".join(["%dL," % fn_id for fn_id in ids[i:i + 8]])
+                                              for i in range(0, len(ids), 8)])
+
+    content = java_template.substitute(value)
+
+    skip_write_if_fingerprint_unchanged(path, content, fingerprint)
+
+    for stale in glob.glob(os.path.join(fe_dir, "Vectorized*BuiltinFunctions.java")):
+        if stale != path and stale not in module_paths:
+            os.remove(stale)
+
+
+def encode_fe_catalog(fns, cast_table, fingerprint):
+    strings = []
+    string_index = dict()
+
+    def intern(string):
+        if string not in string_index:
+            string_index[string] = len(strings)
+            strings.append(string)
+        return string_index[string]
+
+    aliases = get_aliases()
+    fn_index = dict([(fnm["id"], index) for index, fnm in enumerate(fns)])
+    first_arguments = dict()
 
-    entry["id"] = fn_data[0]
-    entry["name"] = fn_data[1]
-    entry["exception_safe"] = str(fn_data[2]).lower()
-    entry["check_overflow"] = str(fn_data[3]).lower()
-    entry["ret"] = fn_data[4]
-    entry["args"] = fn_data[5]
+    records = []
+    arguments = []
+    name_functions = dict()
+    for index, fnm in enumerate(fns):
+        args = [intern(arg) for arg in fnm["args"] if arg != "..."]
+        flags = catalog_flag_varargs if "..." in fnm["args"] else 0
+        alias_of = fn_index[aliases[fnm["id"]]] if fnm["id"] in aliases else None
+        if alias_of is not None and alias_of in first_arguments:
+            first_argument = first_arguments[alias_of]
+        else:
+            first_argument = len(arguments)
+            arguments.extend(args)
+        first_arguments[index if alias_of is None else alias_of] = first_argument
+        records.append(catalog_function.pack(fnm["id"], intern(fnm["name"]), flags, intern(fnm["ret"]),
+                                             first_argument, len(args), 0 if alias_of is None else alias_of + 1,
+                                             fnm["properties"]))
+        name_functions.setdefault(fnm["name"], []).append(index)
+    assert len(strings) < 1 << 16, "too many strings for the u16 types of the function catalog"
+    assert len(records) < 1 << 16, "too many functions for the u16 name functions of the function catalog"
+
+    names = []
+    name_records = []
+    casts = []
+    cast_arguments = []
+    for name, indexes in name_functions.items():
+        entries = cast_table.get(name, [])
+        names.append(catalog_name.pack(string_index[name], len(name_records), len(indexes), len(entries),
+                                       len(casts)))
+        name_records.extend(indexes)
+        for call, index, strict, _ in entries:
+            casts.append(catalog_cast.pack(index, catalog_cast_flag_strict if strict else 0, len(call),
+                                           len(cast_arguments)))
+            cast_arguments.extend([intern(arg) for arg in call])
+    assert len(strings) < 1 << 16, "too many strings for the u16 types of the function catalog"
+
+    data = [catalog_header.pack(catalog_magic, catalog_version, 0, fingerprint.encode(),
+                                len(strings), len(records), len(arguments), len(names), len(casts),
+                                len(cast_arguments))]
+    for string in strings:
+        encoded = string.encode("utf-8")
+        data.append(catalog_string_length.pack(len(encoded)))
+        data.append(encoded)
+    data.extend(records)
+    data.extend([catalog_argument.pack(arg) for arg in arguments])
+    data.extend(names)
+    data.extend([catalog_name_function.pack(index) for index in name_records])
+    data.extend(casts)
+    data.extend([catalog_cast_argument.pack(arg) for arg in cast_arguments])
+    return b"".join(data)
+
+
+def decode_fe_catalog(data):
+    """
+    returns the fingerprint, the (id, name, has_vargs, ret, args, alias of, properties) of every function in the catalog,
+    the functions of every name in the loader table and the (argument types, function index, strict) casts of every name
+    """
+    magic, version, _, fingerprint, string_count, function_count, argument_count, name_count, cast_count, \
+        cast_argument_count = catalog_header.unpack_from(data, 0)
+    assert magic == catalog_magic and version == catalog_version, "unknown function catalog format"
+    offset = catalog_header.size
+
+    strings = []
+    for _ in range(string_count):
+        length, = catalog_string_length.unpack_from(data, offset)
+        offset += catalog_string_length.size
+        strings.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    records = []
+    for _ in range(function_count):
+        records.append(catalog_function.unpack_from(data, offset))
+        offset += catalog_function.size
+
+    arguments = [catalog_argument.unpack_from(data, offset + i * catalog_argument.size)[0]
+                 for i in range(argument_count)]
+    offset += argument_count * catalog_argument.size
+
+    names = []
+    for _ in range(name_count):
+        names.append(catalog_name.unpack_from(data, offset))
+        offset += catalog_name.size
 
-    function_signature = "%s#%s#(%s)" % (entry["ret"], entry["name"], ", ".join(entry["args"]))
+    name_records = [catalog_name_function.unpack_from(data, offset + i * catalog_name_function.size)[0]
+                    for i in range(function_count)]
+    offset += function_count * catalog_name_function.size
 
-    if function_signature in function_signature_set:
+    casts = []
+    for _ in range(cast_count):
+        casts.append(catalog_cast.unpack_from(data, offset))
+        offset += catalog_cast.size
+
+    cast_arguments = [catalog_cast_argument.unpack_from(data, offset + i * catalog_cast_argument.size)[0]
+                      for i in range(cast_argument_count)]
+    offset += cast_argument_count * catalog_cast_argument.size
+    assert offset == len(data), "trailing bytes in function catalog"
+
+    fns = []
+    for fn_id, name, flags, ret, first_arg, arg_count, alias, properties in records:
+        args = [strings[arg] for arg in arguments[first_arg:first_arg + arg_count]]
+        alias_of = records[alias - 1][0] if alias > 0 else None
+        fns.append((fn_id, strings[name], bool(flags & catalog_flag_varargs), strings[ret], args, alias_of,
+                    properties))
+
+    name_fns = dict()
+    name_casts = dict()
+    for name, first, count, casts_count, first_cast in names:
+        name_fns[strings[name]] = [fns[index] for index in name_records[first:first + count]]
+        name_casts[strings[name]] = [
+            (tuple([strings[arg] for arg in cast_arguments[first_arg:first_arg + arg_count]]), index,
+             bool(flags & catalog_cast_flag_strict))
+            for index, flags, arg_count, first_arg in casts[first_cast:first_cast + casts_count]]
+    return fingerprint.decode(), fns, name_fns, name_casts
+
+
+def generate_fe_catalog(path, fingerprint, report=False):
+    """
+    The binary catalog holds the same functions VectorizedBuiltinFunctions registers, in the same order,
+    the loader table FE uses to register them lazily by name and the implicit casts resolved ahead of time.
+    It is decoded again and compared with the java registrations before it is written. The cast table is
+    reported if report.
+    """
+    fns = [fnm for module_fns in get_modules().values() for fnm in module_fns]
+    # the indexes of the cast table are in the registration order of the catalog
+    cast_table, unresolved = get_cast_table(fns)
+    if report:
+        report_cast_table(cast_table, unresolved)
+    data = encode_fe_catalog(fns, cast_table, fingerprint)
+    output_paths.append(os.path.abspath(path))
+
+    aliases = get_aliases()
+    expected = [(fnm["id"], fnm["name"], "..." in fnm["args"], fnm["ret"], [arg for arg in fnm["args"] if arg != "..."],
+                 aliases.get(fnm["id"]), fnm["properties"]) for fnm in fns]
+    expected_names = dict()
+    for fn in expected:
+        expected_names.setdefault(fn[1], []).append(fn)
+    expected_casts = dict([(name, [(call, index, strict) for call, index, strict, _ in cast_table.get(name, [])])
+                           for name in expected_names])
+    decoded_fingerprint, decoded, decoded_names, decoded_casts = decode_fe_catalog(data)
+    if decoded_fingerprint != fingerprint or decoded != expected or decoded_names != expected_names or \
+            decoded_casts != expected_casts:
         print("=================================================================")
-        print("Duplicated function signature: " + function_signature)
+        print("Function catalog does not round trip to the java registrations")
         print("=================================================================")
         exit(1)
-    function_signature_set.add(function_signature)
 
-    if "..." in fn_data[5]:
-        assert 2 <= len(fn_data[5]), "Invalid arguments in functions.py:\n\t" + repr(fn_data)
-        assert "..." == fn_data[5][-1], "variadic parameter must at the end:\n\t" + repr(fn_data)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            header = f.read(catalog_header.size)
+        old_fingerprint = catalog_header.unpack(header)[3].decode() \
+            if len(header) == catalog_header.size and header.startswith(catalog_magic) else None
+        print("gen_functions.py {}: old fingerprint = {}, new fingerprint = {}".format(
+            path, old_fingerprint, fingerprint))
+        if old_fingerprint == fingerprint:
+            return
+    write_atomically(path, data)
 
-        entry["args_nums"] = len(fn_data[5]) - 1
-    else:
-        entry["args_nums"] = len(fn_data[5])
 
-    entry["fn"] = "&" + fn_data[6] if fn_data[6] != "nullptr" else "nullptr"
+# the version of the format of the exported catalog, bump it on an incompatible change
+catalog_export_version = 1
+null_handling_names = dict([(v, k) for k, v in property_null_handling.items()])
 
-    if len(fn_data) >= 9:
-        entry["prepare"] = "&" + fn_data[7] if fn_data[7] != "nullptr" else "nullptr"
-        entry["close"] = "&" + fn_data[8] if fn_data[8] != "nullptr" else "nullptr"
 
-    function_list.append(entry)
+def get_catalog_export(fingerprint):
+    """
+    The exported catalog lets clients validate and complete function calls without asking FE. "functions" are
+    the overloads in the order FE registers them, the first one a call matches wins, and "names" indexes them by
+    name. A function only has "variadic" if its last argument repeats, and "alias_of" if it's an alias.
+    """
+    aliases = get_aliases()
+    functions = []
+    names = dict()
+    for fnm in [fnm for module_fns in get_modules().values() for fnm in module_fns]:
+        function = {"id": fnm["id"], "name": fnm["name"], "ret": fnm["ret"],
+                    "args": [arg for arg in fnm["args"] if arg != "..."],
+                    "null_handling": null_handling_names[(fnm["properties"] >> property_null_handling_shift) & 0x3]}
+        if "..." in fnm["args"]:
+            function["variadic"] = True
+        if fnm["id"] in aliases:
+            function["alias_of"] = aliases[fnm["id"]]
+        names.setdefault(fnm["name"], []).append(len(functions))
+        functions.append(function)
+    return {"version": catalog_export_version, "fingerprint": fingerprint, "functions": functions, "names": names}
+
 
+def generate_catalog_export(path, fingerprint):
+    """ the catalog has the fingerprint of the java registrations, so a client can tell if it's out of date """
+    output_paths.append(os.path.abspath(path))
+    if os.path.exists(path):
+        try:
+            with open(path) as f:
+                old = json.load(f)
+            old_fingerprint = old.get("fingerprint") if old.get("version") == catalog_export_version else None
+        except ValueError:
+            old_fingerprint = None
+        print("gen_functions.py {}: old fingerprint = {}, new fingerprint = {}".format(
+            path, old_fingerprint, fingerprint))
+        if old_fingerprint == fingerprint:
+            return
+    content = json.dumps(get_catalog_export(fingerprint), sort_keys=True, separators=(",", ":"))
+    write_atomically(path, content + "\n")
 
-def generate_fe(path):
-    fn_template = Template(
-        'functionSet.addVectorizedScalarBuiltin(${id}, "${name}", ${has_vargs}, Type.${ret}${args_types});')
 
-    def gen_fe_fn(fnm):
-        fnm["args_types"] = ", " if len(fnm["args"]) > 0 else ""
-        fnm["args_types"] = fnm["args_types"] + ", ".join(["Type." + i for i in fnm["args"] if i != "..."])
-        fnm["has_vargs"] = "true" if "..." in fnm["args"] else "false"
+def get_benchmark_lookups():
+    """
+    The lookups of the resolution benchmark by "name/kind" in registration order, each a list of
+    (has_vargs, java type expressions). A varargs overload is looked up with its last argument repeated.
+    """
+    def java_types(args):
+        return [java_benchmark_polymorphic_types.get(arg, "Type." + arg) for arg in args]
 
-        return fn_template.substitute(fnm)
+    lookups = dict()
+    exact = set()
+    for fnm in function_list:
+        args = [arg for arg in fnm["args"] if arg != "..."]
+        has_vargs = len(args) != len(fnm["args"])
+        if has_vargs:
+            args.append(args[-1])
+        exact.add((fnm["name"], has_vargs, tuple(args)))
+
+    for fnm in function_list:
+        args = [arg for arg in fnm["args"] if arg != "..."]
+        has_vargs = len(args) != len(fnm["args"])
+        if has_vargs:
+            args.append(args[-1])
+        kinds = [("exact", args)]
+        cast_args = [java_benchmark_cast_types.get(arg, arg) for arg in args]
+        if (fnm["name"], has_vargs, tuple(cast_args)) not in exact:
+            kinds.append(("cast", cast_args))
+        if any(arg in java_benchmark_polymorphic_types for arg in args):
+            kinds.append(("polymorphic", args))
+        for kind, kind_args in kinds:
+            lookup = lookups.setdefault("%s/%s" % (fnm["name"], kind), [])
+            desc = (has_vargs, java_types(kind_args) if kind == "polymorphic" else ["Type." + a for a in kind_args])
+            if desc not in lookup:
+                lookup.append(desc)
+    return lookups
+
+
+def generate_fe_benchmark(path, fingerprint):
+    """ `path` is the JMH benchmark of FunctionSet.getFunction over the lookups of get_benchmark_lookups """
+    lookups = [(lookup, has_vargs, args) for lookup, descs in get_benchmark_lookups().items()
+               for has_vargs, args in descs]
+    methods = []
+    bodies = []
+    for i in range(0, len(lookups), java_method_functions):
+        method = "addLookups%d" % len(methods)
+        methods.append(method + "(lookups);")
+        bodies.append(java_benchmark_method_template.substitute(
+            method=method,
+            lookups="\n        ".join(['add(lookups, "%s", %s%s);' % (
+                lookup, str(has_vargs).lower(), "".join([", " + arg for arg in args]))
+                for lookup, has_vargs, args in lookups[i:i + java_method_functions]])))
 
     value = dict()
     value["license"] = license_string
-    value["functions"] = "\n        ".join([gen_fe_fn(i) for i in function_list])
+    value["fingerprint"] = fingerprint
+    value["lookup_names"] = ",\n            ".join(['"%s"' % lookup for lookup in get_benchmark_lookups()])
+    value["methods"] = "\n        ".join(methods)
+    value["bodies"] = "".join(bodies)
+
+    skip_write_if_fingerprint_unchanged(path, java_benchmark_template.substitute(value), fingerprint)
+
+
+def gen_be_descriptor(fnm):
+    if "prepare" in fnm:
+        return '{"%s", %d, %s, %s, %s, %s, %s}' % (
+            fnm["name"], fnm["args_nums"], fnm["fn"], fnm["prepare"], fnm["close"],
+            fnm["exception_safe"], fnm["check_overflow"])
+    return '{"%s", %d, %s, %s, %s}' % (
+        fnm["name"], fnm["args_nums"], fnm["fn"], fnm["exception_safe"], fnm["check_overflow"])
+
+
+def gen_be_fn(fnm):
+    return "{%d, %s}" % (fnm["id"], gen_be_descriptor(fnm))
 
-    content = java_template.substitute(value)
 
-    with open(path, mode="w+") as f:
-        f.write(content)
+def get_headers(fns):
+    classes = set()
+    for fnm in fns:
+        for key in ["fn", "prepare", "close"]:
+            if fnm.get(key, "nullptr") != "nullptr":
+                classes.add(fnm[key][1:].split("::")[0])
 
+    headers = {"exprs/builtin_functions.h"}
+    for cls in classes:
+        if cls not in function_headers:
+            print("=================================================================")
+            print("Unknown header of backend class %s, add it to function_headers" % cls)
+            print("=================================================================")
+            exit(1)
+        headers.add(function_headers[cls])
+    return sorted(headers)
 
-def generate_cpp(path):
-    def gen_be_fn(fnm):
-        res = ""
+
+def check_be_symbols(be_src):
+    """
+    Check the backend symbols of functions.py against the static members declared in the exprs headers of be_src,
+    so a typo fails the generation instead of the compilation of builtin_functions.cpp. It's skipped if be_src
+    doesn't exist, like in a checkout without BE.
+    """
+    if not os.path.isdir(be_src):
+        print("gen_functions.py: %s is not found, skip checking the backend symbols" % be_src)
+        return
+    start = time.time()
+    index = exprs_symbols.SymbolIndex(be_src)
+    errors = []
+    checked = 0
+    for fnm in function_list:
+        symbols = [("function", fnm["fn"], exprs_symbols.function_params)]
         if "prepare" in fnm:
-            res = '{%d, {"%s", %d, %s, %s, %s, %s, %s' % (
-                fnm["id"], fnm["name"], fnm["args_nums"], fnm["fn"], fnm["prepare"], fnm["close"],
-                fnm["exception_safe"], fnm["check_overflow"])
-        else:
-            res = '{%d, {"%s", %d, %s, %s, %s' % (
-                fnm["id"], fnm["name"], fnm["args_nums"], fnm["fn"], fnm["exception_safe"],
-                fnm["check_overflow"])
+            if (fnm["prepare"] == "nullptr") != (fnm["close"] == "nullptr"):
+                errors.append("%d %s: prepare and close must be declared together" % (fnm["id"], fnm["name"]))
+            symbols.append(("prepare", fnm["prepare"], exprs_symbols.prepare_close_params))
+            symbols.append(("close", fnm["close"], exprs_symbols.prepare_close_params))
+        for role, symbol, params in symbols:
+            if symbol == "nullptr":
+                continue
+            checked += 1
+            cls, member = exprs_symbols.split_symbol(symbol[1:])
+            where = "%d %s: %s %s" % (fnm["id"], fnm["name"], role, symbol[1:])
+            classes = index.get_classes(function_headers[cls]) if cls in function_headers else None
+            if cls not in function_headers:
+                errors.append("%s: unknown class %s, add it to function_headers" % (where, cls))
+            elif classes is None:
+                errors.append("%s: header %s is not found" % (where, function_headers[cls]))
+            elif cls not in classes:
+                errors.append("%s: class %s is not declared in %s" % (where, cls, function_headers[cls]))
+            elif member not in classes[cls]:
+                errors.append("%s: %s is not a static member of %s" % (where, member, cls))
+            elif params not in classes[cls][member]:
+                errors.append("%s: it takes %s parameters, a %s takes %d" % (
+                    where, " or ".join([str(n) for n in sorted(classes[cls][member])]), role, params))
+    index.save()
+    print("gen_functions.py: checked %d backend symbols in %.3fs" % (checked, time.time() - start))
+    if errors:
+        print("=================================================================")
+        print("Unknown backend symbols in functions.py:")
+        for error in errors:
+            print("\t" + error)
+        print("=================================================================")
+        exit(1)
 
-        return res + "}}"
 
+def split_shards(modules, shards):
+    """ assign modules to at most `shards` shards, largest module first onto the least loaded shard """
+    if shards >= len(modules):
+        return [[m] for m in modules]
+
+    loads = [[0, i, []] for i in range(shards)]
+    for module in sorted(modules, key=lambda m: -len(modules[m])):
+        shard = min(loads)
+        shard[0] += len(modules[module])
+        shard[2].append(module)
+    # keep the modules of a shard in functions.py order
+    order = list(modules)
+    return [sorted(shard[2], key=order.index) for shard in sorted(loads, key=lambda x: x[1]) if shard[2]]
+
+
+def generate_cpp(path, fingerprint):
     value = dict()
     value["license"] = license_string
+    value["fingerprint"] = fingerprint
     value["functions"] = ", \n        ".join([gen_be_fn(i) for i in function_list])
 
     content = cpp_template.substitute(value)
 
-    with open(path, mode="w+") as f:
-        f.write(content)
+    skip_write_if_fingerprint_unchanged(path, content, fingerprint)
+
+
+def generate_cpp_dense(path, fingerprint):
+    """
+    `path` holds the descriptors in an array indexed by the ordinal of the function, a caller holding the ordinal
+    finds a function without hashing, one holding the id by a binary search in the constexpr ids of
+    builtin_function_ordinals.h. _fn_tables is still built from the array for BuiltinFunctions::find_builtin_function.
+    """
+    fns = sorted(function_list, key=lambda fnm: fnm["id"])
+    value = dict()
+    value["license"] = license_string
+    value["fingerprint"] = fingerprint
+    value["ids"] = get_cpp_ids(fns)
+    ordinals_path = os.path.join(os.path.dirname(path), "builtin_function_ordinals.h")
+    skip_write_if_fingerprint_unchanged(ordinals_path, cpp_ordinals_template.substitute(value), fingerprint)
+
+    value["includes"] = "\n".join(['#include "%s"' % h for h in get_headers(fns)])
+    value["functions"] = ", \n        ".join([gen_be_descriptor(fnm) for fnm in fns])
+    skip_write_if_fingerprint_unchanged(path, cpp_dense_template.substitute(value), fingerprint)
+
+
+def get_cpp_ids(fns):
+    ids = [fnm["id"] for fnm in fns]
+    return "\n        ".join([" ".join(["%d," % fn_id for fn_id in ids[i:i + 8]]) for i in range(0, len(ids), 8)])
+
+
+def read_ids(path, begin):
+    """ the ids of the array starting at the line of `begin` in a generated file """
+    with open(path, "r") as f:
+        content = f.read()
+    body = content[content.index(begin) + len(begin):]
+    body = body[:body.index("}")]
+    return [int(token.rstrip("L")) for token in body.replace(",", " ").split()]
+
+
+def check_dense_ordinals(java_path, ordinals_path):
+    """
+    The ordinal of a function in BE must be the slot of its id in FE, compare the generated files as they're on disk,
+    a file skipped by an unchanged fingerprint is compared too.
+    """
+    fe_ids = read_ids(java_path, "FUNCTION_IDS = {")
+    be_ids = read_ids(ordinals_path, "kBuiltinFunctionIds[] = {")
+    if fe_ids != be_ids or fe_ids != sorted(set(fe_ids)):
+        print("=================================================================")
+        print("The function ids of %s and the ordinals of %s don't agree" % (java_path, ordinals_path))
+        print("=================================================================")
+        exit(1)
+
+
+def generate_cpp_traits(path, fingerprint):
+    value = dict()
+    value["license"] = license_string
+    value["fingerprint"] = fingerprint
+    value["non_deterministic"] = "0x%x" % property_non_deterministic
+    value["not_constant_foldable"] = "0x%x" % property_not_constant_foldable
+    value["injective"] = "0x%x" % property_injective
+    value["dict_optimizable"] = "0x%x" % property_dict_optimizable
+    value["selection_vector"] = "0x%x" % property_selection_vector
+    value["constant_specialized"] = "0x%x" % property_constant_specialized
+    value["null_handling_shift"] = property_null_handling_shift
+    value["monotonic_shift"] = property_monotonic_shift
+    value["monotonic_args"] = property_monotonic_args
+    value["properties"] = ", \n        ".join(["{%d, 0x%x}" % (fnm["id"], fnm["properties"])
+                                              for fnm in function_list if fnm["properties"]])
+    value["aliases"] = ", \n        ".join(["{%d, %d}" % (fn_id, alias_of)
+                                           for fn_id, alias_of in get_aliases().items()])
+    skip_write_if_fingerprint_unchanged(path, cpp_traits_template.substitute(value), fingerprint)
+
+
+def generate_cpp_shards(path, shards, fingerprint):
+    """
+    split _fn_tables into one translation unit per shard, each one only includes the headers its functions
+    need, so the shards compile in parallel. `path` is the merge unit which builds _fn_tables from the shards.
+    The BE build must compile the builtin_functions_shard_*.cpp units too, so sharding is off by default.
+    """
+    modules = get_modules()
+    shard_modules = split_shards(modules, shards)
+
+    shard_paths = []
+    for i, shard in enumerate(shard_modules):
+        fns = [fnm for m in shard for fnm in modules[m]]
+        value = dict()
+        value["license"] = license_string
+        value["fingerprint"] = fingerprint
+        value["modules"] = ", ".join(shard)
+        value["shard"] = i
+        value["includes"] = "\n".join(['#include "%s"' % h for h in get_headers(fns)])
+        value["functions"] = ", \n        ".join([gen_be_fn(fnm) for fnm in fns])
+
+        shard_path = os.path.join(os.path.dirname(path), "builtin_functions_shard_%d.cpp" % i)
+        skip_write_if_fingerprint_unchanged(shard_path, cpp_shard_template.substitute(value), fingerprint)
+        shard_paths.append(shard_path)
+        print("gen_functions.py shard %d: %d functions, modules: %s" % (i, len(fns), value["modules"]))
+
+    value = dict()
+    value["license"] = license_string
+    value["fingerprint"] = fingerprint
+    value["declarations"] = "\n".join([
+        "std::vector<std::pair<uint64_t, FunctionDescriptor>> builtin_functions_shard_%d();" % i
+        for i in range(len(shard_modules))])
+    value["shards"] = ", ".join(["&builtin_functions_shard_%d" % i for i in range(len(shard_modules))])
+    skip_write_if_fingerprint_unchanged(path, cpp_shard_merge_template.substitute(value), fingerprint)
+    remove_stale_shards(path, shard_paths)
+
+
+def write_stamp(path):
+    """
+    The stamp lists the generated files, it's rewritten after every run even if they are unchanged, so the Makefile
+    can tell when to run again and which outputs to check and clean. The stamps of other options are removed.
+    """
+    stamp_dir = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(stamp_dir):
+        os.makedirs(stamp_dir)
+    for stale in glob.glob(os.path.join(stamp_dir, "gen_functions*.stamp")):
+        if stale != os.path.abspath(path):
+            os.remove(stale)
+    write_atomically(path, "".join([p + "\n" for p in output_paths]))
+
+
+def remove_stale_shards(path, shard_paths):
+    for stale in glob.glob(os.path.join(os.path.dirname(path), "builtin_functions_shard_*.cpp")):
+        if stale not in shard_paths:
+            os.remove(stale)
 
 
 if __name__ == '__main__':
     FE_PATH = "../../fe/fe-core/target/generated-sources/build"
+    FE_RESOURCES_PATH = "../../fe/fe-core/target/generated-resources/build"
     BE_PATH = "../build/gen_cpp"
+    BE_SRC_PATH = "../../be/src"
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--cpp", dest='cpp_path', default=BE_PATH, help="Path of generated cpp file", type=str)
     parser.add_argument("--java", dest='java_path', default=FE_PATH, help="Path of generated java file", type=str)
+    parser.add_argument("--java_resources", dest='java_resources_path', default=FE_RESOURCES_PATH, type=str,
+                        help="Path of generated java resources, the binary function catalog is written there")
+    parser.add_argument("--java_benchmark", dest='java_benchmark_path', default=None, type=str,
+                        help="Path of the generated java benchmark of the function resolution, "
+                             "it's not generated if not set")
+    parser.add_argument("--catalog_export", dest='catalog_export_path', default=None, type=str,
+                        help="Path of the exported JSON function catalog for clients, it's not generated if not set")
+    parser.add_argument("--stamp", dest='stamp_path', default=None, type=str,
+                        help="Path of the stamp listing the generated files, written after a successful run")
+    parser.add_argument("--be_src", dest='be_src_path', default=BE_SRC_PATH, type=str,
+                        help="Path of be/src, the backend symbols are checked against its exprs headers if it exists")
+    parser.add_argument("--report", dest='report', action="store_true",
+                        help="Print the functions which don't declare dict_optimizable, the coverage of the "
+                             "backend function capabilities and the overloads the cast table doesn't resolve")
+    parser.add_argument("--capability_report", dest='capability_report', action="store_true",
+                        help="Print the coverage of the backend function capabilities by function module, "
+                             "implies --report")
+    parser.add_argument("--cpp_shards", dest='cpp_shards', default=0, type=int,
+                        help="Split builtin_functions.cpp into at most this many translation units by function "
+                             "module, 0 generates a single file. Only for a BE build which compiles the "
+                             "builtin_functions_shard_*.cpp units, the others don't link")
+    parser.add_argument("--cpp_dense", dest='cpp_dense', action="store_true",
+                        help="Generate builtin_functions.cpp as an array indexed by the ordinal of the function "
+                             "and builtin_function_ordinals.h, _fn_tables is built from the array")
     args = parser.parse_args()
+    if args.cpp_dense and args.cpp_shards > 0:
+        parser.error("--cpp_dense and --cpp_shards can't be used together")
 
     # Read the function metadata inputs
-    for function in functions.vectorized_functions:
-        add_function(function)
+    registry = function_registry.load_or_exit()
+    function_list_digest = registry.digest
+    for record in registry.functions:
+        add_function(record)
+    check_alias_properties()
+    if args.report or args.capability_report:
+        report_dict_optimizable()
+        report_capabilities(args.capability_report)
+    check_be_symbols(args.be_src_path)
 
     be_functions_dir = args.cpp_path + "/opcode"
     if not os.path.exists(be_functions_dir):
@@ -212,5 +1525,42 @@ if __name__ == '__main__':
     if not os.path.exists(fe_functions_dir):
         os.makedirs(fe_functions_dir)
 
-    generate_fe(fe_functions_dir + "/VectorizedBuiltinFunctions.java")
-    generate_cpp(be_functions_dir + "/builtin_functions.cpp")
+    fe_resources_dir = args.java_resources_path + "/com/starrocks/builtins"
+    if not os.path.exists(fe_resources_dir):
+        os.makedirs(fe_resources_dir)
+
+    fingerprint = get_fingerprint()
+    generate_fe(fe_functions_dir + "/VectorizedBuiltinFunctions.java", fingerprint)
+    generate_fe_catalog(fe_resources_dir + "/vectorized_builtin_functions.bin", fingerprint, args.report)
+
+    if args.java_benchmark_path:
+        fe_benchmark_dir = args.java_benchmark_path + "/com/starrocks/benchmark"
+        if not os.path.exists(fe_benchmark_dir):
+            os.makedirs(fe_benchmark_dir)
+        generate_fe_benchmark(fe_benchmark_dir + "/BuiltinFunctionResolutionBench.java", fingerprint)
+
+    if args.catalog_export_path:
+        catalog_export_dir = os.path.dirname(os.path.abspath(args.catalog_export_path))
+        if not os.path.exists(catalog_export_dir):
+            os.makedirs(catalog_export_dir)
+        generate_catalog_export(args.catalog_export_path, fingerprint)
+
+    generate_cpp_traits(be_functions_dir + "/builtin_function_traits.h", fingerprint)
+
+    cpp_options = ["cpp_shards=%d" % args.cpp_shards] + (["cpp_dense"] if args.cpp_dense else [])
+    cpp_fingerprint = get_fingerprint(cpp_options)
+    ordinals_path = be_functions_dir + "/builtin_function_ordinals.h"
+    if not args.cpp_dense and os.path.exists(ordinals_path):
+        os.remove(ordinals_path)
+    if args.cpp_shards > 0:
+        generate_cpp_shards(be_functions_dir + "/builtin_functions.cpp", args.cpp_shards, cpp_fingerprint)
+    elif args.cpp_dense:
+        generate_cpp_dense(be_functions_dir + "/builtin_functions.cpp", cpp_fingerprint)
+        remove_stale_shards(be_functions_dir + "/builtin_functions.cpp", [])
+        check_dense_ordinals(fe_functions_dir + "/VectorizedBuiltinFunctions.java", ordinals_path)
+    else:
+        generate_cpp(be_functions_dir + "/builtin_functions.cpp", cpp_fingerprint)
+        remove_stale_shards(be_functions_dir + "/builtin_functions.cpp", [])
+
+    if args.stamp_path:
+        write_stamp(args.stamp_path)